@@ -0,0 +1,134 @@
+import os
+import select
+import threading
+import time
+
+class AdaptiveScheduler:
+    """
+    AdaptiveScheduler v1.0 - Energy-Aware Polling.
+    Decides how long the survival loop may sleep: it tightens the interval
+    when temperature climbs fast or motion is high, and backs off
+    exponentially while readings stay stable. Waits use poll() on sysfs
+    attributes (and a wake pipe) where available, so the loop can be woken
+    by the kernel or by other threads instead of only by its timer.
+    clock and sleep are injectable to make the decisions deterministic in tests.
+    """
+    LOW_BATTERY = 20  # Percent; below this the loop never polls faster than low_battery_interval
+
+    def __init__(self, min_interval=0.25, base_interval=1.0, max_interval=30.0,
+                 low_battery_interval=5.0, backoff=2.0, slope_alert=0.2, stable_slope=0.02,
+                 motion_alert=3.0, motion_quiet=0.5, smoothing=0.5,
+                 clock=time.monotonic, sleep=None):
+        self.min_interval = min_interval
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.low_battery_interval = low_battery_interval
+        self.backoff = backoff
+        self.slope_alert = slope_alert      # C/s that counts as "climbing fast"
+        self.stable_slope = stable_slope    # C/s below which temperature is "stable"
+        self.motion_alert = motion_alert
+        self.motion_quiet = motion_quiet
+        self.smoothing = smoothing          # EWMA weight of the newest slope estimate
+        self.clock = clock
+        self.sleep = sleep                  # Injected sleep disables poll()
+        self.interval = base_interval
+        self.slope = 0.0
+        self.last_temp = None
+        self.last_time = None
+        self.state = "normal"               # 'alert', 'normal' or 'idle'
+        self.wakeups = 0
+        self.event_wakeups = 0
+        self._wake_pending = False
+        self._wake_lock = threading.Lock()
+        self._wake_r = self._wake_w = None
+        if sleep is None and hasattr(select, "poll"):
+            self._wake_r, self._wake_w = os.pipe()
+            os.set_blocking(self._wake_r, False)
+            os.set_blocking(self._wake_w, False)
+
+    def update(self, temp, motion=0.0, battery=100):
+        """Feeds the newest readings and returns the next polling interval in seconds."""
+        now = self.clock()
+        if self.last_time is not None and now > self.last_time:
+            raw = (temp - self.last_temp) / (now - self.last_time)
+            self.slope += self.smoothing * (raw - self.slope)
+        self.last_temp, self.last_time = temp, now
+
+        if self.slope >= self.slope_alert or motion >= self.motion_alert:
+            self.state = "alert"
+            self.interval = self.min_interval
+        elif abs(self.slope) <= self.stable_slope and motion <= self.motion_quiet:
+            # Stable: back off exponentially, starting from the base rate
+            self.state = "idle"
+            self.interval = min(max(self.interval, self.base_interval) * self.backoff, self.max_interval)
+        else:
+            self.state = "normal"
+            self.interval = self.base_interval
+
+        if self.state != "alert" and battery <= self.LOW_BATTERY:
+            self.interval = max(self.interval, self.low_battery_interval)
+        return self.interval
+
+    def wake(self):
+        """Ends the current wait early (thread-safe). Used for motion or external events."""
+        with self._wake_lock:
+            if self._wake_pending:
+                return
+            self._wake_pending = True
+        if self._wake_w is not None:
+            try:
+                os.write(self._wake_w, b"\0")
+            except OSError:
+                pass
+
+    def wait(self, interval=None, fds=()):
+        """
+        Sleeps up to interval seconds. Returns True if an event (a sysfs
+        attribute change or wake()) ended the wait early.
+        fds are sysfs attribute descriptors; they must have been read since
+        their last change, which the survival loop does every tick.
+        """
+        if interval is None:
+            interval = self.interval
+        self.wakeups += 1
+        if self.sleep is not None or self._wake_r is None:
+            woke = self._consume_wake()
+            if woke:
+                self.event_wakeups += 1
+            else:
+                (self.sleep or time.sleep)(interval)
+            return woke
+
+        poller = select.poll()
+        poller.register(self._wake_r, select.POLLIN)
+        for fd in fds:
+            if fd is not None:
+                # sysfs_notify() signals POLLPRI|POLLERR on attributes that support it
+                poller.register(fd, select.POLLPRI | select.POLLERR)
+        events = poller.poll(max(interval, 0) * 1000)
+        woke = self._consume_wake()
+        if events and not woke:
+            woke = any(fd != self._wake_r for fd, _ in events)
+        if woke:
+            self.event_wakeups += 1
+        return woke
+
+    def _consume_wake(self):
+        with self._wake_lock:
+            woke, self._wake_pending = self._wake_pending, False
+        if woke and self._wake_r is not None:
+            try:
+                while os.read(self._wake_r, 64):
+                    pass
+            except OSError:
+                pass
+        return woke
+
+    def close(self):
+        for fd in (self._wake_r, self._wake_w):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._wake_r = self._wake_w = None
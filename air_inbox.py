@@ -0,0 +1,195 @@
+import sys
+import time
+import threading
+from collections import OrderedDict, deque
+
+class RingInbox:
+    """
+    RingInbox v1.0 - Bounded, Indexed Message Inbox.
+    Holds at most `capacity` messages. When full it either evicts the
+    oldest message ('drop_oldest', the default: fresh data wins) or refuses
+    the new one ('drop_newest'). Every message is also indexed by sender,
+    so one peer's messages can be read or drained without scanning the
+    rest; any message can be drained by an arbitrary filter.
+    """
+    POLICIES = ("drop_oldest", "drop_newest")
+
+    def __init__(self, capacity=1024, policy="drop_oldest"):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown inbox policy '{policy}' (use one of {self.POLICIES})")
+        self.capacity = capacity
+        self.policy = policy
+        self.messages = OrderedDict()  # { seq: (sender, message) }, oldest first
+        self.by_sender = {}            # { sender: deque[seq] }, oldest first
+        self.seq = 0
+        self.received = 0
+        self.dropped = 0
+        self.lock = threading.Lock()
+
+    def push(self, sender, message):
+        """Stores message. Returns False if it was refused (drop_newest, full inbox)."""
+        with self.lock:
+            self.received += 1
+            if len(self.messages) >= self.capacity:
+                self.dropped += 1
+                if self.policy == "drop_newest":
+                    return False
+                old_sender = self.messages.popitem(last=False)[1][0]
+                self._unindex_oldest(old_sender)
+            self.seq += 1
+            self.messages[self.seq] = (sender, message)
+            index = self.by_sender.get(sender)
+            if index is None:
+                index = self.by_sender[sender] = deque()
+            index.append(self.seq)
+            return True
+
+    def _unindex_oldest(self, sender):
+        # Caller holds self.lock. A sender's oldest message is the one just removed
+        index = self.by_sender[sender]
+        index.popleft()
+        if not index:
+            del self.by_sender[sender]
+
+    def pop(self, sender=None):
+        """Removes and returns the oldest message (from sender, if given), or None."""
+        with self.lock:
+            if sender is None:
+                if not self.messages:
+                    return None
+                sender, message = self.messages.popitem(last=False)[1]
+            else:
+                index = self.by_sender.get(sender)
+                if not index:
+                    return None
+                message = self.messages.pop(index[0])[1]
+            self._unindex_oldest(sender)
+            return message
+
+    def drain(self, match=None, sender=None, limit=None):
+        """
+        Removes and returns messages oldest first: all of them, only
+        sender's, and/or only those for which match(message) is true.
+        """
+        taken, touched = [], set()
+        with self.lock:
+            seqs = self.messages if sender is None else self.by_sender.get(sender, ())
+            for seq in list(seqs):
+                if limit is not None and len(taken) >= limit:
+                    break
+                owner, message = self.messages[seq]
+                if match is None or match(message):
+                    del self.messages[seq]
+                    touched.add(owner)
+                    taken.append(message)
+            for owner in touched:
+                # Removals can come from anywhere in a sender's queue: rebuild it
+                index = deque(seq for seq in self.by_sender[owner] if seq in self.messages)
+                if index:
+                    self.by_sender[owner] = index
+                else:
+                    del self.by_sender[owner]
+        return taken
+
+    def peek(self, sender=None):
+        """Messages (oldest first) without removing them."""
+        with self.lock:
+            if sender is None:
+                return [message for _, message in self.messages.values()]
+            return [self.messages[seq][1] for seq in self.by_sender.get(sender, ())]
+
+    def senders(self):
+        """{sender: number of waiting messages}"""
+        with self.lock:
+            return {sender: len(index) for sender, index in self.by_sender.items()}
+
+    def __len__(self):
+        return len(self.messages)
+
+
+class BufferPool:
+    """
+    Preallocated receive buffers for recvfrom_into(): the listener reuses
+    the same memory for every datagram instead of allocating fresh bytes.
+    A buffer goes back to the pool once its contents have been decoded.
+    """
+    def __init__(self, count=4, size=2048):
+        self.size = size
+        self.free = [bytearray(size) for _ in range(count)]
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            if self.free:
+                return self.free.pop()
+        return bytearray(self.size)  # Pool exhausted: fall back to a fresh one
+
+    def release(self, buf):
+        with self.lock:
+            self.free.append(buf)
+
+
+class BackgroundPrinter:
+    """
+    Prints from its own thread, so a slow terminal never stalls a receive
+    loop. The thread wakes at most every `interval` seconds and writes
+    everything pending in one go; lines beyond max_pending are counted
+    and dropped, not queued. print(template, *args) defers the
+    str.format() to that thread too (bytes arguments are decoded there as
+    UTF-8), so a dropped line costs nothing.
+    """
+    def __init__(self, max_pending=256, interval=0.05):
+        self.max_pending = max_pending
+        self.interval = interval
+        self.pending = deque()
+        self.wakeup = threading.Event()
+        self.dropped = 0
+        self.running = False
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def print(self, template, *args):
+        if len(self.pending) >= self.max_pending:
+            self.dropped += 1
+            return
+        self.pending.append((template, args))
+        if not self.wakeup.is_set():
+            if self.thread is None:
+                self._start()
+            self.wakeup.set()
+
+    def _start(self):
+        with self.lock:
+            if self.thread is None:
+                self.running = True
+                self.thread = threading.Thread(target=self._worker, name="BackgroundPrinter", daemon=True)
+                self.thread.start()
+
+    def _worker(self):
+        while self.running or self.pending:
+            self.wakeup.wait()
+            self.wakeup.clear()
+            lines = []
+            while self.pending:
+                template, args = self.pending.popleft()
+                if args:
+                    args = [str(arg, 'utf-8', 'replace') if isinstance(arg, bytes) else arg for arg in args]
+                    lines.append(template.format(*args))
+                else:
+                    lines.append(template)
+            if lines:
+                try:
+                    sys.stdout.write("\n".join(lines) + "\n")
+                    sys.stdout.flush()
+                except Exception:
+                    pass
+            if self.running:
+                time.sleep(self.interval)  # Batch what arrives meanwhile into the next write
+
+    def close(self):
+        thread = self.thread
+        if thread is not None:
+            self.running = False
+            self.wakeup.set()
+            thread.join(1.0)
+            self.thread = None
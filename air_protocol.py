@@ -0,0 +1,89 @@
+import struct
+import zlib
+
+class BinaryCodec:
+    """
+    BinaryCodec v1.0 - Compact RoboAir Wire Format.
+    A fixed 14-byte struct header (magic, version, message type, node-id
+    hash, sequence number, payload length) followed by the sender name and
+    the message body. Replaces per-packet JSON between peers that both
+    speak it; JSON stays the lingua franca for everyone else.
+
+    Packets decode to the same dict shape as the JSON ones
+    ({"type", "name", "data", ...}), so the receive path handles both.
+    decode() accepts bytes or a memoryview into a receive buffer.
+
+    "publish" packets put a 4-byte topic hash right after the header, at
+    a fixed offset, so topic_of() can reject unwanted traffic without
+    decoding anything else.
+    """
+    MAGIC = b"\xd5A"                       # Not valid UTF-8 text/JSON, not a batch marker
+    VERSION = 1
+    HEADER = struct.Struct("!2sBBIIH")     # magic, version, type, node hash, seq, payload length
+    PREFIX = struct.Struct("!2sBBIIHB")    # Header + the name length that opens every payload
+    TOPIC_PREFIX = struct.Struct("!2sBBIIHIB")  # Header + topic hash + name length ("publish" only)
+    TOPIC = struct.Struct("!I")
+    TYPES = ("unknown", "heartbeat", "chat", "publish")  # Append only: the index is the wire code
+    CODES = {name: i for i, name in enumerate(TYPES)}
+    PUBLISH = CODES["publish"]
+
+    @staticmethod
+    def node_hash(node_id):
+        return zlib.crc32(node_id.encode('utf-8'))
+
+    @classmethod
+    def is_binary(cls, raw):
+        return raw[:2] == cls.MAGIC
+
+    @classmethod
+    def topic_of(cls, raw):
+        """Topic hash of a publish packet, None for any other packet. Reads 4 bytes, decodes nothing."""
+        if len(raw) < cls.TOPIC_PREFIX.size or raw[3] != cls.PUBLISH or raw[2] != cls.VERSION:
+            return None
+        return cls.TOPIC.unpack_from(raw, cls.HEADER.size)[0]
+
+    @classmethod
+    def encode(cls, msg_type, node_hash, seq, name, data="", topic_hash=None):
+        name_bytes = name.encode('utf-8')[:255]
+        body = data.encode('utf-8') if data else b""
+        code = cls.CODES.get(msg_type, 0)
+        if code == cls.PUBLISH:
+            payload_len = 5 + len(name_bytes) + len(body)
+            head = cls.TOPIC_PREFIX.pack(cls.MAGIC, cls.VERSION, code, node_hash, seq & 0xFFFFFFFF,
+                                         payload_len, topic_hash, len(name_bytes))
+        else:
+            payload_len = 1 + len(name_bytes) + len(body)
+            head = cls.PREFIX.pack(cls.MAGIC, cls.VERSION, code, node_hash, seq & 0xFFFFFFFF,
+                                   payload_len, len(name_bytes))
+        if payload_len > 0xFFFF:
+            raise ValueError(f"Payload of {payload_len} bytes is too large for one packet")
+        return head + name_bytes + body
+
+    @classmethod
+    def decode(cls, raw):
+        """Packet dict, or None if raw is not a (complete) binary packet of a known version."""
+        topic_hash = None
+        try:
+            if len(raw) > 3 and raw[3] == cls.PUBLISH:  # The topic hash sits before the name
+                magic, version, code, node_hash, seq, payload_len, topic_hash, name_len = \
+                    cls.TOPIC_PREFIX.unpack_from(raw, 0)
+                name_start = cls.TOPIC_PREFIX.size
+            else:
+                magic, version, code, node_hash, seq, payload_len, name_len = cls.PREFIX.unpack_from(raw, 0)
+                name_start = cls.PREFIX.size
+        except struct.error:
+            return None
+        end = cls.HEADER.size + payload_len
+        name_end = name_start + name_len
+        if magic != cls.MAGIC or version != cls.VERSION or len(raw) < end or name_end > end:
+            return None
+        packet = {
+            "type": cls.TYPES[code] if code < len(cls.TYPES) else "unknown",
+            "hash": node_hash,
+            "seq": seq,
+            "name": str(raw[name_start:name_end], 'utf-8', 'replace'),
+            "data": str(raw[name_end:end], 'utf-8', 'replace'),
+        }
+        if topic_hash is not None:
+            packet["topic"] = topic_hash
+        return packet
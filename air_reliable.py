@@ -0,0 +1,291 @@
+import os
+import struct
+import threading
+import time
+from collections import deque
+
+class Transfer:
+    """Handle for one reliable message: done once every fragment is acked (ok) or given up (not ok)."""
+
+    def __init__(self, peer, size, last_seq):
+        self.peer = peer
+        self.size = size
+        self.last_seq = last_seq
+        self.ok = None
+        self.done = threading.Event()
+        self.callbacks = []
+        self.started = time.monotonic()
+        self.finished = None
+
+    def _finish(self, ok):
+        if self.ok is not None:
+            return
+        self.ok = ok
+        self.finished = time.monotonic()
+        self.done.set()
+        for callback in self.callbacks:
+            try:
+                callback(self)
+            except Exception:
+                pass
+
+    def add_done_callback(self, callback):
+        """callback(transfer), called right away if already finished."""
+        if self.ok is not None:
+            callback(self)
+        else:
+            self.callbacks.append(callback)
+
+    def wait(self, timeout=None):
+        """True if delivered, False if it failed or timed out."""
+        self.done.wait(timeout)
+        return bool(self.ok)
+
+
+class _Outbound:
+    """Sender state towards one peer."""
+
+    def __init__(self, session, rto):
+        self.session = session
+        self.next_seq = 0
+        self.acked = 0            # Every seq below this is acknowledged
+        self.queue = deque()      # (seq, packet) not sent yet (window full)
+        self.inflight = {}        # { seq: [packet, sent_at, transmissions] }
+        self.transfers = deque()  # Oldest first
+        self.srtt = None
+        self.rttvar = 0.0
+        self.rto = rto
+
+
+class _Inbound:
+    """Receiver state for one peer's session."""
+
+    def __init__(self, session):
+        self.session = session
+        self.expected = 0         # Next seq to hand to reassembly
+        self.early = {}           # { seq: (index, count, chunk) } received out of order
+        self.partial = []         # Chunks of the message being reassembled
+
+
+class ReliableChannel:
+    """
+    ReliableChannel v1.0 - Ordered, Acknowledged Delivery over UDP.
+    Messages of any size are cut into fragments that get consecutive
+    sequence numbers. At most `window` fragments are in flight per peer.
+    The receiver acks cumulatively plus a 64-bit selective-ack bitmap of
+    what it already holds past the gap, so only missing fragments are
+    resent: on timeout (RTO adapted from measured RTT, Jacobson/Karn) or
+    as soon as three later fragments are acked past a hole. Messages are reassembled and delivered in
+    order. Each sender picks a random session id, so a restarted peer is
+    not confused with its previous incarnation.
+
+    Transport-agnostic: transmit(peer, bytes) sends a datagram,
+    datagram_received(peer, raw) feeds one in, and the owner calls tick()
+    again after the delay it returns, or sooner once `wakeup` is set.
+    """
+    MAGIC = b"\xd5R"
+    DATA = 1
+    ACK = 2
+    DATA_HEADER = struct.Struct("!2sBIIHH")  # magic, kind, session, seq, fragment index, fragment count
+    ACK_HEADER = struct.Struct("!2sBIIQ")    # magic, kind, session, cumulative ack, SACK bitmap
+    SACK_BITS = 64
+
+    def __init__(self, transmit, on_message, mtu=1200, window=64, min_rto=0.05, max_rto=3.0,
+                 initial_rto=0.25, max_retries=10, clock=time.monotonic):
+        self.transmit = transmit
+        self.on_message = on_message      # on_message(peer, bytes)
+        self.chunk = mtu - self.DATA_HEADER.size
+        self.window = min(window, self.SACK_BITS)
+        self.min_rto = min_rto
+        self.max_rto = max_rto
+        self.initial_rto = initial_rto
+        self.max_retries = max_retries
+        self.clock = clock
+        self.outbound = {}   # { peer: _Outbound }
+        self.inbound = {}    # { peer: _Inbound }
+        self.lock = threading.RLock()
+        self.wakeup = threading.Event()  # Set when new data needs a timer sooner than planned
+        self.sent = 0
+        self.retransmits = 0
+        self.delivered = 0
+
+    @classmethod
+    def is_reliable(cls, raw):
+        return raw[:2] == cls.MAGIC
+
+    # --- Sending ---
+    def send(self, peer, data):
+        """Queues data (bytes) for reliable, ordered delivery to peer. Returns a Transfer."""
+        data = bytes(data)
+        count = max(1, -(-len(data) // self.chunk))
+        if count > 0xFFFF:
+            raise ValueError(f"{len(data)} bytes is too large for one reliable message")
+        with self.lock:
+            out = self.outbound.get(peer)
+            if out is None:
+                out = self.outbound[peer] = _Outbound(self._new_session(), self.initial_rto)
+            for index in range(count):
+                seq = out.next_seq
+                out.next_seq += 1
+                packet = self.DATA_HEADER.pack(self.MAGIC, self.DATA, out.session, seq & 0xFFFFFFFF,
+                                               index, count) + data[index * self.chunk:(index + 1) * self.chunk]
+                out.queue.append((seq, packet))
+            transfer = Transfer(peer, len(data), out.next_seq - 1)
+            out.transfers.append(transfer)
+            self._fill_window(peer, out, self.clock())
+        self.wakeup.set()
+        return transfer
+
+    @staticmethod
+    def _new_session():
+        return int.from_bytes(os.urandom(4), "big")
+
+    def _fill_window(self, peer, out, now):
+        # Caller holds self.lock
+        while out.queue and out.queue[0][0] < out.acked + self.window:
+            seq, packet = out.queue.popleft()
+            out.inflight[seq] = [packet, now, 1]
+            self.sent += 1
+            self.transmit(peer, packet)
+
+    def _retransmit(self, peer, out, seq, now):
+        entry = out.inflight[seq]
+        entry[1] = now
+        entry[2] += 1
+        self.retransmits += 1
+        self.transmit(peer, entry[0])
+
+    def _on_ack(self, peer, session, cumulative, bitmap, now):
+        out = self.outbound.get(peer)
+        if out is None or session != out.session:
+            return  # Ack for a session we abandoned
+        if cumulative > out.acked:
+            for seq in range(out.acked, cumulative):
+                entry = out.inflight.pop(seq, None)
+                if entry is not None and entry[2] == 1:
+                    self._sample_rtt(out, now - entry[1])  # Karn: never time a retransmission
+            out.acked = cumulative
+        highest = cumulative
+        while bitmap:
+            low = bitmap & -bitmap
+            seq = cumulative + low.bit_length()  # Bit i stands for cumulative + 1 + i
+            entry = out.inflight.pop(seq, None)
+            if entry is not None and entry[2] == 1:
+                self._sample_rtt(out, now - entry[1])
+            highest = seq
+            bitmap ^= low
+        # Fast retransmit: a hole with 3+ fragments acked past it is lost, not late.
+        # It must also have had an RTT plus some reordering slack to show up (this
+        # keeps jitter from triggering resends, and repeated acks from resending twice).
+        if highest - cumulative >= 3:
+            patience = out.rto if out.srtt is None else out.srtt + max(2 * out.rttvar, out.srtt / 4)
+            for seq in range(cumulative, highest - 2):
+                entry = out.inflight.get(seq)
+                if entry is not None and now - entry[1] >= patience:
+                    self._retransmit(peer, out, seq, now)
+        while out.transfers and out.transfers[0].last_seq < out.acked:
+            out.transfers.popleft()._finish(True)
+        self._fill_window(peer, out, now)
+
+    def _sample_rtt(self, out, rtt):
+        if out.srtt is None:
+            out.srtt, out.rttvar = rtt, rtt / 2
+        else:
+            out.rttvar = 0.75 * out.rttvar + 0.25 * abs(out.srtt - rtt)
+            out.srtt = 0.875 * out.srtt + 0.125 * rtt
+        out.rto = min(max(out.srtt + 4 * out.rttvar, self.min_rto), self.max_rto)
+
+    # --- Receiving ---
+    def datagram_received(self, peer, raw):
+        """Feeds one reliable packet (DATA or ACK) from peer."""
+        kind = raw[2] if len(raw) > 2 else 0
+        with self.lock:
+            now = self.clock()
+            if kind == self.ACK and len(raw) >= self.ACK_HEADER.size:
+                _, _, session, cumulative, bitmap = self.ACK_HEADER.unpack_from(raw, 0)
+                self._on_ack(peer, session, cumulative, bitmap, now)
+                return
+            if kind != self.DATA or len(raw) < self.DATA_HEADER.size:
+                return
+            _, _, session, seq, index, count = self.DATA_HEADER.unpack_from(raw, 0)
+            state = self.inbound.get(peer)
+            if state is None or state.session != session:
+                state = self.inbound[peer] = _Inbound(session)  # New peer, or it restarted
+            messages = []
+            if state.expected <= seq < state.expected + 2 * self.SACK_BITS and seq not in state.early:
+                state.early[seq] = (index, count, bytes(raw[self.DATA_HEADER.size:]))
+                while state.expected in state.early:
+                    index, count, chunk = state.early.pop(state.expected)
+                    state.expected += 1
+                    if index == 0:
+                        state.partial = []
+                    state.partial.append(chunk)
+                    if index == count - 1:
+                        messages.append(b"".join(state.partial))
+                        state.partial = []
+            # Always ack, duplicates included: the previous ack may have been lost
+            bitmap = 0
+            for seq in state.early:
+                offset = seq - state.expected - 1
+                if 0 <= offset < self.SACK_BITS:
+                    bitmap |= 1 << offset
+            self.transmit(peer, self.ACK_HEADER.pack(self.MAGIC, self.ACK, session, state.expected, bitmap))
+        for message in messages:
+            self.delivered += 1
+            try:
+                self.on_message(peer, message)
+            except Exception:
+                pass
+
+    # --- Timers ---
+    def tick(self):
+        """Retransmits what timed out. Returns seconds until the next check is due."""
+        failed = []
+        with self.lock:
+            now = self.clock()
+            delay = self.max_rto
+            for peer, out in list(self.outbound.items()):
+                backoff = False
+                for seq, entry in list(out.inflight.items()):
+                    due = entry[1] + out.rto
+                    if due > now:
+                        delay = min(delay, due - now)
+                        continue
+                    if entry[2] > self.max_retries:
+                        failed.append(self._give_up(peer, out))
+                        break
+                    self._retransmit(peer, out, seq, now)
+                    backoff = True
+                if backoff and peer in self.outbound:
+                    out.rto = min(out.rto * 2, self.max_rto)
+                    delay = min(delay, out.rto)
+        for transfers in failed:
+            for transfer in transfers:
+                transfer._finish(False)
+        return max(delay, 0.001)
+
+    def _give_up(self, peer, out):
+        """Peer stopped answering: fail its transfers and start over with a new session."""
+        del self.outbound[peer]
+        return list(out.transfers)
+
+    def forget(self, peer):
+        """Drops all state for a peer that went offline; its pending transfers fail."""
+        with self.lock:
+            out = self.outbound.pop(peer, None)
+            self.inbound.pop(peer, None)
+        for transfer in out.transfers if out is not None else ():
+            transfer._finish(False)
+
+    def stats(self, peer=None):
+        """Counters, plus RTT/RTO and window use for one peer."""
+        result = {"sent": self.sent, "retransmits": self.retransmits, "delivered": self.delivered}
+        out = self.outbound.get(peer)
+        if out is not None:
+            result.update({
+                "srtt_ms": None if out.srtt is None else out.srtt * 1000,
+                "rto_ms": out.rto * 1000,
+                "inflight": len(out.inflight),
+                "queued": len(out.queue),
+            })
+        return result
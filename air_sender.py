@@ -0,0 +1,152 @@
+import socket
+import struct
+import threading
+import time
+from collections import deque
+
+class DatagramSender:
+    """
+    DatagramSender v1.0 - Persistent, Batching UDP Transmitter.
+    One long-lived, pre-configured socket replaces the socket-per-message
+    pattern. Messages go into a bounded queue; a single sender thread
+    lingers briefly so that bursts build up, then packs every message bound
+    for the same address into as few datagrams as fit. A datagram holding
+    one message is sent as-is, so old receivers still understand it;
+    batches carry BATCH_MAGIC and length-prefixed frames (see unpack()).
+    """
+    BATCH_MAGIC = b"\x00RB"           # Never the first bytes of UTF-8 text or JSON
+    FRAME = struct.Struct("!H")       # Length prefix of each message in a batch
+
+    def __init__(self, max_datagram=1400, linger=0.002, max_queue=1024, broadcast=True, bind=None):
+        self.max_datagram = max_datagram
+        self.linger = linger          # Seconds to wait for more messages before flushing
+        self.max_queue = max_queue
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        if broadcast:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        if bind is not None:
+            self.sock.bind(bind)  # Fixes the source address peers will see
+        self.queue = deque()
+        self.cond = threading.Condition()
+        self.running = True
+        self.thread = None
+        self.sending = False          # Worker holds a drained batch
+        self.sent_messages = 0
+        self.sent_datagrams = 0
+        self.dropped = 0              # Refused because the queue was full
+        self.errors = 0
+
+    def send(self, data, addr, batch=True):
+        """
+        Queues data (bytes) for addr. batch=False keeps it in a datagram of its
+        own (for receivers that cannot unpack batches). Returns False if the
+        queue is full or closed.
+        """
+        with self.cond:
+            if not self.running or len(self.queue) >= self.max_queue:
+                self.dropped += 1
+                return False
+            self.queue.append((addr, batch, data))
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._worker, name="DatagramSender", daemon=True)
+                self.thread.start()
+            elif len(self.queue) == 1:
+                self.cond.notify()
+        return True
+
+    def _worker(self):
+        while True:
+            with self.cond:
+                while not self.queue and self.running:
+                    self.cond.wait()
+                if not self.queue:
+                    return  # Closed and drained
+            if self.linger and self.running:
+                time.sleep(self.linger)  # Let a burst pile up
+            with self.cond:
+                batch, self.queue = self.queue, deque()
+                self.sending = True
+            groups = {}
+            for addr, batched, data in batch:
+                groups.setdefault((addr, batched), []).append(data)
+            for (addr, batched), messages in groups.items():
+                for datagram in self.pack(messages, self.max_datagram) if batched else messages:
+                    try:
+                        self.sock.sendto(datagram, addr)
+                        self.sent_datagrams += 1
+                    except OSError as e:
+                        self.errors += 1
+                        print(f"[!] Send error to {addr[0]}: {e}")
+                self.sent_messages += len(messages)
+            with self.cond:
+                self.sending = False
+                self.cond.notify_all()
+
+    @classmethod
+    def pack(cls, messages, max_datagram=1400):
+        """Splits messages into datagrams of at most max_datagram bytes (oversized ones go alone)."""
+        datagrams, frames, size = [], [], len(cls.BATCH_MAGIC)
+        for data in messages:
+            cost = cls.FRAME.size + len(data)
+            if frames and size + cost > max_datagram:
+                datagrams.append(cls._join(frames))
+                frames, size = [], len(cls.BATCH_MAGIC)
+            frames.append(data)
+            size += cost
+        if frames:
+            datagrams.append(cls._join(frames))
+        return datagrams
+
+    @classmethod
+    def _join(cls, frames):
+        if len(frames) == 1:
+            return frames[0]
+        parts = [cls.BATCH_MAGIC]
+        for data in frames:
+            parts.append(cls.FRAME.pack(len(data)))
+            parts.append(data)
+        return b"".join(parts)
+
+    @classmethod
+    def unpack(cls, datagram):
+        """
+        Messages carried by one received datagram (a plain datagram is one
+        message). Batched messages come back as memoryview slices of the
+        datagram, so nothing is copied; decode them before reusing its buffer.
+        """
+        if datagram[:len(cls.BATCH_MAGIC)] != cls.BATCH_MAGIC:
+            return [datagram]
+        messages, pos, end = [], len(cls.BATCH_MAGIC), len(datagram)
+        view = memoryview(datagram)
+        while pos + cls.FRAME.size <= end:
+            length = cls.FRAME.unpack_from(datagram, pos)[0]
+            pos += cls.FRAME.size
+            if pos + length > end:
+                break  # Truncated batch; keep what was whole
+            messages.append(view[pos:pos + length])
+            pos += length
+        return messages
+
+    def flush(self, timeout=1.0):
+        """Waits until everything queued so far has been handed to the kernel."""
+        deadline = time.monotonic() + timeout
+        with self.cond:
+            while self.queue or self.sending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self.cond.notify()
+                self.cond.wait(remaining)
+        return True
+
+    def close(self, timeout=1.0):
+        """Sends what is still queued, then closes the socket."""
+        with self.cond:
+            if not self.running:
+                return
+            self.running = False
+            self.cond.notify_all()
+            thread = self.thread
+        if thread is not None:
+            thread.join(timeout)
+        self.sock.close()
@@ -0,0 +1,161 @@
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from thermal_trend import ThermalTrend
+
+class AsyncSurvivalMonitor:
+    """
+    AsyncSurvivalMonitor v1.0 - Non-blocking Survival Protocol.
+    Runs thermal, battery and motion sampling of a DroidSense (v2.0) device
+    as concurrent asyncio tasks. Vibrations go to the device's
+    FeedbackDispatcher (rate-limited and coalesced, like the threaded loop);
+    those requests, journal and telemetry writes, and the blocking parts of
+    shutdown go through a single-thread executor, so feedback and disk I/O
+    never stall sampling.
+
+        monitor = AsyncSurvivalMonitor(DroidSense())
+        await monitor.run()          # or run it alongside your own coroutines
+    """
+    def __init__(self, device, temp_limit=42, motion_limit=3.0, zone_limits=None,
+                 thermal_interval=1.0, battery_interval=30.0, motion_interval=0.25,
+                 event_queue_size=100):
+        self.device = device
+        self.temp_limit = temp_limit
+        self.motion_limit = motion_limit
+        self.zone_limits = zone_limits
+        self.intervals = {
+            "thermal": thermal_interval,
+            "battery": battery_interval,
+            "motion": motion_interval,
+        }
+        self.battery = device.get_battery()
+        self.temp = 0.0
+        self.stress = 0.0
+        self.events = asyncio.Queue(maxsize=event_queue_size)  # (timestamp, type, value) for embedders
+        self.dropped_events = 0
+        self.jitter = {name: 0.0 for name in self.intervals}   # Worst lateness per sampler, seconds
+        self.executor = None
+        self.trend = ThermalTrend(temp_limit, on_warning=device.on_heat_warning)
+        self.background = set()
+        self.tasks = []
+        self.running = False
+
+    def log(self, message):
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] [DroidSense] {message}")
+
+    async def run(self):
+        """Runs all samplers until stop() is called or the task is cancelled."""
+        self.running = True
+        self.executor = ThreadPoolExecutor(max_workers=1)  # Serialises journal and telemetry writes
+        self.device.motion_limit = self.motion_limit
+        self.device.get_motion_energy()  # Starts the accelerometer stream
+        self.tasks = [
+            asyncio.create_task(self._every("thermal", self._sample_thermal)),
+            asyncio.create_task(self._every("battery", self._sample_battery)),
+            asyncio.create_task(self._every("motion", self._sample_motion)),
+        ]
+        try:
+            await asyncio.gather(*self.tasks)
+        except asyncio.CancelledError:
+            if self.running:
+                raise  # Cancelled from outside, not via stop()
+        finally:
+            await self._shutdown()
+
+    def stop(self):
+        """Ends run(); safe to call from inside the event loop."""
+        self.running = False
+        for task in self.tasks:
+            task.cancel()
+
+    async def _every(self, name, sampler):
+        """Calls sampler on a fixed cadence using absolute deadlines, so lateness never accumulates."""
+        loop = asyncio.get_running_loop()
+        interval = self.intervals[name]
+        deadline = loop.time()
+        while self.running:
+            lateness = loop.time() - deadline
+            if lateness > self.jitter[name]:
+                self.jitter[name] = lateness
+            try:
+                sampler()
+            except Exception as e:
+                self.log(f"{name} sampler error: {e}")
+            deadline += interval
+            now = loop.time()
+            if deadline < now:
+                deadline = now  # Skip missed ticks instead of bursting to catch up
+            await asyncio.sleep(deadline - now)
+
+    def _sample_thermal(self):
+        self.temp, hot_zones = self.device.check_heat(self.temp_limit, self.zone_limits,
+                                                      self.device.get_temperature())
+        if self.trend.update(time.time(), self.temp):
+            self._event("HEAT_WARNING", self.temp)
+        if self.device.telemetry is not None:
+            # Appends (and the odd chunk flush) hit the disk: keep them off the loop
+            self._offload(functools.partial(self.device.telemetry.record,
+                                            temp=self.temp, battery=self.battery, motion=self.stress))
+        if hot_zones:
+            peak = max(t for _, t in hot_zones)
+            self.log("CRITICAL HEAT: " + ", ".join(f"{zone}={t}°C" for zone, t in hot_zones))
+            self._event("OVERHEAT", peak)
+            self._feedback("heavy")
+
+    def _sample_battery(self):
+        self.battery = self.device.get_battery()
+
+    def _sample_motion(self):
+        self.stress = self.device.get_motion_energy()
+        if self.stress > self.motion_limit:
+            self.log(f"SECURITY BREACH: Physical Displacement Detected ({self.stress:.2f})")
+            self._event("MOTION", self.stress)
+            self._feedback("mild")
+
+    def _event(self, event_type, value):
+        """Publishes an event to self.events and journals it off the loop."""
+        try:
+            self.events.put_nowait((time.time(), event_type, value))
+        except asyncio.QueueFull:
+            self.dropped_events += 1
+        self._offload(self.device._save_trauma, event_type, value, self.battery)
+
+    def _offload(self, fn, *args):
+        """Runs fn(*args) on the I/O executor, in submission order."""
+        future = asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+        self._track(asyncio.ensure_future(future))
+
+    def _feedback(self, intensity):
+        self._track(asyncio.ensure_future(self.vibrate(intensity)))
+
+    async def vibrate(self, intensity="mild"):
+        """
+        Non-blocking equivalent of DroidSense.trigger_feedback(): the dispatcher's
+        worker runs termux-vibrate. Returns False if the request was rate-limited.
+        """
+        duration = 500 if intensity == "mild" else 1500
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, self.device.feedback.vibrate, duration)
+
+    def _track(self, task):
+        self.background.add(task)
+        task.add_done_callback(self.background.discard)
+
+    async def _shutdown(self):
+        self.running = False
+        self.device.motion_limit = None
+        if self.background:
+            await asyncio.gather(*self.background, return_exceptions=True)
+        # Stopping the sensor can wait seconds on its process, closing fsyncs: not on the loop
+        await asyncio.get_running_loop().run_in_executor(self.executor, self._close_device)
+        self.executor.shutdown(wait=True)  # Idle by now
+
+    def _close_device(self):
+        self.device.accel.stop()
+        self.device.feedback.close(wait=False)
+        if self.device.journal is not None:
+            self.device.journal.sync()
+        if self.device.telemetry is not None:
+            self.device.telemetry.close() # Also writes the open 1m/1h windows
@@ -0,0 +1,70 @@
+"""
+LossyLink: stands in for a node's DatagramSender and mangles what it sends,
+so loopback runs see a bad radio link: datagrams dropped, duplicated,
+delayed with jitter, and some held back long enough to arrive out of order.
+
+    node.sender = LossyLink(node.sender, loss=0.1, reorder=0.1)
+"""
+import heapq
+import itertools
+import random
+import threading
+import time
+
+
+class LossyLink:
+    def __init__(self, inner, loss=0.0, duplicate=0.0, reorder=0.0, jitter=0.002,
+                 reorder_delay=0.02, seed=None):
+        self.inner = inner
+        self.loss = loss
+        self.duplicate = duplicate
+        self.reorder = reorder
+        self.jitter = jitter
+        self.reorder_delay = reorder_delay
+        self.random = random.Random(seed)
+        self.pending = []  # heap of (due, n, data, addr, batch)
+        self.counter = itertools.count()
+        self.cond = threading.Condition()
+        self.running = True
+        self.dropped = self.duplicated = self.reordered = 0
+        threading.Thread(target=self._worker, name="LossyLink", daemon=True).start()
+
+    def send(self, data, addr, batch=True):
+        with self.cond:
+            if self.random.random() < self.loss:
+                self.dropped += 1
+                return True  # A radio does not know either
+            copies = 1
+            if self.random.random() < self.duplicate:
+                copies, self.duplicated = 2, self.duplicated + 1
+            now = time.monotonic()
+            for _ in range(copies):
+                delay = self.random.uniform(0, self.jitter)
+                if self.random.random() < self.reorder:
+                    delay += self.reorder_delay
+                    self.reordered += 1
+                heapq.heappush(self.pending, (now + delay, next(self.counter), data, addr, batch))
+            self.cond.notify()
+        return True
+
+    def _worker(self):
+        while True:
+            with self.cond:
+                while self.running and (not self.pending or self.pending[0][0] > time.monotonic()):
+                    self.cond.wait(self.pending[0][0] - time.monotonic() if self.pending else None)
+                if not self.running:
+                    return
+                _, _, data, addr, batch = heapq.heappop(self.pending)
+            self.inner.send(data, addr, batch)
+
+    def flush(self, timeout=1.0):
+        deadline = time.monotonic() + timeout
+        while self.pending and time.monotonic() < deadline:
+            time.sleep(0.005)
+        return self.inner.flush(max(deadline - time.monotonic(), 0))
+
+    def close(self):
+        with self.cond:
+            self.running = False
+            self.cond.notify()
+        self.inner.close()
@@ -0,0 +1,27 @@
+"""
+Imports the repo's top-level scripts by their plain name. Some of them
+(robocore.py, roboair2.py, robolink.py, ...) carry a zero-width space at the
+start of their file name, so a normal import statement cannot reach them.
+"""
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def load_script(name):
+    """load_script("robocore") -> module object for robocore.py / \\u200brobocore.py."""
+    if name in sys.modules:
+        return sys.modules[name]
+    for candidate in (name + ".py", "​" + name + ".py"):
+        path = os.path.join(ROOT, candidate)
+        if os.path.exists(path):
+            spec = importlib.util.spec_from_file_location(name, path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module
+            spec.loader.exec_module(module)
+            return module
+    raise ImportError(f"No script named {name}.py in {ROOT}")
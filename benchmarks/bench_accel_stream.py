@@ -0,0 +1,55 @@
+"""
+Benchmark: one termux-sensor fork per accelerometer sample vs. the
+persistent AccelerometerStream. Uses fake_termux_sensor.py, so no phone is needed.
+
+    python benchmarks/bench_accel_stream.py [ticks]
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+from sensor_stream import AccelerometerStream
+
+FAKE = [sys.executable, os.path.join(HERE, "fake_termux_sensor.py")]
+
+
+def fork_per_sample():
+    # The original get_acceleration(): spawn, read one object, exit
+    result = subprocess.check_output(FAKE + ["-n", "1", "-s", "accelerometer"], timeout=2)
+    decoder = json.JSONDecoder()
+    text = result.decode().strip()
+    obj, pos = decoder.raw_decode(text)  # Leading {}
+    obj, _ = decoder.raw_decode(text, text.index("{", pos))
+    return next(iter(obj.values()))["values"]
+
+
+def main(ticks=50):
+    start = time.perf_counter()
+    for _ in range(ticks):
+        fork_per_sample()
+    forked = (time.perf_counter() - start) / ticks
+
+    stream = AccelerometerStream(delay_ms=10, command=FAKE)
+    stream.start()
+    while stream.sample_count < 5:
+        time.sleep(0.01)
+    start = time.perf_counter()
+    for _ in range(ticks * 1000):
+        stream.latest()
+    cached = (time.perf_counter() - start) / (ticks * 1000)
+    time.sleep(0.5)
+    received = stream.sample_count
+    stream.stop()
+
+    print("--- accelerometer read cost per tick ---")
+    print(f"fork per sample        {forked * 1e3:9.3f} ms")
+    print(f"stream.latest()        {cached * 1e6:9.3f} us")
+    print(f"stream delivered {received} samples in the background (10 ms period)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,65 @@
+"""
+Benchmark: a virtual RoboAir swarm hosted by one process and one thread.
+N AsyncRoboAir nodes on consecutive loopback ports discover each other,
+then every node sends a chat to its neighbour. Reports discovery time,
+chat throughput, CPU, RSS and thread count.
+
+    python benchmarks/bench_air_async.py [nodes]
+"""
+import asyncio
+import os
+import resource
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _scripts import load_script
+
+AsyncRoboAir = load_script("roboair2").AsyncRoboAir
+BASE_PORT = 47000
+
+
+async def swarm(n, rounds=20):
+    addrs = [("127.0.0.1", BASE_PORT + i) for i in range(n)]
+    nodes = [AsyncRoboAir(port, f"sim-{i}", host="127.0.0.1", broadcast_to=addrs)
+             for i, (_, port) in enumerate(addrs)]
+    for node in nodes:
+        node.log = lambda message: None
+        await node.start()  # First heartbeat goes out right away
+    cpu, start = time.process_time(), time.perf_counter()
+    while any(len(node.peers) < n - 1 for node in nodes):
+        if time.perf_counter() - start > 30:
+            break
+        await asyncio.sleep(0.01)
+    discovery = time.perf_counter() - start
+
+    async def consume(node, count):
+        for _ in range(count):
+            if await node.receive(timeout=5) is None:
+                return
+
+    start = time.perf_counter()
+    consumers = [asyncio.ensure_future(consume(node, rounds)) for node in nodes]
+    for r in range(rounds):
+        for i, node in enumerate(nodes):
+            node.send_message(f"round {r}", f"127.0.0.1:{BASE_PORT + (i + 1) % n}")
+        await asyncio.sleep(0)
+    await asyncio.gather(*consumers)
+    chat_time = time.perf_counter() - start
+    cpu = time.process_time() - cpu
+    for node in nodes:
+        node.stop()
+    return discovery, n * rounds / chat_time, cpu
+
+
+def main(sizes=(10, 100, 300)):
+    print(f"{'nodes':>6} {'discover s':>11} {'chats/s':>10} {'cpu s':>7} {'rss MB':>7} {'threads':>8}")
+    for n in sizes:
+        discovery, chats, cpu = asyncio.run(swarm(n))
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(f"{n:>6} {discovery:11.2f} {chats:10.0f} {cpu:7.2f} {rss:7.1f} {threading.active_count():>8}")
+
+
+if __name__ == "__main__":
+    main(tuple(int(a) for a in sys.argv[1:]) or (10, 100, 300))
@@ -0,0 +1,106 @@
+"""
+Loopback flood: the old RoboAir v1 receive path (recvfrom -> bytes -> str,
+unbounded list, print under the lock) vs. the current one (raw bytes into a
+bounded RingInbox, decoded when read; printing on a background thread). Each
+receiver runs in its own process so RSS is measured separately. Output
+goes to /dev/null, then to a pipe nobody reads (a stalled terminal).
+
+    python benchmarks/bench_air_inbox.py [datagrams]
+"""
+import multiprocessing
+import os
+import resource
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _scripts import load_script
+
+PORT = 47900
+
+
+class LegacyReceiver:
+    """RoboAir v1.0's _listen as it was."""
+
+    def __init__(self, port):
+        self.port = port
+        self.received_messages = []
+        self.lock = threading.Lock()
+        self.running = True
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("", port))
+        threading.Thread(target=self._listen, daemon=True).start()
+
+    def _listen(self):
+        while self.running:
+            try:
+                data, addr = self.sock.recvfrom(1024)
+                message = data.decode('utf-8')
+                with self.lock:
+                    self.received_messages.append({"sender": addr[0], "msg": message})
+                    print(f"\n[Incoming Signal] From {addr[0]}: {message}")
+            except Exception:
+                pass
+
+    def received(self):
+        return len(self.received_messages)
+
+
+def receiver(mode, stdout, ready, results):
+    if stdout == "stalled":
+        _, w = os.pipe()  # Never read: print() blocks once the pipe is full
+        sys.stdout = os.fdopen(w, "w")
+    else:
+        sys.stdout = open(os.devnull, "w")
+    if mode == "legacy":
+        node = LegacyReceiver(PORT)
+    else:
+        node = load_script("roboair").RoboAir(PORT)
+        node.start()
+        node.received = lambda: node.received_messages.received
+    node.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 << 20)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    ready.set()
+    # Wait for the first datagram, then until the count stops moving
+    while node.received() == 0:
+        time.sleep(0.001)
+    start, last, last_change = time.perf_counter(), 0, time.perf_counter()
+    while time.perf_counter() - last_change < 0.5:
+        count = node.received()
+        if count != last:
+            last, last_change = count, time.perf_counter()
+        time.sleep(0.01)
+    elapsed = last_change - start
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results.put((last, last / elapsed if elapsed else 0.0, rss / 1024, (rss - rss_before) / 1024))
+
+
+def flood(mode, stdout, datagrams):
+    ready, results = multiprocessing.Event(), multiprocessing.Queue()
+    proc = multiprocessing.Process(target=receiver, args=(mode, stdout, ready, results))
+    proc.start()
+    ready.wait(10)
+    payload = b"Robot-Alpha: obstacle at 2.5 m, turning left, battery 81%"
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        for i in range(datagrams):
+            s.sendto(payload, ("127.0.0.1", PORT))
+            if i % 64 == 63:
+                time.sleep(0)  # Give the receiver a turn on small machines
+    received, rate, rss, growth = results.get(timeout=60)
+    proc.terminate()
+    proc.join()
+    print(f"{mode:<8} {stdout:<8} {received:>9} {rate:12.0f} {rss:9.1f} {growth:9.1f}")
+
+
+def main(datagrams=200000):
+    print(f"--- RoboAir v1 receive flood, {datagrams} datagrams over loopback ---")
+    print(f"{'path':<8} {'stdout':<8} {'received':>9} {'msgs/s':>12} {'rss MB':>9} {'grew MB':>9}")
+    for stdout in ("devnull", "stalled"):
+        flood("legacy", stdout, datagrams)
+        flood("ring", stdout, datagrams)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
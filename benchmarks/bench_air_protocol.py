@@ -0,0 +1,51 @@
+"""
+Benchmark: RoboAir2 packet encode/decode, JSON vs. BinaryCodec, for
+heartbeats and short chats. Reports packet size and packets/s.
+
+    python benchmarks/bench_air_protocol.py [packets]
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from air_protocol import BinaryCodec
+
+NODE_ID = "Robot-Alpha-phone"
+NAME = "Robot-Alpha"
+HASH = BinaryCodec.node_hash(NODE_ID)
+
+
+def json_packet(msg_type, data):
+    packet = {"id": NODE_ID, "name": NAME, "type": msg_type}
+    if data:
+        packet["data"] = data
+    return packet
+
+
+def rate(fn, n):
+    start = time.perf_counter()
+    for i in range(n):
+        fn(i)
+    return n / (time.perf_counter() - start)
+
+
+def main(n=200000):
+    print(f"--- RoboAir2 wire formats, {n} packets ---")
+    print(f"{'packet':<10} {'format':<7} {'bytes':>6} {'encode/s':>12} {'decode/s':>12}")
+    for msg_type, data in (("heartbeat", ""), ("chat", "Obstacle at 2.5 m, turning left")):
+        packet = json_packet(msg_type, data)
+        raw = json.dumps(packet).encode('utf-8')
+        enc = rate(lambda i: json.dumps(packet).encode('utf-8'), n)
+        dec = rate(lambda i: json.loads(raw.decode('utf-8')), n)
+        print(f"{msg_type:<10} {'json':<7} {len(raw):>6} {enc:12.0f} {dec:12.0f}")
+
+        raw = BinaryCodec.encode(msg_type, HASH, 1, NAME, data)
+        enc = rate(lambda i: BinaryCodec.encode(msg_type, HASH, i, NAME, data), n)
+        dec = rate(lambda i: BinaryCodec.decode(raw), n)
+        print(f"{msg_type:<10} {'binary':<7} {len(raw):>6} {enc:12.0f} {dec:12.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,367 @@
+"""
+Swarm benchmark for RoboAir2: N nodes on loopback, optionally spread over
+several processes, under a configurable heartbeat and chat load.
+
+  async     AsyncRoboAir nodes on 127.0.0.1, consecutive ports (one event
+            loop per process; broadcasts become unicasts to every node)
+  threaded  RoboAir nodes, one loopback address each (127.1.x.y), so the
+            real _listen / _send_raw / _cleanup_peers threads are measured
+
+Phases: start every node and time peer discovery until each node lists
+all N-1 others (convergence); send chats to random peers at --rate per
+node for --duration seconds, each stamped with its send time; let the
+stragglers land (--settle), then report delivery rate, end-to-end latency
+percentiles, CPU and memory per node. The result is written as JSON
+(--out) so runs of different versions can be compared (--baseline).
+
+    python benchmarks/bench_air_swarm.py --nodes 100 --procs 2
+    python benchmarks/bench_air_swarm.py --mode threaded --nodes 30 --out threaded.json
+    python benchmarks/bench_air_swarm.py --nodes 100 --baseline before.json
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _scripts import load_script
+from latency_histogram import LatencyHistogram
+
+roboair2 = load_script("roboair2")
+BASE_PORT = 48000
+THREADED_PORT = 48500
+
+
+class Recorder:
+    """Per-process delivery counter and latency histogram."""
+
+    def __init__(self, tag):
+        self.tag = tag
+        self.received = 0
+        self.latency = LatencyHistogram()
+        self.lock = threading.Lock()
+
+    def record(self, message):
+        tag, _, sent = str(message.get("msg", "")).partition("|")
+        if tag != self.tag:
+            return
+        latency = time.time() - float(sent)
+        with self.lock:
+            self.received += 1
+            self.latency.record(latency)
+
+
+class _Recording:
+    """Records every chat as the node delivers it."""
+    recorder = None
+
+    def _deliver(self, message):
+        self.recorder.record(message)
+        super()._deliver(message)
+
+
+class ThreadedNode(_Recording, roboair2.RoboAir):
+    swarm = ()
+
+    def announce(self, target_ip=roboair2.RoboAir.BROADCAST):
+        # Loopback addresses do not hear 255.255.255.255: greet every swarm member instead
+        if target_ip != self.BROADCAST:
+            return super().announce(target_ip)
+        for host in self.swarm:
+            if host != self.host:
+                super().announce(host)
+
+
+class AsyncNode(_Recording, roboair2.AsyncRoboAir):
+    pass
+
+
+def threaded_host(i):
+    return f"127.1.{i // 200}.{i % 200 + 2}"
+
+
+def rss_kb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def cpu_s():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+class Worker:
+    """One process's share of the swarm; the phases are the same for both node kinds."""
+
+    def __init__(self, cfg, indices, barrier):
+        self.cfg = cfg
+        self.indices = indices
+        self.barrier = barrier
+        self.recorder = Recorder(cfg["tag"])
+        self.random = random.Random(indices[0] if indices else 0)
+        self.sent = 0
+        self.send_failures = 0
+        self.result = {"nodes": len(indices)}
+
+    def targets(self):
+        n = self.cfg["nodes"]
+        if self.cfg["mode"] == "async":
+            return [f"127.0.0.1:{BASE_PORT + i}" for i in range(n)]
+        return [threaded_host(i) for i in range(n)]
+
+    def _converged(self, nodes, started, converged_at):
+        n = self.cfg["nodes"]
+        for i, node in enumerate(nodes):
+            if i not in converged_at and len(node.peers) >= n - 1:
+                converged_at[i] = time.time() - started
+        return len(converged_at) == len(nodes)
+
+    def _send_due(self, nodes, targets, own, start, rate, k):
+        """Sends every chat that is due by now; returns the next sequence number."""
+        due = int((time.time() - start) * rate)
+        while k < due:
+            i = k % len(nodes)
+            target = self.random.choice(targets)
+            while target == own[i]:
+                target = self.random.choice(targets)
+            if nodes[i].send_message(f"{self.cfg['tag']}|{time.time():.6f}", target):
+                self.sent += 1
+            else:
+                self.send_failures += 1
+            k += 1
+        return k
+
+    def _finish(self, nodes, converged_at, rss_before, rss_nodes, cpu_load):
+        self.result.update({
+            "converged_nodes": len(converged_at),
+            "converged_at": max(converged_at.values()) if len(converged_at) == len(nodes) else None,
+            "sent": self.sent,
+            "send_failures": self.send_failures,
+            "received": self.recorder.received,
+            "latency": self.recorder.latency,
+            "cpu_load_s": cpu_load,
+            "cpu_total_s": cpu_s(),
+            "rss_kb": rss_nodes,
+            "rss_growth_kb": rss_nodes - rss_before,
+            "bad_packets": sum(node.bad_packets for node in nodes),
+        })
+        return self.result
+
+    # --- Threaded nodes ---
+    def run_threaded(self):
+        cfg, targets = self.cfg, self.targets()
+        rss_before = rss_kb()
+        nodes = []
+        for i in self.indices:
+            node = ThreadedNode(THREADED_PORT, f"sim-{i}", host=threaded_host(i))
+            node.log = node.printer.print = lambda *args: None
+            node.swarm, node.recorder = targets, self.recorder
+            node.HEARTBEAT_INTERVAL = cfg["heartbeat"]
+            nodes.append(node)
+        self.barrier.wait()
+        started, converged_at = time.time(), {}
+        for node in nodes:
+            node.start()
+        while not self._converged(nodes, started, converged_at) and time.time() - started < cfg["timeout"]:
+            time.sleep(0.01)
+        rss_nodes = rss_kb()
+        self.barrier.wait()
+
+        own = [node.host for node in nodes]
+        cpu_start, start, k = cpu_s(), time.time(), 0
+        while time.time() - start < cfg["duration"]:
+            k = self._send_due(nodes, targets, own, start, cfg["rate"] * len(nodes), k)
+            time.sleep(0.001)
+        self.barrier.wait()
+        time.sleep(cfg["settle"])
+        cpu_load = cpu_s() - cpu_start
+        for node in nodes:
+            node.stop()
+        return self._finish(nodes, converged_at, rss_before, rss_nodes, cpu_load)
+
+    # --- Async nodes ---
+    def run_async(self):
+        return asyncio.run(self._run_async())
+
+    async def _run_async(self):
+        cfg, targets = self.cfg, self.targets()
+        loop = asyncio.get_running_loop()
+        addrs = [("127.0.0.1", BASE_PORT + i) for i in range(cfg["nodes"])]
+        rss_before = rss_kb()
+        nodes = []
+        for i in self.indices:
+            node = AsyncNode(BASE_PORT + i, f"sim-{i}", host="127.0.0.1", broadcast_to=addrs)
+            node.log = lambda *args: None
+            node.recorder = self.recorder
+            node.HEARTBEAT_INTERVAL = cfg["heartbeat"]
+            nodes.append(node)
+        await loop.run_in_executor(None, self.barrier.wait)
+        started, converged_at = time.time(), {}
+        for node in nodes:
+            await node.start()
+        drains = [asyncio.ensure_future(self._drain(node)) for node in nodes]
+        while not self._converged(nodes, started, converged_at) and time.time() - started < cfg["timeout"]:
+            await asyncio.sleep(0.01)
+        rss_nodes = rss_kb()
+        await loop.run_in_executor(None, self.barrier.wait)
+
+        own = [f"127.0.0.1:{node.port}" for node in nodes]
+        cpu_start, start, k = cpu_s(), time.time(), 0
+        while time.time() - start < cfg["duration"]:
+            k = self._send_due(nodes, targets, own, start, cfg["rate"] * len(nodes), k)
+            await asyncio.sleep(0.001)
+        await loop.run_in_executor(None, self.barrier.wait)
+        await asyncio.sleep(cfg["settle"])
+        cpu_load = cpu_s() - cpu_start
+        for task in drains:
+            task.cancel()
+        for node in nodes:
+            node.stop()
+        return self._finish(nodes, converged_at, rss_before, rss_nodes, cpu_load)
+
+    @staticmethod
+    async def _drain(node):
+        while True:
+            await node.receive()  # Already recorded in _deliver; keeps the inbox from pausing reads
+
+
+def worker(cfg, indices, barrier, results):
+    try:
+        w = Worker(cfg, indices, barrier)
+        results.put(w.run_async() if cfg["mode"] == "async" else w.run_threaded())
+    except Exception as e:
+        barrier.abort()
+        results.put({"error": repr(e)})
+
+
+def aggregate(cfg, parts):
+    errors = [part["error"] for part in parts if "error" in part]
+    if errors:
+        raise RuntimeError(f"worker failed: {errors[0]}")
+    n = cfg["nodes"]
+    latency = LatencyHistogram()
+    for part in parts:
+        latency.merge(part["latency"])
+    sent = sum(part["sent"] for part in parts)
+    received = sum(part["received"] for part in parts)
+    converged = sum(part["converged_nodes"] for part in parts)
+    summary = latency.summary()
+    if latency.count:
+        summary["p999_ms"] = round(latency.percentile(99.9) * 1e3, 3)
+    return {
+        "convergence_s": (round(max(part["converged_at"] for part in parts), 3)
+                          if converged == n else None),
+        "converged_nodes": converged,
+        "sent": sent,
+        "received": received,
+        "send_failures": sum(part["send_failures"] for part in parts),
+        "delivery_rate": round(received / sent, 5) if sent else None,
+        "chats_per_s": round(sent / cfg["duration"], 1),
+        "latency": summary,
+        "cpu_ms_per_node_s": round(sum(part["cpu_load_s"] for part in parts) * 1000 / n / cfg["duration"], 3),
+        "cpu_total_s": round(sum(part["cpu_total_s"] for part in parts), 3),
+        "rss_kb_per_node": round(sum(part["rss_growth_kb"] for part in parts) / n, 1),
+        "rss_kb_total": sum(part["rss_kb"] for part in parts),
+        "bad_packets": sum(part["bad_packets"] for part in parts),
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def compare(results, old, baseline_path):
+    """Prints key metrics next to a previous run's; lower is better except where noted."""
+    rows = [("convergence_s", results["convergence_s"], old.get("convergence_s")),
+            ("delivery_rate (higher)", results["delivery_rate"], old.get("delivery_rate")),
+            ("latency p50 ms", results["latency"].get("p50_ms"), old.get("latency", {}).get("p50_ms")),
+            ("latency p99 ms", results["latency"].get("p99_ms"), old.get("latency", {}).get("p99_ms")),
+            ("cpu ms/node/s", results["cpu_ms_per_node_s"], old.get("cpu_ms_per_node_s")),
+            ("rss KB/node", results["rss_kb_per_node"], old.get("rss_kb_per_node"))]
+    print(f"--- vs. {baseline_path} ---")
+    for label, new, before in rows:
+        change = f"{(new - before) / before * 100:+7.1f}%" if new is not None and before else "      -"
+        print(f"{label:<24} {before if before is not None else '-':>10} -> {new if new is not None else '-':>10} {change}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RoboAir2 swarm benchmark")
+    parser.add_argument("--mode", choices=("async", "threaded"), default="async")
+    parser.add_argument("--nodes", type=int, default=50)
+    parser.add_argument("--procs", type=int, default=1, help="processes to spread the nodes over")
+    parser.add_argument("--heartbeat", type=float, default=roboair2.RoboAir.HEARTBEAT_INTERVAL,
+                        help="seconds between heartbeats")
+    parser.add_argument("--rate", type=float, default=5.0, help="chats per second per node")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds of chat load")
+    parser.add_argument("--settle", type=float, default=1.0, help="seconds to wait for late chats")
+    parser.add_argument("--timeout", type=float, default=30.0, help="give up on convergence after this")
+    parser.add_argument("--label", default=None, help="free text stored with the result (e.g. a version)")
+    parser.add_argument("--out", default=None, help="result file (default air_swarm_<mode>_<nodes>.json)")
+    parser.add_argument("--baseline", default=None, help="earlier result file to compare against")
+    args = parser.parse_args()
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:  # Read first: --out may overwrite it
+            baseline = json.load(f)["results"]
+
+    procs = max(1, min(args.procs, args.nodes))
+    cfg = {"mode": args.mode, "nodes": args.nodes, "procs": procs, "heartbeat": args.heartbeat,
+           "rate": args.rate, "duration": args.duration, "settle": args.settle, "timeout": args.timeout,
+           "tag": f"bench{random.getrandbits(32):08x}"}
+    barrier, results = multiprocessing.Barrier(procs), multiprocessing.Queue()
+    workers = [multiprocessing.Process(target=worker, args=(cfg, list(range(p, args.nodes, procs)), barrier, results))
+               for p in range(procs)]
+    for proc in workers:
+        proc.start()
+    parts = [results.get(timeout=args.timeout + args.duration + args.settle + 60) for _ in workers]
+    for proc in workers:
+        proc.join()
+    summary = aggregate(cfg, parts)
+
+    report = {
+        "benchmark": "air_swarm",
+        "label": args.label,
+        "git": git_revision(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "config": {key: value for key, value in cfg.items() if key != "tag"},
+        "results": summary,
+    }
+    out = args.out or f"air_swarm_{args.mode}_{args.nodes}.json"
+    with open(out, "w") as f:
+        json.dump(report, f, indent=2)
+
+    lat = summary["latency"]
+    print(f"--- RoboAir2 swarm: {args.nodes} {args.mode} nodes in {procs} process(es), "
+          f"{args.rate:g} chats/s/node for {args.duration:g}s ---")
+    print(f"convergence      {summary['convergence_s']} s ({summary['converged_nodes']}/{args.nodes} nodes)")
+    print(f"delivery         {summary['received']}/{summary['sent']} = {summary['delivery_rate']}")
+    if lat.get("count"):
+        print(f"latency ms       p50 {lat['p50_ms']}  p90 {lat['p90_ms']}  p99 {lat['p99_ms']}  "
+              f"p99.9 {lat['p999_ms']}  max {lat['max_ms']}")
+    print(f"cpu              {summary['cpu_ms_per_node_s']} ms per node per second")
+    print(f"memory           {summary['rss_kb_per_node']} KB per node")
+    print(f"[+] Results written to {out}")
+    if baseline is not None:
+        compare(summary, baseline, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
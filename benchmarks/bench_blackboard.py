@@ -0,0 +1,79 @@
+"""
+Contention benchmark: RoboCore's old lock-guarded dict vs. VersionedMemory
+with N reader threads and M writer threads, including write-heavy runs and
+a 1000-key board (a store that copied the board per write would show it).
+
+    python benchmarks/bench_blackboard.py [seconds]
+"""
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blackboard import VersionedMemory
+
+KEYS = [f"sensor{i}" for i in range(16)]
+CASES = ((1, 1, 16), (4, 1, 16), (8, 2, 16), (1, 4, 16), (0, 4, 16), (2, 2, 1000))
+
+
+class LockedDict:
+    """The original write_memory/read_memory: one global lock for everything."""
+
+    def __init__(self):
+        self.memory = {}
+        self.lock = threading.Lock()
+
+    def write(self, key, value):
+        with self.lock:
+            self.memory[key] = value
+
+    def read(self, key, default=None):
+        with self.lock:
+            return self.memory.get(key, default)
+
+
+def run(store, readers, writers, seconds, board=16):
+    written = [f"sensor{i}" for i in range(board)]
+    stop = threading.Event()
+    counts = [0] * (readers + writers)
+
+    def reader(slot):
+        n, keys = 0, KEYS
+        while not stop.is_set():
+            for key in keys:
+                store.read(key)
+            n += len(keys)
+        counts[slot] = n
+
+    def writer(slot):
+        n = 0
+        while not stop.is_set():
+            store.write(written[n % board], n)
+            n += 1
+        counts[slot] = n
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads += [threading.Thread(target=writer, args=(readers + i,)) for i in range(writers)]
+    for key in written:
+        store.write(key, 0)
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    return sum(counts[:readers]) / seconds, sum(counts[readers:]) / seconds
+
+
+def main(seconds=1.0):
+    print(f"--- blackboard contention, {seconds:.1f}s per run ---")
+    print(f"{'R':>3} {'W':>3} {'keys':>5} {'store':<16} {'reads/s':>12} {'writes/s':>12}")
+    for readers, writers, board in CASES:
+        for label, factory in (("lock + dict", LockedDict), ("VersionedMemory", VersionedMemory)):
+            reads, writes = run(factory(), readers, writers, seconds, board)
+            print(f"{readers:>3} {writers:>3} {board:>5} {label:<16} {reads:12.0f} {writes:12.0f}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 1.0)
@@ -0,0 +1,96 @@
+"""
+Benchmark: RoboAir2's old peer dict (rewritten per heartbeat, scanned under
+the lock every 5 s) vs. PeerTable, with 10k simulated peers on a virtual
+clock. Reports heartbeat cost, sweep cost and how late expiry happens.
+
+    python benchmarks/bench_peer_table.py [peers]
+"""
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from peer_table import PeerTable
+
+TIMEOUT = 15.0
+HEARTBEAT = 5.0
+SWEEP = 5.0
+
+
+class LegacyPeers:
+    """The original self.peers handling from RoboAir2._listen / _cleanup_peers."""
+
+    def __init__(self):
+        self.peers = {}
+        self.lock = threading.Lock()
+
+    def touch(self, ip, name, now):
+        with self.lock:
+            self.peers[ip] = {"name": name, "last_seen": now}
+
+    def expire(self, now):
+        with self.lock:
+            expired = [ip for ip, info in self.peers.items() if now - info['last_seen'] > TIMEOUT]
+            for ip in expired:
+                del self.peers[ip]
+        return expired
+
+
+def per_call(fn, calls):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main(n=10000):
+    ips = [f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in range(n)]
+    names = [f"Robot-{i}" for i in range(n)]
+    print(f"--- peer table, {n} peers ---")
+
+    legacy, table = LegacyPeers(), PeerTable(timeout=TIMEOUT)
+    for i in range(n):
+        legacy.touch(ips[i], names[i], 0.0)
+        table.touch(i, names[i], ips[i], "binary", 0.0)
+
+    rounds = 5
+    def legacy_beats():
+        for r in range(rounds):
+            for i in range(n):
+                legacy.touch(ips[i], names[i], 1.0 + r)
+    def table_beats():
+        for r in range(rounds):
+            for i in range(n):
+                table.touch(i, names[i], ips[i], "binary", 1.0 + r)
+    print(f"{'heartbeat us':<16} legacy {per_call(legacy_beats, rounds * n):8.3f}   table {per_call(table_beats, rounds * n):8.3f}")
+
+    # Sweep while nobody is due: the common case
+    print(f"{'idle sweep us':<16} legacy {per_call(lambda: legacy.expire(6.0), 1):8.1f}   "
+          f"table {per_call(lambda: table.expire(6.0), 1):8.1f}")
+
+    # Expiry lateness: each peer goes silent at a random time; legacy notices at the
+    # next 5 s sweep, the table's timer sleeps until the heap's next deadline.
+    rng = random.Random(1)
+    legacy, table = LegacyPeers(), PeerTable(timeout=TIMEOUT)
+    died = {}
+    for i in range(n):
+        last = rng.uniform(0, 60)
+        died[i] = last
+        legacy.touch(i, names[i], last)
+        table.touch(i, names[i], ips[i], "binary", last)
+    late_legacy, late_table, now = [], [], 0.0
+    while now < 60 + TIMEOUT + SWEEP:
+        now += SWEEP
+        late_legacy += [now - (died[i] + TIMEOUT) for i in legacy.expire(now)]
+    now = 0.0
+    while len(table):
+        now = max(now, table.next_deadline())
+        late_table += [now - (died[r.key] + TIMEOUT) for r in table.expire(now)]
+    for label, late in (("legacy", late_legacy), ("table", late_table)):
+        late.sort()
+        print(f"{'expiry late s':<16} {label:<6} mean {sum(late) / len(late):6.3f}  max {late[-1]:6.3f}  ({len(late)} peers)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,85 @@
+"""
+Benchmark: RoboAir transmit cost, socket-per-message (the old broadcast /
+_send_raw) vs. DatagramSender's persistent socket, one datagram per message
+(RoboAir v1, whose receivers cannot unpack batches) and batched. Sends
+heartbeat-sized JSON to a loopback receiver, as 50 swarm peers would,
+and reports sender CPU per message and datagrams on the wire.
+
+    python benchmarks/bench_roboair_send.py [messages]
+"""
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from air_sender import DatagramSender
+
+PEERS = 50
+
+
+def receiver(sock, counts, stop):
+    sock.settimeout(0.1)
+    while not stop.is_set():
+        try:
+            data, _ = sock.recvfrom(65535)
+        except socket.timeout:
+            continue
+        counts[0] += 1
+        counts[1] += len(DatagramSender.unpack(data))
+
+
+def legacy_send(data, addr):
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        s.sendto(data, addr)
+
+
+def run(label, messages):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 << 20)
+    sock.bind(("127.0.0.1", 0))
+    addr = sock.getsockname()
+    counts, stop = [0, 0], threading.Event()
+    thread = threading.Thread(target=receiver, args=(sock, counts, stop), daemon=True)
+    thread.start()
+    packets = [json.dumps({"id": f"Robot-{i}-host", "name": f"Robot-{i}", "type": "heartbeat"}).encode()
+               for i in range(PEERS)]
+
+    sender = DatagramSender() if label != "per-message" else None
+    batch = label == "batched"
+    cpu = time.process_time()
+    for i in range(messages):
+        if sender:
+            sender.send(packets[i % PEERS], addr, batch=batch)
+            if i % 500 == 499:
+                time.sleep(0.005)  # Heartbeats arrive in bursts, not one endless stream
+        else:
+            legacy_send(packets[i % PEERS], addr)
+    if sender:
+        sender.flush(5.0)
+    cpu = time.process_time() - cpu
+    time.sleep(0.3)
+    stop.set()
+    thread.join()
+    dropped = 0
+    if sender:
+        sender.close()
+        dropped = sender.dropped
+    sock.close()
+    # process_time covers the receiver thread too; it is the same work in both runs
+    print(f"{label:<12} {cpu / messages * 1e6:10.2f} {counts[0]:>10} {counts[1]:>10} {dropped:>8}")
+
+
+def main(messages=20000):
+    print(f"--- RoboAir send path, {messages} heartbeats from {PEERS} peers ---")
+    print(f"{'mode':<12} {'cpu us/msg':>10} {'datagrams':>10} {'received':>10} {'dropped':>8}")
+    run("per-message", messages)
+    run("unbatched", messages)
+    run("batched", messages)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
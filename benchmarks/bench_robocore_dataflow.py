@@ -0,0 +1,62 @@
+"""
+Benchmark: the robocore.py example pipeline (sensor every 0.5 s, actuator
+reacting to `distance`), polled vs. triggered by the dataflow graph.
+Reports actuator runs, runs that saw no new data, and sensor -> actuator
+latency.
+
+    python benchmarks/bench_robocore_dataflow.py [seconds]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _scripts import load_script
+
+RoboCore = load_script("robocore").RoboCore
+
+
+def run(triggered, seconds, sensor_interval=0.5, poll_interval=0.1):
+    core = RoboCore()
+    core.log = lambda message: None
+    runs, wasted, latencies, last = [0], [0], [], [None]
+
+    def lora_sensor():
+        core.write_memory("distance", time.monotonic())
+
+    def motor_controller():
+        runs[0] += 1
+        stamp = core.read_memory("distance")
+        if stamp is None or stamp == last[0]:
+            wasted[0] += 1
+            return
+        latencies.append((time.monotonic() - stamp) * 1000)
+        last[0] = stamp
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        core.add_task("Eye", lora_sensor, sensor_interval, produces=["distance"])
+        if triggered:
+            core.add_task("Legs", motor_controller, consumes=["distance"], min_interval=poll_interval)
+        else:
+            core.add_task("Legs", motor_controller, poll_interval)
+        core.start()
+        time.sleep(seconds)
+        core.stop()
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] if latencies else float("nan")
+    worst = latencies[-1] if latencies else float("nan")
+    return runs[0], wasted[0], p50, worst
+
+
+def main(seconds=5.0):
+    print(f"--- RoboCore dataflow, {seconds:.0f}s per run ---")
+    print(f"{'mode':<10} {'runs':>6} {'wasted':>7} {'p50 ms':>8} {'max ms':>8}")
+    for label, triggered in (("polling", False), ("dataflow", True)):
+        runs, wasted, p50, worst = run(triggered, seconds)
+        print(f"{label:<10} {runs:>6} {wasted:>7} {p50:8.2f} {worst:8.2f}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 5.0)
@@ -0,0 +1,73 @@
+"""
+Benchmark: RoboCore scheduler CPU use and dispatch jitter for 10..10,000 tasks,
+against a replica of the old 5 ms busy-poll loop.
+
+    python benchmarks/bench_robocore_scheduler.py [seconds]
+"""
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _scripts import load_script
+
+RoboCore = load_script("robocore").RoboCore
+
+
+class LegacyCore(RoboCore):
+    """The pre-heap _run_loop: scan every task every 5 ms."""
+
+    def _run_loop(self):
+        while self.running:
+            for name, task in list(self.tasks.items()):
+                if time.time() - task['last'] >= task['int']:
+                    t = threading.Thread(target=task['func'])
+                    t.daemon = True
+                    t.start()
+                    task['last'] = time.time()
+                    task['count'] += 1
+            time.sleep(0.005)
+
+
+def run(core_class, n_tasks, seconds):
+    # Room for every task in the worker queue, so runs are late rather than dropped
+    core = core_class(max_queue=max(256, n_tasks))
+    core.log = lambda message: None
+    lateness = []
+    interval = max(1.0, n_tasks / 2000.0)  # Keep the dispatch rate (and thread churn) bounded
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(n_tasks):
+            # Jitter = distance between a run and one interval after the previous run
+            def task(expected=[None]):
+                now = time.monotonic()
+                if expected[0] is not None:
+                    lateness.append(abs(now - expected[0]))
+                expected[0] = now + interval
+            core.add_task(f"t{i}", task, interval)
+    seconds = max(seconds, 2.5 * interval)  # At least two runs per task
+    cpu0, wall0 = time.process_time(), time.monotonic()
+    core.start()
+    time.sleep(seconds)
+    core.stop()
+    cpu = time.process_time() - cpu0
+    wall = time.monotonic() - wall0
+    lateness.sort()
+    p50 = lateness[len(lateness) // 2] * 1e3 if lateness else float("nan")
+    p99 = lateness[int(len(lateness) * 0.99)] * 1e3 if lateness else float("nan")
+    return cpu / wall * 100, p50, p99, len(lateness)
+
+
+def main(seconds=3.0):
+    print(f"--- RoboCore scheduler, >= {seconds:.0f}s per run (CPU includes task threads) ---")
+    print(f"{'tasks':>6} {'loop':<7} {'CPU %':>7} {'jitter p50':>11} {'p99':>9} {'samples':>8}")
+    for n_tasks in (0, 10, 100, 1000, 10000):
+        for label, core_class in (("legacy", LegacyCore), ("heap", RoboCore)):
+            cpu, p50, p99, samples = run(core_class, n_tasks, seconds)
+            print(f"{n_tasks:>6} {label:<7} {cpu:7.1f} {p50:9.2f}ms {p99:7.2f}ms {samples:8d}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 3.0)
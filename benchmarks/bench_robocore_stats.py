@@ -0,0 +1,53 @@
+"""
+Benchmark: cost of RoboCore's per-run instrumentation (lateness and
+duration histograms, queue depth) on the dispatch path, against the same
+path with the recording stripped out.
+
+    python benchmarks/bench_robocore_stats.py [runs]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _scripts import load_script
+
+RoboCore = load_script("robocore").RoboCore
+
+
+class UninstrumentedCore(RoboCore):
+    """_execute_task as it was before stats(): no clocks, no histograms."""
+
+    def _execute_task(self, name, task, scheduled=None):
+        try:
+            task['func']()
+        except Exception as e:
+            self.log(f"Critical Error in task '{name}': {e}")
+        finally:
+            self._finished(name, task)
+
+
+def per_run(core_class, runs):
+    """Microseconds per dispatch + execution of a no-op task, on the caller's thread."""
+    core = core_class()
+    core.log = lambda message: None
+    core.add_task("noop", lambda: None, 1.0)
+    task = core.tasks["noop"]
+    core.pool.submit = lambda fn, *args: fn(*args) or True  # Run inline: measure our code, not the queue
+    start = time.perf_counter()
+    for _ in range(runs):
+        core._dispatch("noop", task, False, time.monotonic())
+    return (time.perf_counter() - start) / runs * 1e6
+
+
+def main(runs=200000):
+    print(f"--- RoboCore instrumentation overhead, {runs} runs ---")
+    plain = per_run(UninstrumentedCore, runs)
+    instrumented = per_run(RoboCore, runs)
+    print(f"{'uninstrumented':<16} {plain:8.2f} us/run")
+    print(f"{'instrumented':<16} {instrumented:8.2f} us/run")
+    print(f"{'overhead':<16} {instrumented - plain:8.2f} us/run")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
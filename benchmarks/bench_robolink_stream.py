@@ -0,0 +1,162 @@
+"""
+Benchmark: RoboLink's serial receive path against a pty-backed fake
+microcontroller streaming telemetry at a 1 Mbaud budget (~100 KB/s).
+
+  legacy  RoboLink v1.5's loop: sleep 10 ms, check in_waiting, readline()
+          with the shared lock held (a sender thread measures how long
+          send() waits for that lock)
+  stream  drain everything waiting into FrameDecoder's reusable buffer
+
+The text run sends newline telemetry only (all the legacy loop can
+parse); the mixed run interleaves CRC-framed binary sensor batches.
+When pyserial is installed, RoboLink itself is also run end to end on
+the pty (the slave side looks like any serial port).
+
+    python benchmarks/bench_robolink_stream.py [seconds]
+"""
+import fcntl
+import os
+import pty
+import struct
+import sys
+import termios
+import threading
+import time
+import tty
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _scripts import load_script
+from link_framer import FrameDecoder
+
+BAUD_BYTES = 100000  # 1 Mbaud, 8N1
+
+
+class FakeDevice:
+    """Writes telemetry into the pty master at the baud budget; swallows commands sent to it."""
+
+    def __init__(self, mixed):
+        self.master, self.slave = pty.openpty()
+        tty.setraw(self.slave)  # No line discipline: bytes arrive as written
+        self.mixed = mixed
+        self.sent_lines = self.sent_frames = self.sent_bytes = 0
+        self.running = True
+
+    def message(self, i):
+        if self.mixed and i % 2:
+            self.sent_frames += 1
+            return FrameDecoder.encode(struct.pack("<I12h", i, *range(12)))  # IMU batch
+        self.sent_lines += 1
+        return f"T:{i} ax=0.12 ay=-0.03 az=9.81 bat=81\n".encode()
+
+    def run(self, seconds):
+        threading.Thread(target=self._drain, daemon=True).start()
+        start, i, chunk = time.perf_counter(), 0, bytearray()
+        while time.perf_counter() - start < seconds:
+            # Pace to the baud budget in 1 ms slices
+            budget = int((time.perf_counter() - start) * BAUD_BYTES) - self.sent_bytes
+            while len(chunk) < budget:
+                chunk += self.message(i)
+                i += 1
+            if chunk:
+                written = os.write(self.master, chunk)  # Blocks when the reader falls behind
+                self.sent_bytes += written
+                del chunk[:written]
+            time.sleep(0.001)
+        self.elapsed = time.perf_counter() - start
+        self.running = False
+
+    def _drain(self):
+        while self.running:
+            try:
+                os.read(self.master, 4096)
+            except OSError:
+                return
+
+
+def in_waiting(fd):
+    return struct.unpack("I", fcntl.ioctl(fd, termios.FIONREAD, b"\0\0\0\0"))[0]
+
+
+def legacy_reader(dev, stop, counts, lock):
+    f = os.fdopen(os.dup(dev.slave), "rb")
+    while not stop.is_set():
+        if in_waiting(dev.slave) > 0:
+            with lock:
+                line = f.readline().decode('utf-8', errors='ignore').rstrip()
+                if line:
+                    counts["lines"] += 1
+        time.sleep(0.01)
+
+
+def stream_reader(dev, stop, counts, lock):
+    f = os.fdopen(os.dup(dev.slave), "rb", buffering=0)
+    decoder = FrameDecoder()
+    while not stop.is_set():
+        space = decoder.writable()
+        count = f.readinto(space[:max(1, min(in_waiting(dev.slave), len(space)))])
+        for kind, _ in decoder.commit(count):
+            counts["lines" if kind == "line" else "frames"] += 1
+    counts["crc_errors"] = decoder.crc_errors
+
+
+def sender(dev, stop, lock, waits):
+    while not stop.is_set():
+        start = time.perf_counter()
+        with lock:
+            waits.append(time.perf_counter() - start)
+            os.write(dev.slave, b"GET_SENSORS\n")
+        time.sleep(0.01)
+
+
+def run(label, reader, mixed, seconds):
+    dev = FakeDevice(mixed)
+    stop, lock = threading.Event(), threading.Lock()
+    counts, waits = {"lines": 0, "frames": 0}, []
+    threads = [threading.Thread(target=reader, args=(dev, stop, counts, lock), daemon=True),
+               threading.Thread(target=sender, args=(dev, stop, lock, waits), daemon=True)]
+    for t in threads:
+        t.start()
+    cpu = time.process_time()
+    dev.run(seconds)
+    time.sleep(0.2)
+    stop.set()
+    cpu = time.process_time() - cpu
+    got, sent = counts["lines"] + counts["frames"], dev.sent_lines + dev.sent_frames
+    print(f"{label:<8} {'mixed' if mixed else 'text':<6} {dev.sent_bytes / dev.elapsed / 1000:9.1f} "
+          f"{got:>8}/{sent:<8} {cpu / dev.elapsed * 100:6.1f}% {max(waits) * 1000:10.2f}")
+
+
+def run_robolink(seconds):
+    try:
+        RoboLink = load_script("robolink").RoboLink
+    except ImportError as e:
+        print(f"[!] RoboLink end-to-end run skipped: {e}")
+        return
+    dev = FakeDevice(mixed=True)
+    link = RoboLink(port=os.ttyname(dev.slave), baudrate=1000000, timeout=0.1)
+    link.log = lambda message: None
+    counts = {"lines": 0, "frames": 0}
+    link.on_line = lambda line: counts.__setitem__("lines", counts["lines"] + 1)
+    link.on_frame = lambda frame: counts.__setitem__("frames", counts["frames"] + 1)
+    if not link.connect():
+        print("[!] RoboLink could not open the pty")
+        return
+    dev.run(seconds)
+    time.sleep(0.2)
+    link.disconnect()
+    print(f"{'RoboLink':<8} {'mixed':<6} {dev.sent_bytes / dev.elapsed / 1000:9.1f} "
+          f"{counts['lines'] + counts['frames']:>8}/{dev.sent_lines + dev.sent_frames:<8}")
+
+
+def main(seconds=3.0):
+    print(f"--- serial receive path, fake device on a pty, {BAUD_BYTES // 1000} KB/s budget ---")
+    print(f"{'reader':<8} {'stream':<6} {'KB/s':>9} {'received/sent':>17} {'cpu':>7} {'send wait ms':>12}")
+    run("legacy", legacy_reader, False, seconds)
+    run("stream", stream_reader, False, seconds)
+    run("stream", stream_reader, True, seconds)
+    run_robolink(seconds)
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 3.0)
@@ -0,0 +1,89 @@
+"""
+Cross-process blackboard: SharedBlackboard (shared memory + seqlocks) vs. a
+multiprocessing.Manager dict (one proxy round-trip per access).
+
+A writer process publishes a monotonic timestamp; the parent reads it back.
+Reports read throughput and write -> visible latency (time.monotonic is
+system-wide, so both processes share a clock).
+
+    python benchmarks/bench_shared_blackboard.py [writes]
+"""
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared_blackboard import SharedBlackboard
+
+SCHEMA = {"stamp": "d", "pose": ("d", 3)}
+
+
+def shm_writer(name, writes, interval):
+    board = SharedBlackboard.attach(name, SCHEMA)
+    for i in range(writes):
+        board.write_many({"pose": (i, i, i), "stamp": time.monotonic()})
+        time.sleep(interval)
+    board.close()
+
+
+def manager_writer(store, writes, interval):
+    for i in range(writes):
+        store["pose"] = (i, i, i)
+        store["stamp"] = time.monotonic()
+        time.sleep(interval)
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))] if values else float("nan")
+
+
+def follow(read, writes, interval):
+    """Spins on read() until the writer is done; returns (reads/s, latencies in us)."""
+    latencies, last, reads = [], None, 0
+    start = time.monotonic()
+    deadline = start + writes * interval + 2.0
+    while len(latencies) < writes and time.monotonic() < deadline:
+        stamp = read()
+        reads += 1
+        if stamp is not None and stamp != last:
+            latencies.append((time.monotonic() - stamp) * 1e6)
+            last = stamp
+    return reads / (time.monotonic() - start), latencies
+
+
+def report(label, reads_per_s, latencies, writes):
+    print(f"{label:<18} {reads_per_s:12.0f} {len(latencies):>5}/{writes:<5} "
+          f"{percentile(latencies, 0.5):9.1f} {percentile(latencies, 0.99):9.1f}")
+
+
+def main(writes=500, interval=0.002):
+    print(f"--- cross-process blackboard, {writes} writes every {interval * 1000:.0f} ms ---")
+    print(f"{'store':<18} {'reads/s':>12} {'seen':>11} {'p50 us':>9} {'p99 us':>9}")
+
+    board = SharedBlackboard(SCHEMA)
+    try:
+        proc = multiprocessing.Process(target=shm_writer, args=(board.name, writes, interval))
+        proc.start()
+        reads, latencies = follow(lambda: board.read("stamp"), writes, interval)
+        proc.join()
+        report("SharedBlackboard", reads, latencies, writes)
+        # "seen" counts distinct stamps the polling reader caught (writes that land
+        # between two of its reads coalesce); the version counter must still be exact
+        print(f"[{'+' if board.version == writes else '!'}] version counter {board.version}/{writes}")
+    finally:
+        board.close()
+        board.unlink()
+
+    with multiprocessing.Manager() as manager:
+        store = manager.dict()
+        proc = multiprocessing.Process(target=manager_writer, args=(store, writes, interval))
+        proc.start()
+        reads, latencies = follow(lambda: store.get("stamp"), writes, interval)
+        proc.join()
+        report("Manager().dict()", reads, latencies, writes)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
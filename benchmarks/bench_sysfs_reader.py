@@ -0,0 +1,61 @@
+"""
+Microbenchmark: open-per-read sysfs polling vs. the persistent SysfsReader.
+Runs against fake sysfs attribute files in a temporary directory.
+
+    python benchmarks/bench_sysfs_reader.py [iterations]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sysfs_reader import SysfsReader
+
+
+def legacy_read(path):
+    # The original DroidSense path: open, read, close on every call
+    with open(path, "r") as f:
+        return int(f.read().strip())
+
+
+def timed(label, fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    for _ in range(1000):
+        fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<34} {elapsed / iterations * 1e6:8.2f} us/tick   peak alloc {peak:6d} B")
+    return elapsed
+
+
+def main(iterations=100000):
+    with tempfile.TemporaryDirectory() as root:
+        temp_path = os.path.join(root, "temp")
+        bat_path = os.path.join(root, "capacity")
+        with open(temp_path, "w") as f:
+            f.write("41500\n")
+        with open(bat_path, "w") as f:
+            f.write("87\n")
+
+        print(f"--- sysfs polling, {iterations} ticks (temp + battery per tick) ---")
+        base = timed("open/read/close per attribute",
+                     lambda: (legacy_read(temp_path), legacy_read(bat_path)), iterations)
+
+        with SysfsReader({"temp": temp_path, "battery": bat_path}) as reader:
+            single = timed("SysfsReader.read_int x2",
+                           lambda: (reader.read_int("temp"), reader.read_int("battery")), iterations)
+            names = ("temp", "battery")
+            batched = timed("SysfsReader.read_many",
+                            lambda: reader.read_many(names), iterations)
+
+        print(f"speedup: read_int {base / single:.1f}x | read_many {base / batched:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
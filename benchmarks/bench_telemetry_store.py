@@ -0,0 +1,51 @@
+"""
+Benchmark: TelemetryStore ingest rate, disk footprint and dashboard query latency
+for simulated 1 Hz telemetry (temperature, battery, motion).
+
+    python benchmarks/bench_telemetry_store.py [days]
+"""
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from telemetry_store import TelemetryStore
+
+
+def main(days=14):
+    random.seed(1)
+    seconds = int(days * 86400)
+    start_ts = 1_700_000_000
+    with tempfile.TemporaryDirectory() as root:
+        store = TelemetryStore(os.path.join(root, "telemetry"))
+        start = time.perf_counter()
+        battery = 100.0
+        for i in range(seconds):
+            temp = 38 + 4 * math.sin(i / 3600.0) + random.random() * 0.3
+            battery = battery - 0.001 if battery > 5 else 100.0
+            store.record(start_ts + i, temp=temp, battery=int(battery),
+                         motion=random.random() * 0.05)
+        store.flush()
+        ingest = time.perf_counter() - start
+        print(f"--- {days} days at 1 Hz, 3 series ({seconds * 3} samples) ---")
+        print(f"ingest            {seconds / ingest:10.0f} ticks/s")
+        print(f"disk usage        {store.disk_usage() / 1e6:10.2f} MB")
+
+        end_ts = start_ts + seconds
+        for label, span, resolution in (("last hour, 1m", 3600, "1m"),
+                                        ("last day, 1m", 86400, "1m"),
+                                        ("last week, 1h", 7 * 86400, "1h")):
+            runs = 200
+            start = time.perf_counter()
+            for _ in range(runs):
+                windows = store.query("temp", end_ts - span, end_ts, resolution)
+            elapsed = (time.perf_counter() - start) / runs
+            print(f"query {label:<14} {elapsed * 1e3:8.3f} ms  ({len(windows)} windows)")
+        store.close()
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 14)
@@ -0,0 +1,62 @@
+"""
+Benchmark: the old JSON rewrite in _save_trauma vs. the append-only TraumaJournal.
+Writes the same events through both paths into a temporary directory.
+
+    python benchmarks/bench_trauma_journal.py [events]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from trauma_journal import TraumaJournal
+
+
+def legacy_path(path, events):
+    # The original _save_trauma: unbounded list + full rewrite of the last 100
+    history = []
+    written = 0
+    for i in range(events):
+        history.append({
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "type": "OVERHEAT",
+            "value": 45.0 + (i % 7) * 0.1,
+            "battery_at_time": 80,
+        })
+        with open(path, "w") as f:
+            json.dump(history[-100:], f, indent=4)
+        written += os.path.getsize(path)
+    return written
+
+
+def journal_path(path, events):
+    with TraumaJournal(path, max_records=10000) as journal:
+        for i in range(events):
+            journal.append("OVERHEAT", 45.0 + (i % 7) * 0.1, 80)
+        tail = journal.tail(100)
+    assert len(tail) == 100
+    return events * TraumaJournal.RECORD.size
+
+
+def main(events=100000):
+    with tempfile.TemporaryDirectory() as root:
+        print(f"--- {events} trauma events ---")
+        start = time.perf_counter()
+        legacy_bytes = legacy_path(os.path.join(root, "system_trauma.json"), events)
+        legacy = time.perf_counter() - start
+        print(f"JSON rewrite      {legacy:8.2f} s  {legacy / events * 1e6:8.1f} us/event  "
+              f"{legacy_bytes / 1e6:9.1f} MB written")
+
+        start = time.perf_counter()
+        journal_bytes = journal_path(os.path.join(root, "system_trauma.journal"), events)
+        journal = time.perf_counter() - start
+        print(f"TraumaJournal     {journal:8.2f} s  {journal / events * 1e6:8.1f} us/event  "
+              f"{journal_bytes / 1e6:9.1f} MB written (+ compactions)")
+        print(f"speedup: {legacy / journal:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,113 @@
+"""
+Mixed-version RoboAir2 interoperability check over loopback.
+
+Three nodes on 127.0.0.2-4: two current nodes and a replica of a legacy
+(JSON-only, v2.0) node. After they introduce themselves, the two current
+nodes should talk binary to each other and JSON to the legacy one, and
+every chat should arrive. Exits non-zero on failure.
+
+    python benchmarks/demo_air_interop.py
+"""
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _scripts import load_script
+
+RoboAir = load_script("roboair2").RoboAir
+PORT = 5740
+
+
+class LegacyNode:
+    """The RoboAir v2.0 wire behaviour: one JSON document per datagram, no 'fmt'."""
+
+    def __init__(self, host, port, node_name):
+        self.host, self.port, self.node_name = host, port, node_name
+        self.node_id = f"{node_name}-{socket.gethostname()}"
+        self.inbox, self.peers = [], {}
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((host, port))
+        self.sock.settimeout(0.1)
+        self.running = True
+        threading.Thread(target=self._listen, daemon=True).start()
+
+    def _listen(self):
+        while self.running:
+            try:
+                data, addr = self.sock.recvfrom(2048)
+                payload = json.loads(data.decode('utf-8'))
+            except Exception:
+                continue
+            self.peers[addr[0]] = payload.get("name")
+            if payload["type"] == "chat":
+                self.inbox.append(payload["data"])
+
+    def send(self, packet_type, target_ip, data=None):
+        packet = {"id": self.node_id, "name": self.node_name, "type": packet_type}
+        if data is not None:
+            packet["data"] = data
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.bind((self.host, 0))
+            s.sendto(json.dumps(packet).encode('utf-8'), (target_ip, self.port))
+
+    def stop(self):
+        self.running = False
+        self.sock.close()
+
+
+def main():
+    hosts = {"alpha": "127.0.0.2", "beta": "127.0.0.3", "legacy": "127.0.0.4"}
+    alpha = RoboAir(PORT, "alpha", host=hosts["alpha"])
+    beta = RoboAir(PORT, "beta", host=hosts["beta"])
+    for node in (alpha, beta):
+        node.log = node.printer.print = lambda message: None
+        node.start()
+    legacy = LegacyNode(hosts["legacy"], PORT, "legacy")
+    try:
+        # Introductions: JSON heartbeats carry each node's format
+        for node in (alpha, beta):
+            for name, ip in hosts.items():
+                if ip != node.host:
+                    node.announce(ip)
+        legacy.send("heartbeat", hosts["alpha"])
+        legacy.send("heartbeat", hosts["beta"])
+        time.sleep(0.3)
+
+        messages = 20
+        for i in range(messages):
+            alpha.send_message(f"a->b {i}", hosts["beta"])
+            alpha.send_message(f"a->l {i}", hosts["legacy"])
+            beta.send_message(f"b->a {i}", hosts["alpha"])
+            legacy.send("chat", hosts["alpha"], f"l->a {i}")
+        time.sleep(0.5)
+
+        checks = [
+            ("alpha speaks binary to beta", alpha.peer_format(hosts["beta"]) == "binary"),
+            ("beta speaks binary to alpha", beta.peer_format(hosts["alpha"]) == "binary"),
+            ("alpha speaks JSON to legacy", alpha.peer_format(hosts["legacy"]) == "json"),
+            ("alpha broadcasts JSON (a legacy peer is present)", alpha.peer_format("255.255.255.255") == "json"),
+            ("beta got every chat from alpha", len(beta.get_inbox(hosts["alpha"])) == messages),
+            ("alpha got every chat from beta", len(alpha.get_inbox(hosts["beta"])) == messages),
+            ("alpha got every chat from legacy", len(alpha.get_inbox(hosts["legacy"])) == messages),
+            ("legacy got every chat from alpha", sum(m.startswith("a->l") for m in legacy.inbox) == messages),
+            ("legacy lists alpha as a peer", legacy.peers.get(hosts["alpha"]) == "alpha"),
+        ]
+    finally:
+        alpha.stop()
+        beta.stop()
+        legacy.stop()
+
+    failed = 0
+    for label, ok in checks:
+        print(f"[{'+' if ok else '!'}] {label}")
+        failed += not ok
+    print(f"--- {len(checks) - failed}/{len(checks)} interop checks passed ---")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
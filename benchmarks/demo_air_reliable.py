@@ -0,0 +1,86 @@
+"""
+RoboAir2 reliable delivery over a deliberately bad loopback link.
+
+Two nodes on 127.0.0.2/3 (ports 5750+, one per profile). Each link profile wraps both nodes'
+senders in a LossyLink (drops, duplicates, jitter, reordering), then alpha
+pushes a burst of small sensor batches and a few configuration blobs to
+beta with send_reliable(). Every payload must arrive intact and in order;
+throughput, retransmissions and the RTT/RTO the channel settled on are
+reported per profile. Exits non-zero on failure.
+
+    python benchmarks/demo_air_reliable.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _scripts import load_script
+from _lossy import LossyLink
+
+RoboAir = load_script("roboair2").RoboAir
+PORT = 5750
+PROFILES = [
+    ("clean", dict(jitter=0)),
+    ("jitter only", dict()),
+    ("5% loss", dict(loss=0.05)),
+    ("10% loss + reorder", dict(loss=0.10, reorder=0.10, duplicate=0.02)),
+    ("25% loss + reorder", dict(loss=0.25, reorder=0.20, duplicate=0.05)),
+]
+
+
+def payloads(seed):
+    small = [f"batch {seed}-{i}: ".encode() + bytes((i * 7 + j) & 255 for j in range(200)) for i in range(200)]
+    blobs = [os.urandom(size) for size in (5000, 64 * 1024, 256 * 1024)]
+    return small + blobs
+
+
+def run(label, link, seed, port):
+    hosts = {"alpha": "127.0.0.2", "beta": "127.0.0.3"}
+    alpha = RoboAir(port, "alpha", host=hosts["alpha"], inbox_size=4096)
+    beta = RoboAir(port, "beta", host=hosts["beta"], inbox_size=4096)
+    for i, node in enumerate((alpha, beta)):
+        node.log = node.printer.print = lambda *args: None
+        node.sender = LossyLink(node.sender, seed=seed + i, **link)
+        node.start()
+    try:
+        deadline = time.time() + 5
+        while alpha.peer_format(hosts["beta"]) != "binary" and time.time() < deadline:
+            alpha.announce(hosts["beta"])  # Introductions may be lost too
+            beta.announce(hosts["alpha"])
+            time.sleep(0.05)
+
+        data = payloads(seed)
+        start = time.perf_counter()
+        transfers = [alpha.send_reliable(payload, hosts["beta"]) for payload in data]
+        delivered = all(t is not None and t.wait(30) for t in transfers)
+        elapsed = time.perf_counter() - start
+        time.sleep(0.05)
+        received = [m["msg"] for m in beta.get_inbox(hosts["alpha"]) if m.get("reliable")]
+        stats = alpha.reliable.stats(hosts["beta"])
+    finally:
+        alpha.stop()
+        beta.stop()
+
+    intact = received == data
+    total = sum(map(len, data))
+    srtt = stats.get("srtt_ms")
+    print(f"{label:<20} {len(received):>4}/{len(data):<4} {'yes' if intact else 'NO':>6} "
+          f"{total / elapsed / 1e6:8.2f} {stats['sent']:>6} {stats['retransmits']:>7} "
+          f"{srtt if srtt is not None else float('nan'):8.2f} {stats.get('rto_ms', float('nan')):8.1f}")
+    return delivered and intact
+
+
+def main():
+    print("--- RoboAir2 reliable channel over a lossy loopback link ---")
+    print(f"{'link':<20} {'received':>9} {'intact':>6} {'MB/s':>8} {'frags':>6} {'resent':>7} "
+          f"{'srtt ms':>8} {'rto ms':>8}")
+    failed = 0
+    for i, (label, link) in enumerate(PROFILES):
+        failed += not run(label, link, i * 10, PORT + i)
+    print(f"--- {len(PROFILES) - failed}/{len(PROFILES)} link profiles delivered everything in order ---")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+RoboAir2 topic pub/sub over loopback multicast.
+
+Six nodes on 127.0.0.2-7 (port 5760, topics on 5761) subscribe to
+different topics; one of them publishes on each. Every subscriber must get
+exactly its topics, and nodes in other groups must not even see the
+traffic. A decoy topic that hashes into the same multicast group as
+"lidar" checks the header filter. Then the cost of rejecting an unwanted
+packet is compared: JSON parse (what every node did per broadcast) vs.
+the topic-hash check. Exits non-zero on failure.
+
+    python benchmarks/demo_air_topics.py
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _scripts import load_script
+
+RoboAir = load_script("roboair2").RoboAir
+BinaryCodec = sys.modules["air_protocol"].BinaryCodec
+PORT = 5760
+SUBSCRIPTIONS = {
+    "pub": [],
+    "scout-1": ["lidar"],
+    "scout-2": ["battery"],
+    "mapper": ["lidar", "battery"],
+    "planner": ["map"],
+    "bystander": [],
+}
+
+
+def decoy_for(topic):
+    """A different topic that lands in the same multicast group."""
+    group = RoboAir.topic_group(topic)
+    for i in range(1 << 20):
+        candidate = f"decoy-{i}"
+        if RoboAir.topic_group(candidate) == group and candidate != topic:
+            return candidate
+
+
+def per_call(fn, calls=200000):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main(messages=50):
+    nodes = {}
+    for i, (name, topics) in enumerate(SUBSCRIPTIONS.items()):
+        node = nodes[name] = RoboAir(PORT, name, host=f"127.0.0.{i + 2}")
+        node.log = node.printer.print = lambda *args: None
+        for topic in topics:
+            node.subscribe(topic)
+        node.start()
+    decoy = decoy_for("lidar")
+    pub = nodes["pub"]
+    try:
+        time.sleep(0.1)
+        for i in range(messages):
+            for topic in ("lidar", "battery", "map", decoy):
+                pub.publish(topic, f"{topic} {i}")
+        time.sleep(0.5)
+        inboxes = {name: node.get_inbox() for name, node in nodes.items()}
+        filtered = {name: node.filtered for name, node in nodes.items()}
+    finally:
+        for node in nodes.values():
+            node.stop()
+
+    print(f"--- topics over multicast, {messages} messages per topic (decoy '{decoy}' shares lidar's group) ---")
+    print(f"{'node':<10} {'subscribed':<16} {'delivered':>9} {'filtered':>9}")
+    checks = []
+    for name, topics in SUBSCRIPTIONS.items():
+        got = {}
+        for message in inboxes[name]:
+            got[message.get("topic")] = got.get(message.get("topic"), 0) + 1
+        print(f"{name:<10} {','.join(topics) or '-':<16} {len(inboxes[name]):>9} {filtered[name]:>9}")
+        checks.append((f"{name} got exactly its topics", got == {topic: messages for topic in topics}))
+    checks.append(("lidar subscribers dropped the decoy by header",
+                   filtered["scout-1"] == messages and filtered["mapper"] == messages))
+    checks.append(("other groups never reached the planner", filtered["planner"] == 0))
+    checks.append(("unsubscribed nodes saw nothing", filtered["bystander"] == 0 and filtered["pub"] == 0))
+
+    # Rejecting one unwanted packet
+    chat = json.dumps({"id": "x-host", "name": "x", "type": "chat", "data": "lidar 0 " * 8}).encode()
+    packet = BinaryCodec.encode("publish", 1, 1, "x", "lidar 0 " * 8, BinaryCodec.node_hash(decoy))
+    subscribed = {BinaryCodec.node_hash("lidar"): "lidar"}
+    print(f"{'reject us':<10} json.loads {per_call(lambda: json.loads(chat)):.3f}   "
+          f"full decode {per_call(lambda: BinaryCodec.decode(packet)):.3f}   "
+          f"topic header {per_call(lambda: BinaryCodec.topic_of(packet) in subscribed):.3f}")
+
+    failed = 0
+    for label, ok in checks:
+        print(f"[{'+' if ok else '!'}] {label}")
+        failed += not ok
+    print(f"--- {len(checks) - failed}/{len(checks)} topic checks passed ---")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Stand-in for `termux-sensor` that emits the same pretty-printed JSON stream,
+so sensor code can run without a phone.
+
+    fake_termux_sensor.py -s accelerometer [-d ms] [-n count] [-c]
+"""
+import argparse
+import json
+import math
+import sys
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-s", dest="sensor", default="accelerometer")
+    parser.add_argument("-d", dest="delay", type=int, default=100)
+    parser.add_argument("-n", dest="count", type=int, default=0)
+    parser.add_argument("-c", dest="cleanup", action="store_true")
+    parser.add_argument("--shake-after", type=int, default=0,
+                        help="start shaking the device after this many samples")
+    args = parser.parse_args()
+    if args.cleanup:
+        return
+
+    name = "Fake LSM6DSO " + args.sensor.capitalize()
+    out = sys.stdout
+    # Like termux-sensor, the stream opens with an empty object
+    out.write("{}\n")
+    i = 0
+    while not args.count or i < args.count:
+        wobble = 0.02 * math.sin(i)
+        if args.shake_after and i >= args.shake_after:
+            wobble = 6.0 * math.sin(i * 1.7)
+        values = [0.05 + wobble, 0.12 - wobble, 9.81 + wobble]
+        out.write(json.dumps({name: {"values": values}}, indent=2) + "\n")
+        out.flush()
+        i += 1
+        if not args.count or i < args.count:
+            time.sleep(args.delay / 1000.0)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except (KeyboardInterrupt, BrokenPipeError):
+        pass
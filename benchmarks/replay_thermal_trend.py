@@ -0,0 +1,83 @@
+"""
+Replay harness for ThermalTrend: feeds recorded temperature traces through
+the estimator and reports how early it warned before the limit was actually
+crossed, plus any warnings on traces that never crossed it.
+
+    python benchmarks/replay_thermal_trend.py                   # built-in synthetic traces
+    python benchmarks/replay_thermal_trend.py trace.csv ...     # CSV rows: timestamp,temp
+    python benchmarks/replay_thermal_trend.py --telemetry DIR   # raw history of a TelemetryStore
+"""
+import csv
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from thermal_trend import ThermalTrend
+
+LIMIT = 42.0
+
+
+def synthetic_traces():
+    random.seed(7)
+    noise = lambda: random.gauss(0, 0.15)
+    return {
+        "idle (no crossing)": [(t, 36 + noise()) for t in range(1800)],
+        "slow climb": [(t, 35 + t * 0.006 + noise()) for t in range(1800)],
+        "game launch": [(t, 36 + (0 if t < 300 else min((t - 300) * 0.05, 9)) + noise())
+                        for t in range(900)],
+        "charge + sun": [(t, 37 + 6 * (1 - math.exp(-t / 600.0)) + noise()) for t in range(2400)],
+        "spike then cool": [(t, 36 + (5 if 200 <= t < 230 else 0) + noise()) for t in range(600)],
+    }
+
+
+def load_csv(path):
+    with open(path, newline="") as f:
+        return [(float(row[0]), float(row[1])) for row in csv.reader(f) if row and row[0][0].isdigit()]
+
+
+def load_telemetry(directory):
+    from telemetry_store import TelemetryStore
+    store = TelemetryStore(directory)
+    samples = store.raw("temp", 0, 2 ** 62)
+    store.close()
+    return {f"telemetry:{directory}": samples}
+
+
+def replay(name, trace):
+    trend = ThermalTrend(LIMIT)
+    warnings, crossed_at = [], None
+    start = time.perf_counter()
+    for timestamp, temp in trace:
+        event = trend.update(timestamp, temp)
+        if event:
+            warnings.append(event)
+        if crossed_at is None and temp > LIMIT:
+            crossed_at = timestamp
+    cost = (time.perf_counter() - start) / max(len(trace), 1)
+
+    if crossed_at is None:
+        verdict = "ok" if not warnings else f"{len(warnings)} false warning(s)"
+    else:
+        early = [w for w in warnings if w["timestamp"] <= crossed_at]
+        verdict = (f"warned {crossed_at - early[0]['timestamp']:.0f}s ahead"
+                   if early else "MISSED (no warning before crossing)")
+    print(f"{name:<24} {len(trace):6d} samples  {cost * 1e6:6.2f} us/update  {verdict}")
+
+
+def main(args):
+    if args[:1] == ["--telemetry"]:
+        traces = load_telemetry(args[1])
+    elif args:
+        traces = {os.path.basename(p): load_csv(p) for p in args}
+    else:
+        traces = synthetic_traces()
+    print(f"--- ThermalTrend replay, limit {LIMIT}°C ---")
+    for name, trace in traces.items():
+        replay(name, trace)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
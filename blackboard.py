@@ -0,0 +1,139 @@
+import threading
+import time
+
+class VersionedMemory:
+    """
+    VersionedMemory v1.1 - Lock-Free-Read Robot Blackboard.
+    Every key carries the version of the write that last changed it.
+    Each key is one immutable (value, version) cell that writers replace
+    in place, so a write costs O(keys written) no matter how big the board
+    is, and single-key reads never take a lock. snapshot() and
+    changed_since() give a consistent view across keys: writers bump a
+    sequence counter around every update (odd while writing), and a
+    reader that overlapped a write simply copies again. Writers serialise
+    among themselves only; a batched write is one version bump.
+    Actuators can wait for new data instead of polling.
+    """
+    def __init__(self, initial=None):
+        self._cells = {key: (value, 1) for key, value in (initial or {}).items()}  # { key: (value, version) }
+        self._version = 1 if self._cells else 0
+        self._seq = 0  # Odd while a write is being applied
+        self._write_lock = threading.Lock()
+        self._changed = threading.Condition(threading.Lock())
+        self._waiting = 0  # Threads inside wait_for(); writers skip the notify when 0
+        self._subscribers = {}  # { key or None: [callback, ...] }; None = every key
+
+    # --- Lock-free reads ---
+    @property
+    def version(self):
+        """Version of the newest write."""
+        return self._version
+
+    def read(self, key, default=None):
+        cell = self._cells.get(key)
+        return default if cell is None else cell[0]
+
+    def read_versioned(self, key, default=None):
+        """(value, version); version is 0 for a key never written."""
+        return self._cells.get(key, (default, 0))
+
+    def _consistent(self):
+        """Copy of all cells taken between writes (dict() runs without releasing the GIL)."""
+        while True:
+            seq = self._seq
+            if not seq & 1:
+                cells = dict(self._cells)
+                if self._seq == seq:
+                    return cells
+            time.sleep(0)  # Let the writer finish
+
+    def snapshot(self, keys=None):
+        """Consistent {key: value} of all (or the given) keys, as of one write."""
+        cells = self._consistent()
+        if keys is None:
+            return {key: cell[0] for key, cell in cells.items()}
+        return {key: cells[key][0] for key in keys if key in cells}
+
+    def changed_since(self, version, keys=None):
+        """Keys (optionally limited to keys) written after version."""
+        cells = self._consistent()
+        names = cells if keys is None else (k for k in keys if k in cells)
+        return [key for key in names if cells[key][1] > version]
+
+    # --- Writes ---
+    def write(self, key, value):
+        """Publishes one key under a new version (write_many() without the batch). Returns that version."""
+        with self._write_lock:
+            version = self._version + 1
+            self._seq += 1
+            self._cells[key] = (value, version)
+            self._version = version
+            self._seq += 1
+        if self._waiting:
+            with self._changed:
+                self._changed.notify_all()
+        if self._subscribers:
+            self._notify({key: value}, version)
+        return version
+
+    def write_many(self, values):
+        """Publishes several keys atomically under one new version. Returns that version."""
+        with self._write_lock:
+            version = self._version + 1
+            cells = self._cells
+            self._seq += 1
+            for key, value in values.items():
+                cells[key] = (value, version)
+            self._version = version
+            self._seq += 1
+        if self._waiting:
+            with self._changed:
+                self._changed.notify_all()
+        if self._subscribers:
+            self._notify(values, version)
+        return version
+
+    # --- Change notification ---
+    def subscribe(self, callback, keys=None):
+        """Calls callback(key, value, version) on the writer's thread when a key changes."""
+        with self._write_lock:
+            subscribers = dict(self._subscribers)
+            for key in (None,) if keys is None else keys:
+                subscribers[key] = subscribers.get(key, []) + [callback]
+            self._subscribers = subscribers
+
+    def unsubscribe(self, callback):
+        with self._write_lock:
+            self._subscribers = {key: [cb for cb in cbs if cb is not callback]
+                                 for key, cbs in self._subscribers.items()}
+
+    def _notify(self, values, version):
+        subscribers = self._subscribers
+        for key, value in values.items():
+            for callback in subscribers.get(key, []) + subscribers.get(None, []):
+                try:
+                    callback(key, value, version)
+                except Exception:
+                    pass
+
+    def wait_for(self, keys=None, since=None, timeout=None):
+        """
+        Blocks until one of keys (any key if None) is written after version
+        `since` (default: now). Returns the list of changed keys, or [] on timeout.
+        """
+        if since is None:
+            since = self.version
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            self._waiting += 1
+            try:
+                while True:
+                    changed = self.changed_since(since, keys)
+                    if changed:
+                        return changed
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return []
+                    self._changed.wait(remaining)
+            finally:
+                self._waiting -= 1
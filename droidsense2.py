@@ -1,7 +1,9 @@
 import os
 import time
-import subprocess
-import json
+from sysfs_reader import SysfsReader
+from sensor_stream import AccelerometerStream
+from motion_window import MotionWindow
+from feedback import FeedbackDispatcher
 
 class DroidSense:
     """
@@ -11,8 +13,18 @@ class DroidSense:
     
     THERMAL_PATH = "/sys/class/thermal/thermal_zone0/temp"
     BATTERY_PATH = "/sys/class/power_supply/battery/capacity"
+    ACCEL_DELAY_MS = 20   # 50 Hz sampling
+    MOTION_WINDOW = 50    # Samples per motion window (1 s at 50 Hz)
 
-    def __init__(self):
+    def __init__(self, accel_command=AccelerometerStream.COMMAND):
+        # All vibrations go through one rate-limited worker
+        self.feedback = FeedbackDispatcher()
+        # One long-lived termux-sensor process instead of a fork per sample
+        self.motion = MotionWindow(self.MOTION_WINDOW)
+        self.accel = AccelerometerStream(delay_ms=self.ACCEL_DELAY_MS, command=accel_command,
+                                         on_sample=self.motion.push)
+        # Descriptors stay open for the lifetime of the object
+        self.sensors = SysfsReader({"temp": self.THERMAL_PATH, "battery": self.BATTERY_PATH})
         self.check_compatibility()
 
     def check_compatibility(self):
@@ -21,56 +33,51 @@ class DroidSense:
 
     def get_temperature(self):
         """Returns the CPU temperature in Celsius."""
-        try:
-            with open(self.THERMAL_PATH, "r") as f:
-                temp = int(f.read().strip())
-                return temp / 1000.0 if temp > 1000 else temp
-        except Exception:
+        return self._to_celsius(self.sensors.read_int("temp"))
+
+    def _to_celsius(self, raw):
+        if raw is None:
             return 0.0
+        return raw / 1000.0 if raw > 1000 else raw
 
     def get_battery(self):
         """Returns the battery percentage."""
-        try:
-            with open(self.BATTERY_PATH, "r") as f:
-                return int(f.read().strip())
-        except Exception:
-            return 0
+        return self.sensors.read_int("battery", 0)
+
+    def read_vitals(self):
+        """Reads temperature and battery in one batched call."""
+        temp, bat = self.sensors.read_many(("temp", "battery"))
+        return self._to_celsius(temp), bat if bat is not None else 0
 
     def trigger_physical_pain(self):
         """Uses Termux-API to vibrate. The hardware's response to trauma."""
-        try:
-            subprocess.run(["termux-vibrate", "-d", "1000"], stderr=subprocess.DEVNULL) 
+        if self.feedback.vibrate(1000):
             print("\n[!] Physical feedback triggered: Vibration")
-        except FileNotFoundError:
-            pass # Termux-API not installed
 
     def get_acceleration(self):
         """Reads accelerometer data to detect if the 'Castle' is moved."""
-        try:
-            # Requires termux-api package
-            result = subprocess.check_output(["termux-sensor", "-n", "1", "-s", "accelerometer"], stderr=subprocess.STDOUT)
-            data = json.loads(result)
-            # Accessing the first sensor reading
-            accel = data.get("accelerometer", {}).get("values", [0, 0, 0])
-            return accel 
-        except Exception:
-            return [0, 0, 0]
+        # Requires termux-api package; (re)starts the stream if it died
+        if not self.accel.running:
+            self.accel.start()
+        return self.accel.latest()
+
+    def get_motion_energy(self):
+        """Windowed motion energy (RMS deviation in m/s^2); ~0 when the device is still."""
+        if not self.accel.running:
+            self.accel.start()
+        return self.motion.energy() if self.motion.count >= 5 else 0.0
 
-    def monitor_survival(self, temp_threshold=42, motion_threshold=15):
+    def monitor_survival(self, temp_threshold=42, motion_threshold=3.0):
         """The main consciousness loop."""
         print("--- DroidSense Guardian Mode Active ---")
         print(f"Thresholds: Temp > {temp_threshold}C | Motion > {motion_threshold}")
         
-        last_accel = self.get_acceleration()
-        
         try:
             while True:
-                temp = self.get_temperature()
-                bat = self.get_battery()
-                current_accel = self.get_acceleration()
+                temp, bat = self.read_vitals()
                 
-                # Calculate movement intensity (Difference between last and current)
-                movement = sum(abs(a - b) for a, b in zip(current_accel, last_accel))
+                # Movement intensity over the last window, not a single noisy delta
+                movement = self.get_motion_energy()
                 
                 status = f"Temp: {temp}°C | Bat: {bat}% | Motion: {movement:.2f}"
                 print(status, end="\r")
@@ -78,21 +85,22 @@ class DroidSense:
                 # 1. Thermal Awareness (The 'Burning' Sensation)
                 if temp > temp_threshold:
                     print(f"\n[ALERT] System is burning! ({temp}°C)")
-                    self.trigger_physical_pain()
-                    time.sleep(1) # Prevent constant vibration
+                    self.trigger_physical_pain() # Rate-limited, no extra sleep needed
 
                 # 2. Motion Awareness (The 'Security' Instinct)
                 if movement > motion_threshold:
                     print(f"\n[SECURITY] Motion detected! The Castle is under movement.")
                     self.trigger_physical_pain()
                 
-                last_accel = current_accel
                 time.sleep(1) # Refresh rate
 
         except KeyboardInterrupt:
             print("\nMonitoring stopped. The Castle is now silent.")
+        finally:
+            self.accel.stop()
+            self.feedback.close(wait=False)
 
 if __name__ == "__main__":
     device = DroidSense()
     # Start the monitoring with default thresholds
-    device.monitor_survival(temp_threshold=43, motion_threshold=12)
+    device.monitor_survival(temp_threshold=43, motion_threshold=2.5)
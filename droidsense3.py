@@ -1,7 +1,16 @@
 import os
 import time
-import subprocess
 import json
+from sysfs_reader import SysfsReader
+from sensor_stream import AccelerometerStream
+from motion_window import MotionWindow
+from feedback import FeedbackDispatcher
+from thermal_zones import ThermalZones
+from trauma_journal import TraumaJournal
+from adaptive_scheduler import AdaptiveScheduler
+from telemetry_store import TelemetryStore
+from thermal_trend import ThermalTrend
+from collections import deque
 from datetime import datetime
 
 class DroidSense:
@@ -10,88 +19,182 @@ class DroidSense:
     A complete physical survival framework for Android-based robotics and independent systems.
     """
     
+    SYSFS_ROOT = "/sys"
     THERMAL_PATH = "/sys/class/thermal/thermal_zone0/temp"
     BATTERY_PATH = "/sys/class/power_supply/battery/capacity"
-    LOG_FILE = "system_trauma.json"
+    ACCEL_DELAY_MS = 20   # 50 Hz sampling
+    MOTION_WINDOW = 50    # Samples per motion window (1 s at 50 Hz)
+    LOG_FILE = "system_trauma.journal"
+    LEGACY_LOG_FILE = "system_trauma.json"
+    TELEMETRY_DIR = "telemetry"
+    HISTORY_SIZE = 100  # Events kept in memory; the journal keeps the rest
+    MAX_POLL_INTERVAL = 10.0  # Longest idle back-off, in seconds
 
-    def __init__(self, owner="Martian"):
+    def __init__(self, owner="Martian", sysfs_root=SYSFS_ROOT, accel_command=AccelerometerStream.COMMAND):
         self.owner = owner
+        self.sysfs_root = sysfs_root
+        self.thermal_path = self._sysfs_path(self.THERMAL_PATH)
+        self.battery_path = self._sysfs_path(self.BATTERY_PATH)
         self.start_time = time.time()
-        self.trauma_history = []
+        self.trauma_history = deque(maxlen=self.HISTORY_SIZE)
+        self.journal = None
         self.is_healthy = True
+        # All vibrations go through one rate-limited worker
+        self.feedback = FeedbackDispatcher()
+        # One long-lived termux-sensor process instead of a fork per sample
+        self.motion = MotionWindow(self.MOTION_WINDOW)
+        self.on_heat_warning = None  # Optional callback(event) to shed load before throttling
+        self.trend = None
+        self.motion_limit = None  # Set while the survival loop runs; motion above it wakes the loop
+        self._moving = False
+        self.scheduler = AdaptiveScheduler(max_interval=self.MAX_POLL_INTERVAL)
+        self.accel = AccelerometerStream(delay_ms=self.ACCEL_DELAY_MS, command=accel_command,
+                                         on_sample=self._on_accel_sample)
+        # Descriptors stay open for the lifetime of the object
+        self.sensors = SysfsReader({"temp": self.thermal_path, "battery": self.battery_path})
+        # Zone index is built once; every tick reads all zones in one snapshot
+        self.thermal = ThermalZones(sysfs_root)
         self.check_compatibility()
         self._load_history()
+        try:
+            self.telemetry = TelemetryStore(self.TELEMETRY_DIR)
+        except OSError as e:
+            print(f"[!] Telemetry history unavailable: {e}")
+            self.telemetry = None
 
     def check_compatibility(self):
         """Verify if the kernel interfaces are accessible."""
-        paths = [self.THERMAL_PATH, self.BATTERY_PATH]
+        paths = [self.thermal_path, self.battery_path]
         for p in paths:
             if not os.path.exists(p):
                 print(f"[!] Critical Warning: Path {p} not accessible. Hardware awareness limited.")
 
+    def _sysfs_path(self, path):
+        """Re-roots a default /sys path under self.sysfs_root (for synthetic trees)."""
+        return os.path.join(self.sysfs_root, os.path.relpath(path, self.SYSFS_ROOT))
+
     def _load_history(self):
-        """Loads previous trauma logs from disk."""
-        if os.path.exists(self.LOG_FILE):
-            try:
-                with open(self.LOG_FILE, "r") as f:
-                    self.trauma_history = json.load(f)
-            except:
-                self.trauma_history = []
+        """Opens the trauma journal and loads only its most recent events."""
+        try:
+            self.journal = TraumaJournal(self.LOG_FILE)
+        except (OSError, ValueError) as e:
+            print(f"[!] Trauma memory unavailable: {e}")
+            return
+        if self.journal.count == 0:
+            self._import_legacy_log()
+        for event in self.journal.tail(self.HISTORY_SIZE):
+            event["timestamp"] = datetime.fromtimestamp(event["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
+            self.trauma_history.append(event)
 
-    def _save_trauma(self, event_type, value):
+    def _import_legacy_log(self):
+        """One-time migration of the old JSON trauma log into the journal."""
+        if not os.path.exists(self.LEGACY_LOG_FILE):
+            return
+        try:
+            with open(self.LEGACY_LOG_FILE, "r") as f:
+                for event in json.load(f):
+                    stamp = datetime.strptime(event["timestamp"], "%Y-%m-%d %H:%M:%S").timestamp()
+                    self.journal.append(event["type"], event["value"], event.get("battery_at_time"), stamp)
+            self.journal.sync()
+        except Exception:
+            pass
+
+    def _save_trauma(self, event_type, value, battery=None):
         """Records a physical event to the 'Memory' of the system."""
+        if battery is None:
+            battery = self.get_battery()
         event = {
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "type": event_type,
             "value": value,
-            "battery_at_time": self.get_battery()
+            "battery_at_time": battery
         }
         self.trauma_history.append(event)
-        try:
-            with open(self.LOG_FILE, "w") as f:
-                json.dump(self.trauma_history[-100:], f, indent=4) # Keep last 100 events
-        except:
-            pass
+        if self.journal is not None:
+            try:
+                self.journal.append(event_type, value, battery)  # One small append, no rewrite
+            except OSError:
+                pass
 
     def get_temperature(self):
         """High-precision thermal reading."""
-        try:
-            with open(self.THERMAL_PATH, "r") as f:
-                temp = int(f.read().strip())
-                return temp / 1000.0 if temp > 1000 else temp
-        except Exception:
+        return self._to_celsius(self.sensors.read_int("temp"))
+
+    def _to_celsius(self, raw):
+        if raw is None:
             return 0.0
+        return raw / 1000.0 if raw > 1000 else raw
 
     def get_battery(self):
         """Energy level monitoring."""
-        try:
-            with open(self.BATTERY_PATH, "r") as f:
-                return int(f.read().strip())
-        except Exception:
-            return 0
+        return self.sensors.read_int("battery", 0)
+
+    def read_vitals(self):
+        """Reads temperature and battery in one batched call."""
+        temp, bat = self.sensors.read_many(("temp", "battery"))
+        return self._to_celsius(temp), bat if bat is not None else 0
+
+    def get_temperatures(self):
+        """
+        All thermal zones as one reused array('d') of Celsius, ordered like
+        self.thermal.types (NaN = unreadable). Use self.thermal.as_dict(temps) for display.
+        """
+        return self.thermal.get_temperatures()
+
+    def check_heat(self, temp_limit, zone_limits=None, fallback=0.0):
+        """
+        Checks every thermal zone in one pass.
+        Returns (hottest temperature, [(zone_type, temp), ...] over their limit).
+        Falls back to the single zone0 reading when no zones were discovered
+        or none of them could be read.
+        """
+        if len(self.thermal):
+            temps = self.thermal.get_temperatures()
+            zone, hottest = self.thermal.hottest(temps)
+            if zone is not None:
+                return hottest, self.thermal.over_limit(temp_limit, zone_limits, temps)
+        return fallback, ([("zone0", fallback)] if fallback > temp_limit else [])
+
+    def _heat_warning(self, event):
+        """ThermalTrend hook: the limit is predicted to be crossed soon."""
+        print(f"!! HEAT TREND: {event['temp']}°C rising {event['slope'] * 60:.2f}°C/min, "
+              f"limit {event['limit']}°C in ~{event['eta']:.0f}s !!")
+        self._save_trauma("HEAT_WARNING", event["temp"])
+        if self.on_heat_warning:
+            self.on_heat_warning(event)
 
     def get_acceleration(self):
         """Detects physical impact or displacement."""
-        try:
-            result = subprocess.check_output(["termux-sensor", "-n", "1", "-s", "accelerometer"], 
-                                           stderr=subprocess.STDOUT, timeout=2)
-            data = json.loads(result)
-            return data.get("accelerometer", {}).get("values", [0, 0, 0])
-        except:
-            return [0, 0, 0]
+        # Requires termux-api package; (re)starts the stream if it died
+        if not self.accel.running:
+            self.accel.start()
+        return self.accel.latest()
+
+    def _on_accel_sample(self, timestamp, values):
+        """Stream hook: feeds the motion window and wakes a sleeping loop on real movement."""
+        self.motion.push(timestamp, values)
+        if self.motion_limit is None:
+            return
+        moving = self.motion.is_moving(self.motion_limit)
+        if moving and not self._moving:
+            self.scheduler.wake()  # Edge-triggered: once per burst, not once per sample
+        self._moving = moving
+
+    def get_motion_energy(self):
+        """Windowed motion energy (RMS deviation in m/s^2); ~0 when the device is still."""
+        if not self.accel.running:
+            self.accel.start()
+        return self.motion.energy() if self.motion.count >= 5 else 0.0
 
     def trigger_feedback(self, intensity="mild"):
         """Physical response system."""
         duration = 500 if intensity == "mild" else 1500
-        try:
-            subprocess.run(["termux-vibrate", "-d", str(duration)], stderr=subprocess.DEVNULL)
-        except:
-            pass
+        # Dropped or merged when alerts come faster than the rate limit allows
+        return self.feedback.vibrate(duration)
 
     def display_health_dashboard(self):
         """ASCII Art Dashboard for the user."""
-        temp = self.get_temperature()
-        bat = self.get_battery()
+        temp, bat = self.read_vitals()
         uptime = round((time.time() - self.start_time) / 60, 2)
         
         print("\n" + "="*40)
@@ -99,51 +202,84 @@ class DroidSense:
         print("="*40)
         print(f" STATUS: {'[HEALTHY]' if temp < 45 else '[DANGER]'}")
         print(f" CORE TEMP: {temp}°C")
+        if len(self.thermal):
+            zone, hottest = self.thermal.hottest()
+            if zone is not None:
+                print(f" HOTTEST:  {zone} {hottest}°C ({len(self.thermal)} zones)")
         print(f" ENERGY:   {bat}% [{'#' * (bat//10)}{' ' * (10-(bat//10))}]")
         print(f" UPTIME:   {uptime} minutes")
-        print(f" TRAUMAS:  {len(self.trauma_history)} recorded")
+        recorded = self.journal.count if self.journal is not None else len(self.trauma_history)
+        print(f" TRAUMAS:  {recorded} recorded")
         print("="*40 + "\n")
 
-    def run_survival_protocol(self, temp_limit=42, motion_limit=15):
+    def run_survival_protocol(self, temp_limit=42, motion_limit=3.0, zone_limits=None):
         """
         The main autonomous loop. 
-        Adjusts polling rate based on battery to ensure survival.
+        Adapts the polling rate to heat trend, motion and battery to ensure survival.
+        zone_limits optionally overrides temp_limit per thermal zone type,
+        e.g. {"battery": 40, "gpu": 55}. motion_limit is compared against
+        the windowed motion energy (m/s^2), see MotionWindow.energy().
         """
         self.display_health_dashboard()
-        last_accel = self.get_acceleration()
+        self.motion_limit = motion_limit
+        self.scheduler.motion_alert = motion_limit
+        self.trend = ThermalTrend(temp_limit, on_warning=self._heat_warning)
         
         try:
             while True:
-                temp = self.get_temperature()
-                bat = self.get_battery()
-                curr_accel = self.get_acceleration()
+                temp, bat = self.read_vitals()
+                temp, hot_zones = self.check_heat(temp_limit, zone_limits, temp)
+                # 0. Heat Premonition: warn while there is still time to shed load
+                self.trend.update(time.time(), temp)
                 
-                # Dynamic Sleep: Save energy if battery is low
-                sleep_time = 1 if bat > 20 else 5
-                
-                # Calculate Physical Stress (Motion)
-                stress = sum(abs(a - b) for a, b in zip(curr_accel, last_accel))
+                # Physical Stress: motion energy over the last window
+                stress = self.get_motion_energy()
+
+                # Dynamic Sleep: poll fast while things change, back off while calm or low on energy
+                sleep_time = self.scheduler.update(temp, stress, bat)
                 
                 # 1. Heat Reaction
-                if temp > temp_limit:
-                    print(f"!! CRITICAL HEAT: {temp}°C !!")
-                    self._save_trauma("OVERHEAT", temp)
+                if hot_zones:
+                    zones = ", ".join(f"{zone}={t}°C" for zone, t in hot_zones)
+                    print(f"!! CRITICAL HEAT: {zones} !!")
+                    self._save_trauma("OVERHEAT", max(t for _, t in hot_zones), bat)
                     self.trigger_feedback("heavy")
                     # Emergency: Could kill heavy tasks here
                 
                 # 2. Motion/Theft Reaction
                 if stress > motion_limit:
                     print(f"!! SECURITY BREACH: Physical Displacement Detected ({stress:.2f}) !!")
-                    self._save_trauma("MOTION", stress)
+                    self._save_trauma("MOTION", stress, bat)
                     self.trigger_feedback("mild")
 
                 print(f"-> Monitoring: T:{temp}°C | B:{bat}% | S:{stress:.2f}", end="\r")
+                if self.telemetry is not None:
+                    self.telemetry.record(temp=temp, battery=bat, motion=stress)
                 
-                last_accel = curr_accel
-                time.sleep(sleep_time)
+                # Battery attribute changes (sysfs_notify) or real motion end the wait early
+                self.scheduler.wait(sleep_time, (self.sensors.fileno("battery"),))
 
         except KeyboardInterrupt:
             print("\n[!] Consciousness suspended. The Castle remains standing.")
+        finally:
+            self.motion_limit = None
+            self.accel.stop()
+            self.feedback.close(wait=False)
+            if self.journal is not None:
+                self.journal.sync()
+            if self.telemetry is not None:
+                self.telemetry.close() # Also writes the open 1m/1h windows
+
+    async def run_survival_protocol_async(self, temp_limit=42, motion_limit=3.0, zone_limits=None, **intervals):
+        """
+        Awaitable survival protocol for embedding in an asyncio application.
+        Samplers run as concurrent tasks; see AsyncSurvivalMonitor for intervals.
+        """
+        from async_monitor import AsyncSurvivalMonitor
+        self.display_health_dashboard()
+        monitor = AsyncSurvivalMonitor(self, temp_limit, motion_limit, zone_limits, **intervals)
+        await monitor.run()
+        return monitor
 
 if __name__ == "__main__":
     fortress = DroidSense()
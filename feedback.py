@@ -0,0 +1,108 @@
+import subprocess
+import threading
+import time
+from collections import deque
+
+class FeedbackDispatcher:
+    """
+    FeedbackDispatcher v1.0 - Rate-Limited Actuator Control.
+    A single worker thread owns every actuator subprocess (termux-vibrate,
+    ...). Requests pass a token bucket, and identical requests that are
+    still waiting are coalesced into one, so a sustained alarm cannot turn
+    into a fork storm on an already throttled device.
+    """
+    VIBRATE = "termux-vibrate"
+
+    def __init__(self, rate=0.5, burst=2, max_pending=8, clock=time.monotonic, runner=None):
+        self.rate = rate              # Tokens added per second
+        self.burst = burst            # Bucket capacity
+        self.tokens = float(burst)
+        self.max_pending = max_pending
+        self.clock = clock
+        self.runner = runner or self._run_command
+        self.last_refill = clock()
+        self.pending = deque()        # Keys in arrival order
+        self.commands = {}            # { key: argv } for pending requests
+        self.stats = {"submitted": 0, "dispatched": 0, "coalesced": 0,
+                      "dropped": 0, "failed": 0}
+        self.available = True         # False once the actuator binary is missing
+        self.running = False
+        self.thread = None
+        self.cond = threading.Condition()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def submit(self, command, key=None):
+        """
+        Queues an actuator command (argv list). Returns True if it will run,
+        either as a new request or merged into an identical pending one.
+        """
+        key = tuple(command) if key is None else key
+        with self.cond:
+            self.stats["submitted"] += 1
+            if key in self.commands:
+                self.stats["coalesced"] += 1
+                return True
+            self._refill()
+            if not self.available or self.tokens < 1 or len(self.pending) >= self.max_pending:
+                self.stats["dropped"] += 1
+                return False
+            self.tokens -= 1
+            self.pending.append(key)
+            self.commands[key] = list(command)
+            self._ensure_worker()
+            self.cond.notify()
+            return True
+
+    def vibrate(self, duration_ms):
+        """Rate-limited termux-vibrate."""
+        return self.submit([self.VIBRATE, "-d", str(int(duration_ms))])
+
+    def _ensure_worker(self):
+        # Caller holds self.cond. A worker still draining after close(wait=False)
+        # is simply kept on; only a worker that has exited is replaced.
+        self.running = True
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._worker, daemon=True)
+            self.thread.start()
+
+    def _worker(self):
+        while True:
+            with self.cond:
+                while self.running and not self.pending:
+                    self.cond.wait()
+                if not self.pending:
+                    self.thread = None  # Decided under the lock, so submit() knows to start a new one
+                    return
+                key = self.pending.popleft()
+                command = self.commands.pop(key)
+            outcome = "dispatched"
+            try:
+                self.runner(command)
+            except (FileNotFoundError, PermissionError):
+                self.available = False  # Termux-API not installed
+                outcome = "failed"
+            except Exception:
+                outcome = "failed"
+            with self.cond:
+                self.stats[outcome] += 1
+
+    def _run_command(self, command):
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def counters(self):
+        """Snapshot of submitted/dispatched/coalesced/dropped/failed counts."""
+        with self.cond:
+            return dict(self.stats, pending=len(self.pending))
+
+    def close(self, wait=True):
+        """Stops the worker after it has run what is already pending."""
+        with self.cond:
+            self.running = False
+            self.cond.notify_all()
+            thread = self.thread
+        if wait and thread is not None:
+            thread.join()
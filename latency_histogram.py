@@ -0,0 +1,95 @@
+from array import array
+
+class LatencyHistogram:
+    """
+    LatencyHistogram v1.0 - Fixed-Memory Timing Recorder.
+    HDR-style log-linear buckets over whole microseconds: every power of
+    two is split into 2**(SUB_BITS-1) linear steps, so any value is kept
+    within ~3% while the whole range (1 us .. ~71 min) fits in one small
+    array. Recording is a few integer ops; nothing is ever allocated.
+    """
+    SUB_BITS = 5
+    MAX_US = (1 << 32) - 1  # Longer values are clamped into the last bucket
+
+    def __init__(self):
+        half = 1 << (self.SUB_BITS - 1)
+        top_shift = self.MAX_US.bit_length() - self.SUB_BITS
+        self.counts = array('I', bytes(4 * (top_shift * half + 2 * half)))
+        self.reset()
+
+    def reset(self):
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def _index(self, us):
+        shift = us.bit_length() - self.SUB_BITS
+        if shift <= 0:
+            return us
+        return (shift << (self.SUB_BITS - 1)) + (us >> shift)
+
+    def _lowest(self, index):
+        """Smallest value that lands in bucket index."""
+        half = 1 << (self.SUB_BITS - 1)
+        if index < 2 * half:
+            return index
+        shift = index // half - 1
+        return (index - shift * half) << shift
+
+    def record(self, seconds):
+        """Adds one duration (seconds); negatives count as 0."""
+        us = int(seconds * 1e6)
+        if us < 0:
+            us = 0
+        elif us > self.MAX_US:
+            us = self.MAX_US
+        self.counts[self._index(us)] += 1
+        self.count += 1
+        self.total += us
+        if self.min is None or us < self.min:
+            self.min = us
+        if us > self.max:
+            self.max = us
+
+    def merge(self, other):
+        """Adds other's samples (e.g. a histogram recorded in another process)."""
+        for i, n in enumerate(other.counts):
+            if n:
+                self.counts[i] += n
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+
+    def percentile(self, p):
+        """Value (seconds) at or below which p percent of the samples fall."""
+        if not self.count:
+            return 0.0
+        rank = max(1, int(round(self.count * p / 100.0)))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                # Report the bucket midpoint, but never beyond what was really seen
+                high = self._lowest(i + 1) - 1
+                value = (self._lowest(i) + high) // 2
+                return max(self.min, min(value, self.max)) / 1e6
+        return self.max / 1e6
+
+    def summary(self):
+        """Milliseconds: count, min, mean, p50, p90, p99, max."""
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "min_ms": self.min / 1e3,
+            "mean_ms": round(self.total / self.count / 1e3, 3),
+            "p50_ms": round(self.percentile(50) * 1e3, 3),
+            "p90_ms": round(self.percentile(90) * 1e3, 3),
+            "p99_ms": round(self.percentile(99) * 1e3, 3),
+            "max_ms": self.max / 1e3,
+        }
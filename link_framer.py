@@ -0,0 +1,130 @@
+import binascii
+import struct
+
+class FrameDecoder:
+    """
+    FrameDecoder v1.0 - Incremental Serial Stream Splitter.
+    Bytes land straight in one preallocated bytearray (writable() hands out
+    the free space for readinto), and commit() cuts off every complete
+    frame. Two framings may be mixed on one stream:
+
+      text    ... b"\\n"                 (classic Serial.println telemetry)
+      binary  SYNC | length | payload | CRC-16/CCITT of length+payload
+
+    Binary headers start with 0xA5, which never opens a UTF-8 text line.
+    A header is also looked for inside every text run, so a frame that
+    follows noise (or a line cut short) is still found; the bytes in front
+    of it are dropped. A bad CRC or impossible length skips one byte and
+    resynchronises, so line noise costs a frame or a line, never the stream.
+    """
+    SYNC = b"\xa5\x5a"
+    HEADER = struct.Struct("<2sH")  # sync, payload length (little-endian, as MCUs write it)
+    CRC = struct.Struct("<H")
+
+    def __init__(self, capacity=65536, max_frame=4096):
+        self.buf = bytearray(capacity)
+        self.view = memoryview(self.buf)
+        self.start = 0   # First unparsed byte
+        self.end = 0     # One past the last received byte
+        self.max_frame = max_frame
+        self.lines = 0
+        self.frames = 0
+        self.crc_errors = 0
+        self.skipped = 0    # Unterminated text (noise) dropped in front of a frame
+        self.overflows = 0  # Text lines longer than the whole buffer, dropped
+
+    @classmethod
+    def encode(cls, payload):
+        """Binary frame for payload (what the microcontroller side sends)."""
+        head = cls.HEADER.pack(cls.SYNC, len(payload))
+        return head + payload + cls.CRC.pack(binascii.crc_hqx(head[2:] + payload, 0xFFFF))
+
+    def writable(self):
+        """Free space after the buffered bytes; fill it, then commit(count)."""
+        if self.start:
+            if self.start == self.end:
+                self.start = self.end = 0
+            elif self.end > len(self.buf) // 2:
+                # Move the unparsed tail to the front (one memmove, no new buffer)
+                pending = self.end - self.start
+                self.buf[:pending] = self.view[self.start:self.end]
+                self.start, self.end = 0, pending
+        if self.end == len(self.buf):
+            # One text line fills the whole buffer: it can never complete
+            self.overflows += 1
+            self.start = self.end = 0
+        return self.view[self.end:]
+
+    def feed(self, data):
+        """Copies data in and returns the frames it completed."""
+        frames = []
+        data = memoryview(data)
+        while data:
+            space = self.writable()
+            n = min(len(space), len(data))
+            space[:n] = data[:n]
+            data = data[n:]
+            frames += self.commit(n)
+        return frames
+
+    def _frame_at(self, pos, end, count_errors=True):
+        """("frame", payload, next pos) | ("short", None, pos) | ("bad", None, pos) for a header at pos."""
+        buf, header = self.buf, self.HEADER.size
+        if end - pos < header:
+            return "short", None, pos
+        sync, length = self.HEADER.unpack_from(buf, pos)
+        if sync != self.SYNC or length > self.max_frame:
+            return "bad", None, pos
+        stop = pos + header + length
+        if stop + self.CRC.size > end:
+            return "short", None, pos
+        if binascii.crc_hqx(self.view[pos + 2:stop], 0xFFFF) != self.CRC.unpack_from(buf, stop)[0]:
+            if count_errors:
+                self.crc_errors += 1
+            return "bad", None, pos
+        return "frame", bytes(self.view[pos + header:stop]), stop + self.CRC.size
+
+    def commit(self, count):
+        """Accounts for count new bytes. Returns [("line", str) | ("frame", bytes), ...]."""
+        self.end += count
+        frames = []
+        buf, pos, end = self.buf, self.start, self.end
+        while pos < end:
+            if buf[pos] == 0xA5:
+                status, payload, stop = self._frame_at(pos, end)
+                if status == "short":
+                    break  # Header or payload incomplete
+                if status == "bad":
+                    pos += 1  # Not a frame after all: resynchronise
+                    continue
+                frames.append(("frame", payload))
+                self.frames += 1
+                pos = stop
+                continue
+            newline = buf.find(b"\n", pos, end)
+            limit = newline if newline >= 0 else end
+            # A frame may start mid-run (after noise); text that merely contains
+            # the sync bytes (e.g. UTF-8 "\u00a5Z") fails the CRC and stays text
+            sync = buf.find(self.SYNC, pos, limit)
+            while sync >= 0:
+                status, payload, stop = self._frame_at(sync, end, count_errors=False)
+                if status != "bad":
+                    break
+                sync = buf.find(self.SYNC, sync + 1, limit)
+            if sync >= 0:
+                if status == "short":
+                    break  # Frame or line: decided once more bytes arrive
+                self.skipped += sync - pos
+                frames.append(("frame", payload))
+                self.frames += 1
+                pos = stop
+                continue
+            if newline < 0:
+                break  # Line incomplete
+            line = buf[pos:newline].decode('utf-8', errors='ignore').rstrip()
+            if line:
+                frames.append(("line", line))
+                self.lines += 1
+            pos = newline + 1
+        self.start = pos
+        return frames
@@ -0,0 +1,114 @@
+import math
+import threading
+from array import array
+
+class MotionWindow:
+    """
+    MotionWindow v1.0 - Windowed Motion Analytics.
+    Fixed-size, array-backed ring buffer of accelerometer samples with
+    running mean/variance per axis and of the magnitude, updated in O(1)
+    per sample. Motion is judged on the energy of the whole window rather
+    than on a single noisy sample-to-sample delta.
+    """
+    AXES = 3
+    RESYNC_EVERY = 4096  # Recompute sums from scratch now and then to cancel float drift
+
+    def __init__(self, size=50):
+        self.size = size
+        self.samples = array('d', bytes(8 * size * self.AXES))  # x, y, z interleaved
+        self.magnitudes = array('d', bytes(8 * size))
+        self.head = 0    # Next slot to write
+        self.count = 0   # Valid samples in the window
+        self.total = 0   # Samples ever pushed
+        self.sums = [0.0] * (self.AXES + 1)     # x, y, z, |a|
+        self.squares = [0.0] * (self.AXES + 1)
+        self.lock = threading.Lock()
+
+    def add(self, x, y, z):
+        """Pushes one sample, evicting the oldest once the window is full."""
+        mag = math.sqrt(x * x + y * y + z * z)
+        new = (x, y, z, mag)
+        with self.lock:
+            # _resync() and clear() swap in new lists: take them under the lock
+            sums, squares = self.sums, self.squares
+            base = self.head * self.AXES
+            if self.count == self.size:
+                old = (self.samples[base], self.samples[base + 1],
+                       self.samples[base + 2], self.magnitudes[self.head])
+                for i in range(4):
+                    sums[i] += new[i] - old[i]
+                    squares[i] += new[i] * new[i] - old[i] * old[i]
+            else:
+                self.count += 1
+                for i in range(4):
+                    sums[i] += new[i]
+                    squares[i] += new[i] * new[i]
+            self.samples[base] = x
+            self.samples[base + 1] = y
+            self.samples[base + 2] = z
+            self.magnitudes[self.head] = mag
+            self.head = (self.head + 1) % self.size
+            self.total += 1
+            if self.total % self.RESYNC_EVERY == 0:
+                self._resync()
+
+    def push(self, timestamp, values):
+        """on_sample hook for AccelerometerStream: push(timestamp, [x, y, z])."""
+        if len(values) >= 3:
+            self.add(values[0], values[1], values[2])
+
+    def _resync(self):
+        # Caller holds self.lock
+        sums = [0.0] * (self.AXES + 1)
+        squares = [0.0] * (self.AXES + 1)
+        for slot in range(self.count):
+            base = slot * self.AXES
+            row = (self.samples[base], self.samples[base + 1],
+                   self.samples[base + 2], self.magnitudes[slot])
+            for i in range(4):
+                sums[i] += row[i]
+                squares[i] += row[i] * row[i]
+        self.sums, self.squares = sums, squares
+
+    def _moments(self, i):
+        # Caller holds self.lock
+        if not self.count:
+            return 0.0, 0.0
+        mean = self.sums[i] / self.count
+        # Clamp tiny negative values caused by rounding
+        return mean, max(self.squares[i] / self.count - mean * mean, 0.0)
+
+    def mean(self):
+        """Per-axis mean [x, y, z] over the window."""
+        with self.lock:
+            return [self._moments(i)[0] for i in range(self.AXES)]
+
+    def variance(self):
+        """Per-axis variance [x, y, z] over the window."""
+        with self.lock:
+            return [self._moments(i)[1] for i in range(self.AXES)]
+
+    def magnitude_stats(self):
+        """(mean, variance) of |a| over the window."""
+        with self.lock:
+            return self._moments(self.AXES)
+
+    def energy(self):
+        """
+        RMS deviation of the acceleration vector from its window mean (m/s^2).
+        Gravity and sensor bias cancel out, so a still phone reads close to 0.
+        """
+        with self.lock:
+            if self.count < 2:
+                return 0.0
+            return math.sqrt(sum(self._moments(i)[1] for i in range(self.AXES)))
+
+    def is_moving(self, threshold, min_samples=5):
+        """True once the window holds enough samples and its energy exceeds threshold."""
+        return self.count >= min_samples and self.energy() > threshold
+
+    def clear(self):
+        with self.lock:
+            self.head = self.count = 0
+            self.sums = [0.0] * (self.AXES + 1)
+            self.squares = [0.0] * (self.AXES + 1)
@@ -0,0 +1,131 @@
+import heapq
+import itertools
+import threading
+import time
+
+class PeerRecord:
+    """One known node. Updated in place on every heartbeat."""
+    __slots__ = ("key", "node_id", "name", "address", "format", "last_seen")
+
+    def __init__(self, key, node_id, name, address, fmt, last_seen):
+        self.key = key
+        self.node_id = node_id
+        self.name = name
+        self.address = address
+        self.format = fmt
+        self.last_seen = last_seen
+
+    def as_dict(self):
+        return {"name": self.name, "last_seen": self.last_seen, "format": self.format,
+                "address": self.address, "node_id": self.node_id}
+
+
+class PeerTable:
+    """
+    PeerTable v1.0 - Timer-Indexed Swarm Membership.
+    Peers are keyed by node identity, not by IP, so several nodes behind
+    one address stay apart. A min-heap of expiry deadlines makes a sweep
+    O(log n) per peer that is actually due, and expiry happens on time
+    instead of at the next polling tick. A heartbeat from a known peer
+    only rewrites last_seen in its slotted record: no lock, no new dict,
+    no heap push (the heap entry is refreshed lazily when it comes due).
+    """
+    def __init__(self, timeout=15.0, clock=time.time):
+        self.timeout = timeout
+        self.clock = clock
+        self.records = {}    # { key: PeerRecord }
+        self.addresses = {}  # { address: key } - last node heard at each address
+        self.heap = []       # (deadline, seq, key, record); stale entries are skipped or re-armed
+        self.seq = itertools.count()
+        self.json_peers = 0  # Peers not (yet) known to speak binary
+        self.lock = threading.Lock()  # Inserts, removals, heap and format changes
+
+    def touch(self, key, name, address, fmt, now=None, node_id=None):
+        """Records a heartbeat. Returns (record, is_new)."""
+        if now is None:
+            now = self.clock()
+        record = self.records.get(key)
+        if record is not None and record.address == address and record.format == fmt:
+            record.last_seen = now  # Hot path: a plain attribute store
+            if name is not None:
+                record.name = name
+            return record, False
+        with self.lock:
+            record = self.records.get(key)
+            if record is None:
+                record = PeerRecord(key, node_id, name, address, fmt, now)
+                self.records[key] = record
+                self.json_peers += fmt != "binary"
+                heapq.heappush(self.heap, (now + self.timeout, next(self.seq), key, record))
+                is_new = True
+            else:
+                if record.format != fmt:
+                    self.json_peers += (fmt != "binary") - (record.format != "binary")
+                    record.format = fmt
+                record.address = address
+                record.last_seen = now
+                if name is not None:
+                    record.name = name
+                is_new = False
+            if node_id is not None:
+                record.node_id = node_id
+            self.addresses[address] = key
+        return record, is_new
+
+    def expire(self, now=None):
+        """Removes and returns every peer silent for `timeout` seconds."""
+        if now is None:
+            now = self.clock()
+        expired = []
+        with self.lock:
+            heap = self.heap
+            while heap and heap[0][0] <= now:
+                _, _, key, record = heapq.heappop(heap)
+                if self.records.get(key) is not record:
+                    continue  # Removed (or replaced) already
+                deadline = record.last_seen + self.timeout
+                if deadline > now:
+                    heapq.heappush(heap, (deadline, next(self.seq), key, record))  # Heard since; re-arm
+                    continue
+                self._drop(key, record)
+                expired.append(record)
+        return expired
+
+    def _drop(self, key, record):
+        # Caller holds self.lock
+        del self.records[key]
+        self.json_peers -= record.format != "binary"
+        if self.addresses.get(record.address) == key:
+            del self.addresses[record.address]
+
+    def remove(self, key):
+        with self.lock:
+            record = self.records.get(key)
+            if record is not None:
+                self._drop(key, record)  # Its heap entry is discarded lazily
+        return record
+
+    def next_deadline(self):
+        """Earliest time a peer could expire (None if the table is empty)."""
+        heap = self.heap
+        return heap[0][0] if heap else None
+
+    def get(self, key):
+        return self.records.get(key)
+
+    def by_address(self, address):
+        key = self.addresses.get(address)
+        return None if key is None else self.records.get(key)
+
+    def all_binary(self):
+        """True if there is at least one peer and every peer speaks binary."""
+        return bool(self.records) and self.json_peers == 0
+
+    def values(self):
+        return list(self.records.values())
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, key):
+        return key in self.records
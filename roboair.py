@@ -1,6 +1,8 @@
 import socket
 import threading
 import time
+from air_sender import DatagramSender
+from air_inbox import RingInbox, BackgroundPrinter
 
 class RoboAir:
     """
@@ -8,11 +10,16 @@ class RoboAir:
     Enables devices to talk to each other without a router or internet.
     Uses UDP Broadcasting for peer-to-peer communication.
     """
-    def __init__(self, port=5005):
+    def __init__(self, port=5005, inbox_size=1024, inbox_policy="drop_oldest"):
         self.port = port
         self.running = False
-        self.received_messages = []
-        self.lock = threading.Lock()
+        # Bounded: a chatty peer can no longer grow memory without limit.
+        # Holds (sender, raw bytes); get_inbox() decodes what is actually read
+        self.received_messages = RingInbox(inbox_size, inbox_policy)
+        self.printer = BackgroundPrinter() # Terminal output never blocks the receiver
+        # One long-lived socket, one datagram per message: v1 has no way to
+        # learn whether a listener can unpack batches, and older ones cannot
+        self.sender = DatagramSender(max_datagram=1024)
 
     def start(self):
         """Starts listening for messages from other robots."""
@@ -26,37 +33,40 @@ class RoboAir:
         print(f"[*] RoboAir: Signal Listening on port {self.port}")
 
     def _listen(self):
+        # v1 sends one message per datagram; decoding waits until someone reads it
         while self.running:
             try:
                 data, addr = self.sock.recvfrom(1024)
-                message = data.decode('utf-8')
-                with self.lock:
-                    self.received_messages.append({"sender": addr[0], "msg": message})
-                    print(f"\n[Incoming Signal] From {addr[0]}: {message}")
+                self.received_messages.push(addr[0], (addr[0], data))
+                self.printer.print("\n[Incoming Signal] From {}: {}", addr[0], data)
             except Exception:
                 pass
 
     def broadcast(self, message):
-        """Sends a message to EVERYONE on the local network."""
+        """
+        Sends a message to EVERYONE on the local network. Returns True once it
+        is queued for the sender thread (not when it is on the air), False if
+        the queue is full.
+        """
         try:
-            broadcast_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            broadcast_sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            broadcast_sock.sendto(message.encode('utf-8'), ('255.255.255.255', self.port))
-            broadcast_sock.close()
-            return True
+            return self.sender.send(message.encode('utf-8'), ('255.255.255.255', self.port), batch=False)
         except Exception as e:
             print(f"[!] Broadcast Error: {e}")
             return False
 
-    def get_inbox(self):
-        """Returns and clears the inbox of messages."""
-        with self.lock:
-            messages = list(self.received_messages)
-            self.received_messages = []
-            return messages
+    @staticmethod
+    def _message(entry):
+        return {"sender": entry[0], "msg": str(entry[1], 'utf-8', 'replace')}
+
+    def get_inbox(self, sender=None, match=None):
+        """Returns and clears the inbox of messages (optionally only sender's, or those match() accepts)."""
+        test = None if match is None else (lambda entry: match(self._message(entry)))
+        return [self._message(entry) for entry in self.received_messages.drain(test, sender)]
 
     def stop(self):
         self.running = False
+        self.sender.close()
+        self.printer.close()
         print("[*] RoboAir: Signal Offline.")
 
 # --- How to use for Robot Teamwork ---
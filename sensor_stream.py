@@ -0,0 +1,226 @@
+import os
+import re
+import json
+import subprocess
+import threading
+import time
+from collections import deque
+
+class AccelerometerStream:
+    """
+    AccelerometerStream v1.0 - Continuous Motion Feed.
+    Keeps one long-lived `termux-sensor -s accelerometer -d <ms>` process
+    running and parses its JSON stream on a background thread, so the
+    monitor loop only ever reads the latest cached sample.
+    A process that dies on its own is respawned no sooner than
+    RESTART_DELAY seconds later; each further exit within STABLE_AFTER
+    seconds of starting doubles that gap, up to MAX_RESTART_DELAY, so a
+    broken sensor is not forked again on every tick. clock is injectable
+    for tests.
+    """
+    COMMAND = "termux-sensor"
+    CHUNK_SIZE = 4096
+    MAX_PENDING = 65536  # Give up on an object that never completes
+    TOKENS = re.compile(r'[{}"\\]')  # The only characters that move object boundaries
+    RESTART_DELAY = 1.0       # Minimum gap before respawning a dead process, seconds
+    MAX_RESTART_DELAY = 60.0
+    STABLE_AFTER = 10.0       # A run at least this long resets the back-off
+
+    def __init__(self, delay_ms=100, history=256, command=COMMAND, sensor="accelerometer", on_sample=None,
+                 clock=time.monotonic):
+        self.delay_ms = delay_ms
+        self.sensor = sensor
+        # A string is the executable name; a list is a full prefix (e.g. [python, fake_sensor.py])
+        self.command = [command] if isinstance(command, str) else list(command)
+        self.on_sample = on_sample  # Optional callback(timestamp, values) on the reader thread
+        self.samples = deque(maxlen=history)  # (monotonic time, [x, y, z])
+        self.sample_count = 0
+        self.last_values = [0, 0, 0]
+        self.last_time = None
+        self.available = True  # False once the executable turned out to be missing
+        self.running = False
+        self.process = None
+        self.thread = None
+        self.lock = threading.Lock()
+        self.invalid = 0  # Complete but undecodable objects, skipped
+        self.clock = clock
+        self.started_at = None
+        self.failures = 0     # Consecutive runs that ended before STABLE_AFTER
+        self.exits = 0        # Times the process ended without stop()
+        self.retry_at = None  # No respawn before this clock() time
+        self._reset_scan()
+
+    def start(self):
+        """Launches the sensor process and its reader thread. Returns False if unavailable."""
+        if self.running:
+            return True
+        if not self.available:
+            return False
+        if self.retry_at is not None and self.clock() < self.retry_at:
+            return False  # Backing off after the last exit
+        args = self.command + ["-s", self.sensor, "-d", str(int(self.delay_ms))]
+        if self.process is not None:
+            self._reap()  # The previous process died on its own; collect it so it is no zombie
+        try:
+            self.process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except (FileNotFoundError, PermissionError) as e:
+            self.available = False  # Termux-API not installed
+            print(f"[!] {self.command[0]} unavailable ({e}); motion sensing disabled.")
+            return False
+        self.started_at = self.clock()
+        self.running = True
+        self._reset_scan()
+        self.thread = threading.Thread(target=self._read_stream, daemon=True)
+        self.thread.start()
+        return True
+
+    def is_alive(self):
+        return self.running and self.process is not None and self.process.poll() is None
+
+    def _read_stream(self):
+        """Reader thread: drains stdout and decodes complete JSON objects as they arrive."""
+        fd = self.process.stdout.fileno()
+        pending = ""
+        while self.running:
+            try:
+                chunk = os.read(fd, self.CHUNK_SIZE)
+            except OSError:
+                break
+            if not chunk:
+                break  # Process exited
+            pending = self._feed(pending + chunk.decode("utf-8", errors="ignore"))
+        if self.running:
+            self._exited()  # Not stop(): the process ended by itself
+        self.running = False
+
+    def _exited(self):
+        """Schedules the next allowed start() after the process died on its own."""
+        uptime = self.clock() - self.started_at
+        self.exits += 1
+        self.failures = self.failures + 1 if uptime < self.STABLE_AFTER else 1
+        delay = min(self.RESTART_DELAY * 2 ** (self.failures - 1), self.MAX_RESTART_DELAY)
+        self.retry_at = self.clock() + delay
+        print(f"[!] {self.command[0]} exited after {uptime:.1f}s "
+              f"({self.failures} in a row); restarting in {delay:.0f}s")
+
+    def _reset_scan(self):
+        # Where _feed() stopped scanning the pending tail, and in which state
+        self._scan, self._skip, self._depth, self._in_string = 0, 0, 0, False
+
+    def _feed(self, text):
+        """
+        Decodes every complete object in text and returns the unconsumed tail.
+        Object boundaries come from brace depth outside strings, tracked across
+        calls, so each byte is scanned once however slowly an object arrives,
+        and a malformed object is skipped as soon as it closes.
+        """
+        depth, in_string, skip = self._depth, self._in_string, self._skip
+        start = 0 if depth else None  # A pending tail always begins with its object's "{"
+        for match in self.TOKENS.finditer(text, self._scan):
+            i = match.start()
+            if i < skip:
+                continue  # Escaped character
+            c = text[i]
+            if in_string:
+                if c == "\\":
+                    skip = i + 2
+                elif c == '"':
+                    in_string = False
+            elif c == '"':
+                in_string = depth > 0  # Quotes between objects are noise
+            elif c == "{":
+                if not depth:
+                    start = i
+                depth += 1
+            elif c == "}" and depth:
+                depth -= 1
+                if not depth:
+                    self._decode(text[start:i + 1])
+                    start = None
+        if not depth:
+            self._reset_scan()
+            return ""
+        tail = text[start:]
+        if len(tail) > self.MAX_PENDING:
+            self.invalid += 1
+            self._reset_scan()  # Never closes: drop it and resynchronise on the next "{"
+            return ""
+        self._scan, self._skip = len(tail), max(skip - start, 0)
+        self._depth, self._in_string = depth, in_string
+        return tail
+
+    def _decode(self, text):
+        try:
+            obj = json.loads(text)
+        except ValueError:
+            self.invalid += 1
+            return
+        values = self._extract(obj)
+        if values is not None:
+            self._push(values)
+
+    def _extract(self, obj):
+        # termux-sensor keys readings by the full hardware sensor name
+        if not isinstance(obj, dict):
+            return None
+        for reading in obj.values():
+            if isinstance(reading, dict) and "values" in reading:
+                return reading["values"]
+        return None
+
+    def _push(self, values):
+        now = time.monotonic()
+        with self.lock:
+            self.samples.append((now, values))
+            self.sample_count += 1
+            self.last_values = values
+            self.last_time = now
+        if self.on_sample:
+            try:
+                self.on_sample(now, values)
+            except Exception:
+                pass
+
+    def _reap(self):
+        """Terminates (if still running) and waits for the sensor process."""
+        try:
+            self.process.terminate()
+            self.process.wait(timeout=2)
+        except Exception:
+            try:
+                self.process.kill()
+                self.process.wait(timeout=2)
+            except Exception:
+                pass
+        if self.process.stdout:
+            self.process.stdout.close()
+        self.process = None
+
+    def latest(self):
+        """Most recent [x, y, z] sample. Never blocks on the sensor."""
+        return self.last_values
+
+    def age(self):
+        """Seconds since the last sample arrived, or None if none has."""
+        if self.last_time is None:
+            return None
+        return time.monotonic() - self.last_time
+
+    def recent(self, n=None):
+        """Up to n most recent (timestamp, [x, y, z]) samples, oldest first."""
+        with self.lock:
+            samples = list(self.samples)
+        return samples if n is None else samples[-n:]
+
+    def stop(self):
+        """Terminates the sensor process and releases the hardware sensor."""
+        self.running = False
+        if self.process is not None:
+            self._reap()
+            if self.command == [self.COMMAND]:
+                # termux-sensor keeps the sensor registered unless cleaned up
+                try:
+                    subprocess.run([self.COMMAND, "-c"], stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.DEVNULL, timeout=2)
+                except Exception:
+                    pass
@@ -0,0 +1,249 @@
+import multiprocessing
+import os
+import struct
+import threading
+import time
+import zlib
+from multiprocessing import resource_tracker, shared_memory
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows: pass a multiprocessing Lock instead
+
+
+class SegmentLock:
+    """
+    Write lock shared by every process that opened the segment: flock() on
+    the segment's own descriptor excludes other processes (each open is its
+    own file description), the thread lock excludes threads in this one.
+    """
+    def __init__(self, fd):
+        self.fd = fd
+        self.local = threading.Lock()
+
+    def __enter__(self):
+        self.local.acquire()
+        try:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+        except Exception:
+            self.local.release()
+            raise
+        return self
+
+    def __exit__(self, *exc):
+        fcntl.flock(self.fd, fcntl.LOCK_UN)
+        self.local.release()
+
+
+class SharedBlackboard:
+    """
+    SharedBlackboard v1.0 - Cross-Process Robot Memory.
+    A fixed schema of typed slots in multiprocessing.shared_memory, so
+    vision, networking and control can run in separate processes (and
+    escape the GIL) while still sharing one blackboard. Every slot has a
+    seqlock: writers bump its sequence around the update, readers copy the
+    slot without locking and retry if a write raced them. Drop-in for
+    VersionedMemory under RoboCore(memory=...).
+
+    schema maps key -> typecode ('d', 'q', 'i', 'f', 'B') or (typecode, length):
+        {"distance": "d", "pose": ("d", 3), "armed": "B"}
+    Writes take a lock shared by all processes (SegmentLock, flock on the
+    segment), so the global version counter stays exact and any process may
+    write any key. Where fcntl is missing, pass the same multiprocessing
+    Lock as `lock` to every process that writes.
+    """
+    MAGIC = b"DSBB"
+    HEADER = struct.Struct("<4sII")  # magic, layout checksum, slot count
+    SEQ = struct.Struct("<Q")        # Also used for the version counters
+    VERSION_AT = 16                  # Global write counter, right after the header
+    READ_TIMEOUT = 1.0               # A slot still mid-write after this long has lost its writer
+
+    def __init__(self, schema, name=None, create=True, lock=None):
+        self.schema = {}
+        self.slots = {}  # { key: (seq offset, data offset, struct) }; the slot version sits between
+        offset = self.VERSION_AT + self.SEQ.size
+        for key, spec in schema.items():
+            typecode, length = (spec, 1) if isinstance(spec, str) else spec
+            fmt = struct.Struct(f"<{length}{typecode}")
+            self.schema[key] = (typecode, length)
+            self.slots[key] = (offset, offset + 2 * self.SEQ.size, fmt)
+            offset += 2 * self.SEQ.size + fmt.size
+            offset += -offset % 8  # Keep every sequence counter 8-byte aligned
+        self.size = offset
+        self.checksum = zlib.crc32(repr(list(self.schema.items())).encode())
+        self.owner = create
+        if create:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=self.size)
+            self.shm.buf[:self.size] = bytes(self.size)
+            self.HEADER.pack_into(self.shm.buf, 0, self.MAGIC, self.checksum, len(self.slots))
+        else:
+            self.shm = self._open_untracked(name)
+            magic, checksum, count = self.HEADER.unpack_from(self.shm.buf, 0)
+            if magic != self.MAGIC or checksum != self.checksum:
+                self.shm.close()
+                raise ValueError(f"Shared memory '{name}' has a different blackboard schema")
+        self.name = self.shm.name
+        self.buf = self.shm.buf
+        if lock is None:
+            # shm._fd: the descriptor SharedMemory keeps open on POSIX (-1 elsewhere)
+            fd = getattr(self.shm, "_fd", -1)
+            lock = SegmentLock(fd) if fcntl is not None and fd >= 0 else threading.Lock()
+        self.lock = lock
+
+    @classmethod
+    def attach(cls, name, schema, lock=None):
+        """Opens a blackboard created by another process."""
+        return cls(schema, name=name, create=False, lock=lock)
+
+    @staticmethod
+    def _open_untracked(name):
+        """
+        Opens an existing segment without leaving it registered with this
+        process's resource_tracker, which would otherwise unlink it (from
+        under the creator) when this process exits.
+        """
+        try:
+            return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+        except TypeError:
+            pass
+        shm = shared_memory.SharedMemory(name=name)
+        if os.name == "posix" and multiprocessing.parent_process() is None:
+            # Own tracker: drop the entry the attach just added. A multiprocessing
+            # child shares its parent's tracker, where the creator's entry is the
+            # same one, so it must stay.
+            try:
+                resource_tracker.unregister(shm._name, "shared_memory")
+            except Exception:
+                pass
+        return shm
+
+    # --- Reads (never block a writer) ---
+    def _read_slot(self, key):
+        seq_at, data_at, fmt = self.slots[key]
+        buf, seq = self.buf, self.SEQ
+        retries, deadline = 0, None
+        while True:
+            before = seq.unpack_from(buf, seq_at)[0]
+            if not before & 1:
+                version = seq.unpack_from(buf, seq_at + 8)[0]
+                values = fmt.unpack_from(buf, data_at)
+                if seq.unpack_from(buf, seq_at)[0] == before:
+                    return values, version
+            # Write in progress (or one raced the copy): retry, but not forever
+            retries += 1
+            if retries % 1000 == 0:
+                now = time.monotonic()
+                if deadline is None:
+                    deadline = now + self.READ_TIMEOUT
+                elif now >= deadline:
+                    raise TimeoutError(f"Shared blackboard slot '{key}' stuck mid-write (writer died?)")
+                time.sleep(0)  # Let a writer thread in this process finish
+
+    def read(self, key, default=None):
+        if key not in self.slots:
+            return default
+        values, version = self._read_slot(key)
+        if not version:
+            return default  # Never written
+        return values[0] if self.schema[key][1] == 1 else list(values)
+
+    def read_versioned(self, key, default=None):
+        """(value, version); version is the global write count when the key last changed (0 = never)."""
+        if key not in self.slots:
+            return default, 0
+        values, version = self._read_slot(key)
+        if not version:
+            return default, 0
+        return (values[0] if self.schema[key][1] == 1 else list(values)), version
+
+    def view(self, key):
+        """
+        Zero-copy memoryview of a slot's data, cast to its type. No seqlock
+        check: use it for single scalars or when a torn read is acceptable.
+        """
+        _, data_at, fmt = self.slots[key]
+        return self.buf[data_at:data_at + fmt.size].cast(self.schema[key][0])
+
+    def snapshot(self, keys=None):
+        """{key: value} of every written key (each slot consistent on its own)."""
+        result = {}
+        for key in self.slots if keys is None else keys:
+            if key in self.slots:
+                values, version = self._read_slot(key)
+                if version:
+                    result[key] = values[0] if self.schema[key][1] == 1 else list(values)
+        return result
+
+    @property
+    def version(self):
+        """Version of the newest write from any process."""
+        return self.SEQ.unpack_from(self.buf, self.VERSION_AT)[0]
+
+    def changed_since(self, version, keys=None):
+        """Keys written after version."""
+        return [key for key in (self.slots if keys is None else keys)
+                if key in self.slots and self.SEQ.unpack_from(self.buf, self.slots[key][0] + 8)[0] > version]
+
+    # --- Writes ---
+    def _write_slot(self, key, value, version):
+        seq_at, data_at, fmt = self.slots[key]
+        seq = self.SEQ.unpack_from(self.buf, seq_at)[0]
+        self.SEQ.pack_into(self.buf, seq_at, seq + 1)          # Odd: readers retry
+        self.SEQ.pack_into(self.buf, seq_at + 8, version)
+        if self.schema[key][1] == 1:
+            fmt.pack_into(self.buf, data_at, value)
+        else:
+            fmt.pack_into(self.buf, data_at, *value)
+        self.SEQ.pack_into(self.buf, seq_at, seq + 2)          # Even: published
+
+    def _next_version(self):
+        # Caller holds self.lock (shared by every writing process)
+        version = self.SEQ.unpack_from(self.buf, self.VERSION_AT)[0] + 1
+        self.SEQ.pack_into(self.buf, self.VERSION_AT, version)
+        return version
+
+    def write(self, key, value):
+        if key not in self.slots:
+            raise KeyError(f"'{key}' is not in the shared blackboard schema")
+        with self.lock:
+            version = self._next_version()
+            self._write_slot(key, value, version)
+        return version
+
+    def write_many(self, values):
+        """Writes several keys under one version; each slot is published atomically on its own."""
+        for key in values:
+            if key not in self.slots:
+                raise KeyError(f"'{key}' is not in the shared blackboard schema")
+        with self.lock:
+            version = self._next_version()
+            for key, value in values.items():
+                self._write_slot(key, value, version)
+        return version
+
+    def wait_for(self, keys=None, since=None, timeout=None, poll=0.001):
+        """
+        Waits until one of keys (any key if None) is written after version
+        `since` (default: now). There is no cross-process condition variable,
+        so this polls with a short sleep.
+        """
+        if since is None:
+            since = self.version
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = self.changed_since(since, keys)
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return []
+            time.sleep(poll)
+
+    # --- Lifetime ---
+    def close(self):
+        self.buf = None
+        self.shm.close()
+
+    def unlink(self):
+        """Frees the segment (creator only, once every process has closed it)."""
+        if self.owner:
+            self.shm.unlink()
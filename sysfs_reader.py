@@ -0,0 +1,128 @@
+import os
+import threading
+
+class SysfsReader:
+    """
+    SysfsReader v1.0 - Persistent Kernel Attribute Access.
+    Keeps sysfs attribute files open and re-reads them at offset 0,
+    so every poll costs a single syscall and no new file objects.
+    """
+    BUFFER_SIZE = 64  # sysfs numeric attributes are a handful of bytes
+
+    def __init__(self, paths=None, buffer_size=BUFFER_SIZE):
+        self.fds = {}    # { 'name': fd }
+        self.paths = {}  # { 'name': path }
+        self.buffer = bytearray(buffer_size)
+        self.view = memoryview(self.buffer)
+        self.lock = threading.Lock()  # The read buffer is shared
+        for name, path in (paths or {}).items():
+            self.add(name, path)
+
+    def add(self, name, path):
+        """Opens an attribute once and keeps its descriptor for later reads."""
+        self.remove(name)
+        self.paths[name] = path
+        try:
+            self.fds[name] = os.open(path, os.O_RDONLY)
+            return True
+        except OSError:
+            return False
+
+    def remove(self, name):
+        """Closes and forgets an attribute."""
+        fd = self.fds.pop(name, None)
+        self.paths.pop(name, None)
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def has(self, name):
+        """True if the attribute was opened successfully."""
+        return name in self.fds
+
+    def fileno(self, name):
+        """Raw descriptor of an attribute (for poll/select), or None."""
+        return self.fds.get(name)
+
+    def _read_locked(self, fd):
+        # Caller holds self.lock. Returns the number of valid bytes in self.buffer.
+        if hasattr(os, "preadv"):
+            return os.preadv(fd, [self.buffer], 0)
+        data = os.pread(fd, len(self.buffer), 0)
+        self.buffer[:len(data)] = data
+        return len(data)
+
+    def read_int(self, name, default=None):
+        """Reads a numeric attribute. Returns default if it is missing or unreadable."""
+        fd = self.fds.get(name)
+        if fd is None:
+            return default
+        with self.lock:
+            try:
+                n = self._read_locked(fd)
+                return int(self.view[:n])
+            except (OSError, ValueError):
+                return default
+
+    def read_text(self, name, default=None):
+        """Reads a text attribute (e.g. a thermal zone 'type')."""
+        fd = self.fds.get(name)
+        if fd is None:
+            return default
+        with self.lock:
+            try:
+                n = self._read_locked(fd)
+                return self.buffer[:n].decode("utf-8", errors="ignore").strip()
+            except OSError:
+                return default
+
+    def read_many(self, names, default=None):
+        """Batched numeric read of several attributes under one lock acquisition."""
+        values = []
+        with self.lock:
+            for name in names:
+                fd = self.fds.get(name)
+                if fd is None:
+                    values.append(default)
+                    continue
+                try:
+                    n = self._read_locked(fd)
+                    values.append(int(self.view[:n]))
+                except (OSError, ValueError):
+                    values.append(default)
+        return values
+
+    def read_into(self, names, out, default=0):
+        """Like read_many, but fills a preallocated sequence (e.g. an array) in place."""
+        fds = self.fds
+        with self.lock:
+            for i, name in enumerate(names):
+                fd = fds.get(name)
+                if fd is None:
+                    out[i] = default
+                    continue
+                try:
+                    n = self._read_locked(fd)
+                    out[i] = int(self.view[:n])
+                except (OSError, ValueError):
+                    out[i] = default
+        return out
+
+    def close(self):
+        """Releases every descriptor."""
+        for name in list(self.fds):
+            self.remove(name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
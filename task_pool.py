@@ -0,0 +1,85 @@
+import queue
+import threading
+
+class TaskPool:
+    """
+    TaskPool v1.0 - Reusable Worker Threads.
+    A fixed set of daemon threads draining one bounded job queue, so
+    recurring work does not pay for a brand-new thread on every run and
+    a backlog can never grow without limit.
+    """
+    def __init__(self, workers=4, max_queue=256, name="Worker"):
+        self.workers = workers
+        self.name = name
+        self.jobs = queue.Queue(maxsize=max_queue)
+        self.threads = []
+        self.rejected = 0
+        self.running = False
+        self.stops_owed = 0  # Stop sentinels that did not fit in a full queue
+        self.lock = threading.Lock()
+
+    def _start(self):
+        # Caller holds self.lock
+        self.running = True
+        for i in range(self.workers):
+            t = threading.Thread(target=self._worker, name=f"{self.name}-{i}", daemon=True)
+            t.start()
+            self.threads.append(t)
+
+    def submit(self, fn, *args):
+        """Queues fn(*args). Returns False (and counts a rejection) if the queue is full."""
+        if not self.running:
+            with self.lock:
+                if not self.running:
+                    self._start()
+        try:
+            self.jobs.put_nowait((fn, args))
+            return True
+        except queue.Full:
+            with self.lock:
+                self.rejected += 1
+            return False
+
+    def queue_depth(self):
+        """Jobs waiting for a free worker."""
+        return self.jobs.qsize()
+
+    def _worker(self):
+        while True:
+            if self.stops_owed:
+                # Shutting down with a full queue: finish what is queued, then exit
+                try:
+                    job = self.jobs.get_nowait()
+                except queue.Empty:
+                    with self.lock:
+                        if self.stops_owed:
+                            self.stops_owed -= 1
+                            return
+                    continue
+            else:
+                job = self.jobs.get()
+            if job is None:
+                return
+            fn, args = job
+            try:
+                fn(*args)
+            except Exception:
+                pass  # Callers wrap their own error handling
+
+    def shutdown(self, wait=True):
+        """Stops the workers once the queued jobs are done."""
+        with self.lock:
+            if not self.running:
+                return
+            self.running = False
+            threads, self.threads = self.threads, []
+        for _ in threads:
+            try:
+                self.jobs.put_nowait(None)
+            except queue.Full:
+                # Never block behind the backlog; workers collect these once it drains
+                with self.lock:
+                    self.stops_owed += 1
+        if wait:
+            for t in threads:
+                t.join()
@@ -0,0 +1,313 @@
+import os
+import mmap
+import struct
+import time
+from array import array
+
+class TelemetryStore:
+    """
+    TelemetryStore v1.0 - Long-Term Body Memory.
+    Compact on-disk time series for temperature, battery and motion.
+    Raw samples are kept in columnar arrays and written as delta-encoded
+    chunks; every sample also feeds 1-minute and 1-hour rollups stored as
+    fixed-size records, so range queries read aggregates only. Old data is
+    evicted per resolution according to its retention.
+    Rollup files are searched by bisection while their window starts only
+    grow; once the clock steps back that file is scanned linearly until
+    eviction rewrites it in order.
+    """
+    SERIES = {"temp": 100, "battery": 1, "motion": 100}  # name: fixed-point scale
+    ROLLUPS = (("1m", 60), ("1h", 3600))
+    RETENTION = {"raw": 86400, "1m": 14 * 86400, "1h": 365 * 86400}  # seconds
+    ROLLUP = struct.Struct("<qIqqq")          # window start, count, sum, min, max
+    CHUNK_HEADER = struct.Struct("<4sIqqI")   # magic, count, first ts, first value, ts column bytes
+    MAGIC = b"DSTS"
+
+    def __init__(self, directory="telemetry", chunk_size=3600, retention=None, clock=time.time):
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.retention = dict(self.RETENTION, **(retention or {}))
+        self.clock = clock
+        self.columns = {}   # { series: (timestamps, values) } not yet written
+        self.windows = {}   # { (series, resolution): [start, count, sum, min, max] } in progress
+        self.fds = {}       # { (series, resolution): fd } rollup files, append-only
+        self.records = {}   # { (series, resolution): record count }
+        self.last_start = {}  # { (series, resolution): latest window start written }
+        self.ordered = {}   # { (series, resolution): window starts never decrease (bisectable) }
+        self.sequence = 0   # Tells apart chunks that cover the same seconds
+        for name in self.SERIES:
+            os.makedirs(self._raw_dir(name), exist_ok=True)
+            self.columns[name] = (array('q'), array('q'))
+            for resolution, _ in self.ROLLUPS:
+                self._open_rollup(name, resolution)
+
+    def _raw_dir(self, name):
+        return os.path.join(self.directory, "raw", name)
+
+    def _rollup_path(self, name, resolution):
+        return os.path.join(self.directory, f"{name}.{resolution}")
+
+    def _open_rollup(self, name, resolution):
+        fd = os.open(self._rollup_path(name, resolution), os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        size = os.fstat(fd).st_size
+        if size % self.ROLLUP.size:
+            size -= size % self.ROLLUP.size  # Drop a torn record
+            os.ftruncate(fd, size)
+        key = (name, resolution)
+        self.fds[key] = fd
+        self.records[key] = size // self.ROLLUP.size
+        self.last_start[key], self.ordered[key] = None, True
+        if size:
+            with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as view:
+                for window in self.ROLLUP.iter_unpack(view):
+                    self._track_start(key, window[0])
+        return fd
+
+    def _track_start(self, key, start):
+        last = self.last_start[key]
+        if last is not None and start < last:
+            self.ordered[key] = False  # The clock went backwards
+        else:
+            self.last_start[key] = start
+
+    def _fd(self, key):
+        """Rollup file descriptor, reopened if close() released it (the store stays usable)."""
+        fd = self.fds.get(key)
+        return fd if fd is not None else self._open_rollup(*key)
+
+    # --- Writing ---
+    def record(self, timestamp=None, **values):
+        """Stores one sample per series, e.g. record(temp=41.5, battery=80, motion=0.02)."""
+        ts = int(self.clock() if timestamp is None else timestamp)
+        for name, value in values.items():
+            scale = self.SERIES.get(name)
+            if scale is None:
+                raise ValueError(f"Unknown telemetry series '{name}'")
+            if value is None or value != value:
+                continue  # Missing or NaN reading
+            v = int(round(value * scale))
+            times, vals = self.columns[name]
+            times.append(ts)
+            vals.append(v)
+            for resolution, width in self.ROLLUPS:
+                self._roll(name, resolution, ts - ts % width, v)
+            if len(times) >= self.chunk_size:
+                self._write_chunk(name)
+
+    def _roll(self, name, resolution, start, v):
+        key = (name, resolution)
+        window = self.windows.get(key)
+        if window is not None and window[0] != start:
+            self._append_rollup(key, window)
+            window = None
+        if window is None:
+            self.windows[key] = [start, 1, v, v, v]
+        else:
+            window[1] += 1
+            window[2] += v
+            if v < window[3]:
+                window[3] = v
+            if v > window[4]:
+                window[4] = v
+
+    def _append_rollup(self, key, window):
+        os.write(self._fd(key), self.ROLLUP.pack(*window))
+        self.records[key] += 1
+        ordered = self.ordered[key]
+        self._track_start(key, window[0])
+        if ordered and not self.ordered[key]:
+            print(f"[!] Telemetry: clock stepped back in {key[0]}.{key[1]}; range queries now scan")
+        limit = self.retention[key[1]] // dict(self.ROLLUPS)[key[1]]
+        if self.records[key] > limit + limit // 4:
+            self._evict_rollup(key, window[0] - self.retention[key[1]])
+
+    def _evict_rollup(self, key, cutoff):
+        """Rewrites a rollup file without windows older than cutoff, in window order."""
+        name, resolution = key
+        records = self._read_rollups(key, cutoff, None)
+        records.sort(key=lambda window: window[0])  # Stable: a split window keeps its order
+        path = self._rollup_path(name, resolution)
+        with open(path + ".tmp", "wb") as f:
+            for window in records:
+                f.write(self.ROLLUP.pack(*window))
+            f.flush()
+            os.fsync(f.fileno())
+        os.close(self._fd(key))
+        os.replace(path + ".tmp", path)
+        self._open_rollup(name, resolution)
+
+    def _write_chunk(self, name):
+        """Delta-encodes the buffered columns of a series into one chunk file."""
+        times, vals = self.columns[name]
+        if not times:
+            return
+        ts_bytes = self._encode(times)
+        header = self.CHUNK_HEADER.pack(self.MAGIC, len(times), times[0], vals[0], len(ts_bytes))
+        # Named by time range (min/max: the clock may have stepped back) plus a
+        # sequence number, so a restart that flushes the same seconds adds a chunk
+        first, last = min(times), max(times)
+        while True:
+            self.sequence += 1
+            path = os.path.join(self._raw_dir(name), f"{first:012d}-{last:012d}-{self.sequence}.chunk")
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+                break
+            except FileExistsError:
+                continue
+        with open(fd, "wb") as f:
+            f.write(header + ts_bytes + self._encode(vals))
+        self.columns[name] = (array('q'), array('q'))
+        self._evict_raw(name, last - self.retention["raw"])
+
+    def _evict_raw(self, name, cutoff):
+        for chunk in self._chunks(name):
+            if chunk[1] < cutoff:
+                try:
+                    os.remove(chunk[2])
+                except OSError:
+                    pass
+
+    def flush(self):
+        """Writes buffered raw samples. Rollup windows stay open until they complete."""
+        for name in self.SERIES:
+            self._write_chunk(name)
+
+    def close(self):
+        """Writes everything, including the rollup windows still in progress, and closes the files."""
+        self.flush()
+        for key, window in self.windows.items():
+            self._append_rollup(key, window)
+        self.windows = {}
+        for fd in self.fds.values():
+            os.close(fd)
+        self.fds = {}
+
+    # --- Delta + zigzag varint encoding ---
+    def _encode(self, column):
+        out = bytearray()
+        prev = column[0]
+        for x in column[1:]:
+            d = x - prev
+            prev = x
+            z = (d << 1) ^ (d >> 63)
+            while z >= 0x80:
+                out.append((z & 0x7F) | 0x80)
+                z >>= 7
+            out.append(z)
+        return out
+
+    def _decode(self, data, first, count):
+        column = array('q', [first])
+        prev, shift, z = first, 0, 0
+        for byte in data:
+            z |= (byte & 0x7F) << shift
+            if byte & 0x80:
+                shift += 7
+                continue
+            prev += (z >> 1) ^ -(z & 1)
+            column.append(prev)
+            shift = z = 0
+            if len(column) == count:
+                break
+        return column
+
+    # --- Reading ---
+    def _chunks(self, name):
+        """(first ts, last ts, path) of every raw chunk, oldest first."""
+        chunks = []
+        directory = self._raw_dir(name)
+        for entry in os.listdir(directory):
+            if entry.endswith(".chunk"):
+                first, last = entry[:-6].split("-")[:2]  # first-last[-sequence].chunk
+                chunks.append((int(first), int(last), os.path.join(directory, entry)))
+        chunks.sort()
+        return chunks
+
+    def raw(self, name, start, end):
+        """Raw (timestamp, value) samples of a series with start <= timestamp < end."""
+        scale = self.SERIES[name]
+        samples = []
+        for first, last, path in self._chunks(name):
+            if last < start or first >= end:
+                continue
+            with open(path, "rb") as f:
+                data = f.read()
+            magic, count, t0, v0, ts_len = self.CHUNK_HEADER.unpack_from(data)
+            body = self.CHUNK_HEADER.size
+            times = self._decode(data[body:body + ts_len], t0, count)
+            vals = self._decode(data[body + ts_len:], v0, count)
+            samples.extend((t, v / scale) for t, v in zip(times, vals) if start <= t < end)
+        times, vals = self.columns[name]
+        samples.extend((t, v / scale) for t, v in zip(times, vals) if start <= t < end)
+        return samples
+
+    def _read_rollups(self, key, start, end):
+        """
+        Rollup records with start <= window start < end, in file order. Located
+        by binary search on the mmapped file, or a full scan if it is out of order.
+        """
+        count = self.records[key]
+        if not count:
+            return []
+        size = self.ROLLUP.size
+        unpack = self.ROLLUP.unpack_from
+        with mmap.mmap(self._fd(key), count * size, access=mmap.ACCESS_READ) as view:
+            if not self.ordered[key]:
+                return [list(window) for window in self.ROLLUP.iter_unpack(view)
+                        if start <= window[0] and (end is None or window[0] < end)]
+            lo, hi = 0, count
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if unpack(view, mid * size)[0] < start:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            records = []
+            for i in range(lo, count):
+                window = unpack(view, i * size)
+                if end is not None and window[0] >= end:
+                    break
+                records.append(list(window))
+        return records
+
+    def query(self, name, start, end, resolution="1m"):
+        """
+        Aggregated windows of a series between start and end (epoch seconds).
+        Returns [(window_start, count, mean, min, max), ...] in real units,
+        including the window still in progress. Raw samples are never loaded.
+        """
+        key = (name, resolution)
+        if name not in self.SERIES or resolution not in dict(self.ROLLUPS):
+            raise ValueError(f"Unknown series/resolution {name}/{resolution}")
+        records = self._read_rollups(key, start, end)
+        window = self.windows.get(key)
+        if window is not None and start <= window[0] < end:
+            records.append(list(window))
+        if not self.ordered[key]:
+            records.sort(key=lambda w: w[0])  # Stable, so a split window's halves stay adjacent
+        scale = self.SERIES[name]
+        merged = []
+        for w in records:
+            if merged and merged[-1][0] == w[0]:
+                # A restart inside a window writes it twice; merge the halves
+                last = merged[-1]
+                last[1] += w[1]
+                last[2] += w[2]
+                last[3] = min(last[3], w[3])
+                last[4] = max(last[4], w[4])
+            else:
+                merged.append(w)
+        return [(w[0], w[1], w[2] / w[1] / scale, w[3] / scale, w[4] / scale) for w in merged]
+
+    def disk_usage(self):
+        """Bytes used on disk by raw chunks and rollups."""
+        total = 0
+        for root, _, files in os.walk(self.directory):
+            total += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+        return total
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Tests import the top-level scripts directly, like the benchmarks do
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+sys.path.insert(0, ROOT)
@@ -0,0 +1,101 @@
+import threading
+import time
+
+from adaptive_scheduler import AdaptiveScheduler
+
+
+class FakeClock:
+    """clock() and sleep() for the scheduler: sleeping just moves time forward."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def scheduler(**options):
+    clock = FakeClock()
+    return AdaptiveScheduler(clock=clock, sleep=clock.sleep, **options), clock
+
+
+def tick(sched, clock, temp, motion=0.0, battery=100):
+    """One survival-loop pass: read, decide, sleep."""
+    interval = sched.update(temp, motion, battery)
+    sched.wait(interval)
+    return interval
+
+
+def test_stable_readings_back_off_exponentially_up_to_max():
+    sched, clock = scheduler(base_interval=1.0, max_interval=8.0, backoff=2.0)
+    intervals = [tick(sched, clock, 35.0) for _ in range(6)]
+    assert intervals == [2.0, 4.0, 8.0, 8.0, 8.0, 8.0]
+    assert sched.state == "idle"
+    assert clock.slept == intervals
+
+
+def test_fast_heating_polls_at_min_interval():
+    sched, clock = scheduler(min_interval=0.25, slope_alert=0.2, smoothing=1.0)
+    for _ in range(3):
+        tick(sched, clock, 35.0)
+    assert sched.interval > 1.0
+    temp = 35.0
+    for _ in range(2):
+        temp += 2.0 * sched.interval  # +2 C/s
+        interval = tick(sched, clock, temp)
+    assert sched.state == "alert"
+    assert interval == 0.25
+    # Cooling back to stable returns to the base rate first, then backs off again
+    assert tick(sched, clock, temp) == 2.0
+
+
+def test_moderate_change_uses_base_interval():
+    sched, clock = scheduler(base_interval=1.0, slope_alert=0.2, stable_slope=0.02, smoothing=1.0)
+    tick(sched, clock, 35.0)
+    assert tick(sched, clock, 35.0 + 0.1 * 2.0) == 1.0  # 0.1 C/s: neither stable nor alarming
+    assert sched.state == "normal"
+
+
+def test_motion_forces_alert_and_quiet_motion_allows_idle():
+    sched, clock = scheduler(min_interval=0.25, motion_alert=3.0, motion_quiet=0.5)
+    assert tick(sched, clock, 35.0, motion=4.0) == 0.25
+    assert sched.state == "alert"
+    assert tick(sched, clock, 35.0, motion=1.0) == 1.0  # Between quiet and alert
+    assert tick(sched, clock, 35.0, motion=0.1) == 2.0
+
+
+def test_low_battery_never_polls_faster_than_its_interval_unless_alerting():
+    sched, clock = scheduler(base_interval=1.0, low_battery_interval=5.0, min_interval=0.25)
+    assert tick(sched, clock, 35.0, battery=15) == 5.0
+    assert tick(sched, clock, 35.0, battery=15) == 10.0  # Back-off continues from there
+    assert tick(sched, clock, 35.0, motion=9.0, battery=15) == 0.25
+    assert tick(sched, clock, 35.0, battery=80) == 2.0
+
+
+def test_wake_ends_the_next_wait_without_sleeping():
+    sched, clock = scheduler()
+    sched.wake()
+    sched.wake()  # Coalesced with the first
+    assert sched.wait(5.0) is True
+    assert clock.slept == []
+    assert sched.wait(5.0) is False
+    assert clock.slept == [5.0]
+    assert (sched.wakeups, sched.event_wakeups) == (2, 1)
+
+
+def test_wake_from_another_thread_interrupts_a_real_wait():
+    sched = AdaptiveScheduler()
+    try:
+        timer = threading.Timer(0.05, sched.wake)
+        timer.start()
+        start = time.monotonic()
+        assert sched.wait(5.0) is True
+        assert time.monotonic() - start < 2.0
+        timer.join()
+    finally:
+        sched.close()
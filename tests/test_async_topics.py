@@ -0,0 +1,36 @@
+import asyncio
+
+from _scripts import load_script
+
+AsyncRoboAir = load_script("roboair2").AsyncRoboAir
+
+
+async def exchange(port):
+    pub = AsyncRoboAir(port, "pub", host="127.0.0.2")
+    sub = AsyncRoboAir(port, "sub", host="127.0.0.3")
+    late = AsyncRoboAir(port, "late", host="127.0.0.4")
+    nodes = (pub, sub, late)
+    for node in nodes:
+        node.log = node.printer.print = lambda *args: None
+    sub.subscribe("lidar") # Before start: joined by start()
+    for node in nodes:
+        await node.start()
+    late.subscribe("battery") # While running: opened on the loop
+    await asyncio.sleep(0.05)
+    try:
+        assert pub.publish("lidar", "scan 1")
+        assert pub.publish("battery", "81%")
+        assert pub.publish("map", "nobody listens")
+        got_sub = await sub.receive(timeout=1.0)
+        got_late = await late.receive(timeout=1.0)
+        assert await sub.receive(timeout=0.2) is None
+        return got_sub, got_late
+    finally:
+        for node in nodes:
+            node.stop()
+
+
+def test_async_nodes_publish_and_subscribe_on_the_loop():
+    got_sub, got_late = asyncio.run(exchange(5790))
+    assert (got_sub["topic"], got_sub["msg"]) == ("lidar", "scan 1")
+    assert (got_late["topic"], got_late["msg"]) == ("battery", "81%")
@@ -0,0 +1,44 @@
+from link_framer import FrameDecoder
+
+
+def feed_bytewise(decoder, data):
+    frames = []
+    for i in range(len(data)):
+        frames += decoder.feed(data[i:i + 1])
+    return frames
+
+
+def test_text_and_frames_interleave():
+    decoder = FrameDecoder()
+    data = b"T:1 bat=80\n" + FrameDecoder.encode(b"a\nb") + b"T:2 bat=79\n"
+    assert decoder.feed(data) == [("line", "T:1 bat=80"), ("frame", b"a\nb"), ("line", "T:2 bat=79")]
+
+
+def test_noise_before_a_frame_does_not_swallow_it():
+    decoder = FrameDecoder()
+    frames = decoder.feed(b"\x00\x01" + FrameDecoder.encode(b"hello") + FrameDecoder.encode(b"world"))
+    assert frames == [("frame", b"hello"), ("frame", b"world")]
+    assert decoder.skipped == 2
+
+
+def test_noise_before_a_frame_split_across_reads():
+    decoder = FrameDecoder()
+    data = b"\xff\xfejunk" + FrameDecoder.encode(b"imu") + b"T:3\n"
+    assert feed_bytewise(decoder, data) == [("frame", b"imu"), ("line", "T:3")]
+
+
+def test_text_containing_sync_bytes_stays_text():
+    decoder = FrameDecoder()
+    data = "cost ¥Z12\n".encode() + FrameDecoder.encode(b"x")
+    assert feed_bytewise(decoder, data) == [("line", "cost ¥Z12"), ("frame", b"x")]
+    assert decoder.crc_errors == 0
+
+
+def test_corrupt_frame_resynchronises():
+    decoder = FrameDecoder()
+    bad = bytearray(FrameDecoder.encode(b"payload"))
+    bad[5] ^= 0xFF
+    frames = decoder.feed(bytes(bad) + FrameDecoder.encode(b"next") + b"ok\n")
+    assert ("frame", b"next") in frames
+    assert frames[-1] == ("line", "ok")
+    assert decoder.crc_errors == 1
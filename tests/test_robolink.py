@@ -0,0 +1,117 @@
+"""
+Drives RoboLink's reader thread end to end against a pty: the master side
+plays the microcontroller. pyserial is used when installed; otherwise a
+minimal serial.Serial over the pty slave stands in for it.
+"""
+import fcntl
+import os
+import pty
+import select
+import struct
+import sys
+import termios
+import time
+import tty
+import types
+
+import pytest
+
+from _scripts import load_script
+from link_framer import FrameDecoder
+
+
+class PtySerial:
+    """The part of serial.Serial RoboLink uses, over a tty device."""
+
+    def __init__(self, port, baudrate=9600, timeout=None):
+        self.fd = os.open(port, os.O_RDWR | os.O_NOCTTY)
+        tty.setraw(self.fd)
+        self.timeout = timeout
+        self.is_open = True
+
+    @property
+    def in_waiting(self):
+        return struct.unpack("I", fcntl.ioctl(self.fd, termios.FIONREAD, b"\0\0\0\0"))[0]
+
+    def readinto(self, buf):
+        ready, _, _ = select.select([self.fd], [], [], self.timeout)
+        return os.readv(self.fd, [buf]) if ready else 0
+
+    def write(self, data):
+        return os.write(self.fd, data)
+
+    def close(self):
+        if self.is_open:
+            self.is_open = False
+            os.close(self.fd)
+
+
+def serial_module():
+    try:
+        import serial
+        import serial.tools.list_ports
+        return serial
+    except ImportError:
+        serial = types.ModuleType("serial")
+        serial.Serial = PtySerial
+        serial.tools = types.ModuleType("serial.tools")
+        serial.tools.list_ports = types.ModuleType("serial.tools.list_ports")
+        serial.tools.list_ports.comports = lambda: []
+        return serial
+
+
+@pytest.fixture
+def link(monkeypatch):
+    serial = serial_module()
+    monkeypatch.setitem(sys.modules, "serial", serial)
+    monkeypatch.setitem(sys.modules, "serial.tools", serial.tools)
+    monkeypatch.setitem(sys.modules, "serial.tools.list_ports", serial.tools.list_ports)
+    monkeypatch.delitem(sys.modules, "robolink", raising=False)
+    RoboLink = load_script("robolink").RoboLink
+    master, slave = pty.openpty()
+    tty.setraw(slave)
+    link = RoboLink(port=os.ttyname(slave), baudrate=115200, timeout=0.05)
+    link.log = lambda message: None
+    assert link.connect()
+    yield link, master
+    link.disconnect()
+    link.thread.join(2)
+    os.close(master)
+    os.close(slave)
+
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_listen_splits_lines_and_frames(link):
+    link, master = link
+    lines = []
+    link.on_line = lines.append
+    os.write(master, b"T:1 bat=80\n\x00\x01" + FrameDecoder.encode(b"imu-1"))
+    os.write(master, FrameDecoder.encode(b"imu-2")[:3])
+    time.sleep(0.05)
+    os.write(master, FrameDecoder.encode(b"imu-2")[3:] + b"T:2 bat=79\n")
+    assert wait_until(lambda: len(lines) == 2)
+    assert lines == ["T:1 bat=80", "T:2 bat=79"]
+    assert link.get_latest() == "T:2 bat=79"
+    assert link.get_frames() == [b"imu-1", b"imu-2"]
+    assert link.get_frames() == []
+
+
+def test_send_and_send_frame_reach_the_device(link):
+    link, master = link
+    assert link.send("GET_SENSORS")
+    assert link.send_frame(b"\x01\x02")
+    expected = b"GET_SENSORS\n" + FrameDecoder.encode(b"\x01\x02")
+    received = b""
+    deadline = time.monotonic() + 2
+    while len(received) < len(expected) and time.monotonic() < deadline:
+        if select.select([master], [], [], 0.1)[0]:
+            received += os.read(master, 4096)
+    assert received == expected
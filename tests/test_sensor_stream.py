@@ -0,0 +1,100 @@
+import subprocess
+import sys
+
+import pytest
+
+import sensor_stream
+from sensor_stream import AccelerometerStream
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def spawned(monkeypatch):
+    """Counts the processes start() forks."""
+    calls = []
+    real = subprocess.Popen
+
+    def popen(args, **kwargs):
+        calls.append(args)
+        return real(args, **kwargs)
+
+    monkeypatch.setattr(sensor_stream.subprocess, "Popen", popen)
+    return calls
+
+
+def stream(code, clock):
+    # The stream appends "-s accelerometer -d N": they land in the script's argv
+    return AccelerometerStream(command=[sys.executable, "-c", code], clock=clock)
+
+
+def run_until_exit(accel):
+    assert accel.start()
+    accel.thread.join(10)
+    assert not accel.running
+
+
+def test_dead_process_is_not_respawned_every_tick(spawned):
+    clock = FakeClock()
+    accel = stream("pass", clock)
+    run_until_exit(accel)
+    assert (accel.exits, accel.failures, accel.retry_at) == (1, 1, 1001.0)
+    for _ in range(50):  # A fast polling loop
+        assert not accel.start()
+    assert len(spawned) == 1
+
+    clock.now += 1.0
+    run_until_exit(accel)
+    assert (accel.failures, accel.retry_at) == (2, 1003.0)
+    clock.now += 1.0
+    assert not accel.start()
+    clock.now += 1.0
+    run_until_exit(accel)
+    assert (accel.failures, accel.retry_at) == (3, 1007.0)
+    assert len(spawned) == 3
+    accel.stop()
+
+
+def test_backoff_is_capped(spawned):
+    clock = FakeClock()
+    accel = stream("pass", clock)
+    accel.failures = 20
+    run_until_exit(accel)
+    assert accel.retry_at - clock.now == AccelerometerStream.MAX_RESTART_DELAY
+    accel.stop()
+
+
+def test_stable_run_resets_backoff(spawned):
+    clock = FakeClock()
+    accel = stream("import time; time.sleep(0.3)", clock)
+    accel.failures = 5
+    assert accel.start()
+    clock.now += AccelerometerStream.STABLE_AFTER  # Ran long enough to count as healthy
+    accel.thread.join(10)
+    assert (accel.failures, accel.retry_at) == (1, clock.now + AccelerometerStream.RESTART_DELAY)
+    accel.stop()
+
+
+def test_stop_is_not_a_failure(spawned):
+    clock = FakeClock()
+    accel = stream("import time; time.sleep(30)", clock)
+    assert accel.start()
+    accel.stop()
+    accel.thread.join(10)
+    assert (accel.exits, accel.failures, accel.retry_at) == (0, 0, None)
+    assert accel.start()
+    accel.stop()
+
+
+def test_missing_executable_is_tried_once(spawned):
+    accel = AccelerometerStream(command="droidsense-no-such-sensor")
+    assert not accel.start()
+    assert not accel.start()
+    assert not accel.available
+    assert len(spawned) == 1
@@ -0,0 +1,65 @@
+import os
+
+from telemetry_store import TelemetryStore
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000_020):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_query_survives_clock_stepping_back(tmp_path):
+    clock = FakeClock()
+    store = TelemetryStore(str(tmp_path), clock=clock)
+    base = 1_000_000_020 - 1_000_000_020 % 60
+    for minute, temp in ((0, 40), (1, 41), (2, 42), (3, 43)):
+        store.record(timestamp=base + minute * 60, temp=temp)
+    for minute, temp in ((1, 51), (2, 52), (5, 55)):  # NTP sync: back two minutes
+        store.record(timestamp=base + minute * 60, temp=temp)
+    assert not store.ordered[("temp", "1m")]
+
+    windows = store.query("temp", base + 60, base + 180)
+    assert [(w[0] - base, w[1], w[2]) for w in windows] == [(60, 2, 46.0), (120, 2, 47.0)]
+    assert [w[0] - base for w in store.query("temp", base, base + 3600)] == [0, 60, 120, 180, 300]
+    store.close()
+
+    reopened = TelemetryStore(str(tmp_path), clock=clock)  # Disorder is found again on open
+    assert not reopened.ordered[("temp", "1m")]
+    assert [w[2] for w in reopened.query("temp", base + 60, base + 180)] == [46.0, 47.0]
+    reopened.close()
+
+
+def test_eviction_restores_bisectable_order(tmp_path):
+    store = TelemetryStore(str(tmp_path), retention={"1m": 600})  # Rewrites after 12 windows
+    for minute in (0, 1, 2, 3, 1, 2, 3, 4, 5, 6, 7, 8, 9):
+        store.record(timestamp=minute * 60, temp=minute)
+    assert not store.ordered[("temp", "1m")]
+    store.record(timestamp=10 * 60, temp=10)  # Closes the 13th window: evicts, sorted
+    assert store.ordered[("temp", "1m")]
+    windows = store.query("temp", 0, 3600)
+    assert [w[0] // 60 for w in windows] == list(range(11))
+    assert [w[1] for w in windows[:5]] == [1, 2, 2, 2, 1]
+    store.close()
+
+
+def test_restart_within_the_same_seconds_keeps_both_chunks(tmp_path):
+    for temp in (40, 41):
+        with TelemetryStore(str(tmp_path)) as store:
+            store.record(timestamp=1_000_000_000, temp=temp)
+            store.record(timestamp=1_000_000_001, temp=temp)
+    chunks = os.listdir(tmp_path / "raw" / "temp")
+    assert len(chunks) == 2
+    with TelemetryStore(str(tmp_path)) as store:
+        assert sorted(store.raw("temp", 0, 2_000_000_000)) == [
+            (1_000_000_000, 40.0), (1_000_000_000, 41.0), (1_000_000_001, 40.0), (1_000_000_001, 41.0)]
+
+
+def test_chunk_range_covers_samples_after_a_step_back(tmp_path):
+    with TelemetryStore(str(tmp_path)) as store:
+        store.record(timestamp=2000, temp=40)
+        store.record(timestamp=1000, temp=41)
+    with TelemetryStore(str(tmp_path)) as store:
+        assert store.raw("temp", 900, 1100) == [(1000, 41.0)]
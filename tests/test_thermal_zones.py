@@ -0,0 +1,113 @@
+import math
+import os
+
+import pytest
+
+from thermal_zones import ThermalZones
+
+
+def make_sysfs(root, zones, battery=80):
+    """
+    Builds root/class/thermal/thermal_zoneN/{type,temp} from {N: (type, temp)}.
+    temp None leaves the file out; a str is written as is (e.g. garbage).
+    """
+    base = os.path.join(root, "class", "thermal")
+    os.makedirs(os.path.join(base, "cooling_device0"))  # Not a zone: ignored
+    for number, (zone_type, temp) in zones.items():
+        zone = os.path.join(base, f"thermal_zone{number}")
+        os.makedirs(zone)
+        if zone_type is not None:
+            with open(os.path.join(zone, "type"), "w") as f:
+                f.write(zone_type + "\n")
+        if temp is not None:
+            with open(os.path.join(zone, "temp"), "w") as f:
+                f.write(f"{temp}\n")
+    supply = os.path.join(root, "class", "power_supply", "battery")
+    os.makedirs(supply)
+    with open(os.path.join(supply, "capacity"), "w") as f:
+        f.write(f"{battery}\n")
+    return str(root)
+
+
+ZONES = {
+    0: ("cpu", 45000),     # milli-Celsius
+    1: ("cpu", 52000),     # Same type again: becomes "cpu#1"
+    2: ("battery", 38),    # Already Celsius
+    3: ("gpu", "EIO"),     # Opens, but never yields a number
+    5: ("modem", None),    # No temp file: not a zone we can read
+    10: (None, 30500),     # No type file: named after its directory
+}
+
+
+@pytest.fixture
+def zones(tmp_path):
+    thermal = ThermalZones(make_sysfs(tmp_path, ZONES))
+    yield thermal
+    thermal.close()
+
+
+def test_discovery_orders_and_names_zones(zones):
+    assert zones.types == ["cpu", "cpu#1", "battery", "gpu", "thermal_zone10"]
+    assert len(zones) == 5
+    assert zones.index["cpu#1"] == 1
+
+
+def test_snapshot_converts_units_and_marks_unreadable_zones(zones):
+    temps = zones.get_temperatures()
+    assert list(temps[:3]) == [45.0, 52.0, 38]
+    assert math.isnan(temps[3])
+    assert temps[4] == 30.5
+    assert temps is zones.get_temperatures()  # One reused array
+    assert zones.get_temperature("cpu#1") == 52.0
+    assert zones.get_temperature("gpu", default=-1) == -1
+    assert zones.get_temperature("missing", default=-1) == -1
+
+
+def test_hottest_skips_unreadable_zones(zones):
+    assert zones.hottest() == ("cpu#1", 52.0)
+    nan = float("nan")
+    zone, temp = zones.hottest([nan] * len(zones))
+    assert zone is None and math.isnan(temp)
+    assert zones.hottest([nan] * len(zones), default=41.0) == (None, 41.0)
+
+
+def test_over_limit_uses_per_type_limits(zones):
+    assert zones.over_limit(50) == [("cpu#1", 52.0)]
+    assert zones.over_limit(50, {"cpu#1": 60, "battery": 37}) == [("battery", 38)]
+    assert zones.over_limit(20, {"cpu": 46, "cpu#1": 60, "battery": 40}) == [("thermal_zone10", 30.5)]
+
+
+@pytest.fixture
+def device_factory(tmp_path, monkeypatch):
+    import droidsense3
+    monkeypatch.chdir(tmp_path)  # Journal and telemetry files land here
+    devices = []
+
+    def build(zones):
+        root = make_sysfs(tmp_path / f"sys{len(devices)}", zones)
+        device = droidsense3.DroidSense(sysfs_root=root)
+        devices.append(device)
+        return device
+
+    yield build
+    for device in devices:
+        if device.telemetry is not None:
+            device.telemetry.close()
+        device.thermal.close()
+
+
+def test_check_heat_reads_every_zone(device_factory):
+    device = device_factory(ZONES)
+    assert device.check_heat(50, {"battery": 37}, fallback=44.0) == (52.0, [("cpu#1", 52.0), ("battery", 38)])
+
+
+def test_check_heat_falls_back_to_zone0_when_no_zone_is_readable(device_factory):
+    device = device_factory({0: ("cpu", "EIO"), 1: ("gpu", "EIO")})
+    assert device.check_heat(42, fallback=44.0) == (44.0, [("zone0", 44.0)])
+    assert device.check_heat(50, fallback=44.0) == (44.0, [])
+
+
+def test_check_heat_falls_back_to_zone0_without_zones(device_factory):
+    device = device_factory({})
+    assert len(device.thermal) == 0
+    assert device.check_heat(42, fallback=44.0) == (44.0, [("zone0", 44.0)])
@@ -0,0 +1,127 @@
+import math
+from array import array
+
+class ThermalTrend:
+    """
+    ThermalTrend v1.0 - Heat Premonition.
+    Online least-squares fit over a fixed ring buffer of recent temperatures.
+    Every update is O(1): running sums are adjusted for the sample that
+    enters and the one that leaves. From the fitted slope it predicts the
+    time until a limit is crossed and raises an early warning while there
+    is still time to shed load. No NumPy required.
+    """
+    RESYNC_EVERY = 1024  # Rebase the time origin now and then to keep the sums precise
+
+    def __init__(self, limit, window=30, horizon=60.0, min_slope=0.005, min_samples=5, on_warning=None):
+        self.limit = limit
+        self.window = window
+        self.horizon = horizon          # Warn when the limit is predicted within this many seconds
+        self.min_slope = min_slope      # C/s; flatter trends never warn
+        self.min_samples = min_samples
+        self.on_warning = on_warning    # Optional callback(event dict)
+        self.times = array('d', bytes(8 * window))
+        self.temps = array('d', bytes(8 * window))
+        self.head = 0
+        self.count = 0
+        self.total = 0
+        self.origin = None              # Times are stored relative to this
+        self.st = self.sy = self.stt = self.sty = 0.0
+        self.armed = True
+        self.warnings = 0
+
+    def update(self, timestamp, temp):
+        """Adds one reading. Returns a warning event dict when one fires, else None."""
+        if temp != temp:
+            return None  # NaN / unreadable
+        if self.origin is None:
+            self.origin = timestamp
+        t = timestamp - self.origin
+        if self.count == self.window:
+            old_t, old_y = self.times[self.head], self.temps[self.head]
+            self.st -= old_t
+            self.sy -= old_y
+            self.stt -= old_t * old_t
+            self.sty -= old_t * old_y
+        else:
+            self.count += 1
+        self.times[self.head] = t
+        self.temps[self.head] = temp
+        self.st += t
+        self.sy += temp
+        self.stt += t * t
+        self.sty += t * temp
+        self.head = (self.head + 1) % self.window
+        self.total += 1
+        if self.total % self.RESYNC_EVERY == 0:
+            self._rebase()
+        return self._check(timestamp, temp)
+
+    def _rebase(self):
+        """Moves the time origin to the oldest sample and recomputes the sums exactly."""
+        oldest = self.head if self.count == self.window else 0
+        shift = self.times[oldest]
+        self.origin += shift
+        self.st = self.sy = self.stt = self.sty = 0.0
+        for i in range(self.count):
+            t = self.times[i] - shift
+            self.times[i] = t
+            y = self.temps[i]
+            self.st += t
+            self.sy += y
+            self.stt += t * t
+            self.sty += t * y
+
+    def slope(self):
+        """Fitted trend in C/s (0.0 until enough samples)."""
+        n = self.count
+        if n < 2:
+            return 0.0
+        denom = n * self.stt - self.st * self.st
+        if denom <= 0:
+            return 0.0
+        return (n * self.sty - self.st * self.sy) / denom
+
+    def fitted(self, slope=None):
+        """Fitted temperature at the newest sample (less noisy than the raw reading)."""
+        if not self.count:
+            return 0.0
+        if slope is None:
+            slope = self.slope()
+        newest = self.times[(self.head - 1) % self.window]
+        mean_t = self.st / self.count
+        return self.sy / self.count + slope * (newest - mean_t)
+
+    def time_to_limit(self, limit=None):
+        """Predicted seconds until the limit is crossed; 0.0 if already over, inf if not heading there."""
+        limit = self.limit if limit is None else limit
+        if self.count < self.min_samples:
+            return math.inf
+        slope = self.slope()
+        now = self.fitted(slope)
+        if now >= limit:
+            return 0.0
+        if slope < self.min_slope:
+            return math.inf
+        return (limit - now) / slope
+
+    def _check(self, timestamp, temp):
+        eta = self.time_to_limit()
+        if eta > 2 * self.horizon:
+            self.armed = True  # Re-arm once the danger has clearly passed
+        if not self.armed or eta > self.horizon or eta == 0.0:
+            return None
+        self.armed = False
+        self.warnings += 1
+        event = {
+            "timestamp": timestamp,  # The caller's own clock; origin may just have been rebased
+            "temp": temp,
+            "slope": self.slope(),
+            "eta": eta,
+            "limit": self.limit,
+        }
+        if self.on_warning:
+            try:
+                self.on_warning(event)
+            except Exception:
+                pass
+        return event
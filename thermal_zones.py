@@ -0,0 +1,128 @@
+import os
+import re
+from array import array
+from sysfs_reader import SysfsReader
+
+class ThermalZones:
+    """
+    ThermalZones v1.0 - Whole-Device Heat Map.
+    Discovers every /sys/class/thermal/thermal_zone* once and reads all of
+    them into a single array snapshot, so hotspots outside zone0 are not missed.
+    """
+    ZONE_DIR = "class/thermal"
+    ZONE_PATTERN = re.compile(r"^thermal_zone(\d+)$")
+    UNREADABLE = float("nan")
+
+    def __init__(self, root="/sys"):
+        self.root = root
+        self.types = []   # Zone type per slot, e.g. ['cpu-0-0', 'gpu', 'battery', ...]
+        self.paths = []   # temp file per slot
+        self.index = {}   # { 'type': slot }
+        self.reader = SysfsReader()
+        self._raw = array('q')
+        self._celsius = array('d')
+        self.discover()
+
+    def discover(self):
+        """Builds the type -> temp file index. Called once at construction."""
+        self.reader.close()
+        self.types, self.paths, self.index = [], [], {}
+        base = os.path.join(self.root, self.ZONE_DIR)
+        try:
+            entries = os.listdir(base)
+        except OSError:
+            entries = []
+
+        zones = []
+        for entry in entries:
+            match = self.ZONE_PATTERN.match(entry)
+            if match:
+                zones.append((int(match.group(1)), entry))
+        zones.sort()
+
+        for number, entry in zones:
+            zone_dir = os.path.join(base, entry)
+            temp_path = os.path.join(zone_dir, "temp")
+            slot = len(self.types)
+            if not self.reader.add(slot, temp_path):
+                continue
+            try:
+                with open(os.path.join(zone_dir, "type"), "r") as f:
+                    zone_type = f.read().strip() or entry
+            except OSError:
+                zone_type = entry
+            # Some vendors reuse a type name for several sensors
+            if zone_type in self.index:
+                zone_type = f"{zone_type}#{number}"
+            self.index[zone_type] = slot
+            self.types.append(zone_type)
+            self.paths.append(temp_path)
+
+        self._slots = tuple(range(len(self.types)))
+        self._raw = array('q', bytes(8 * len(self.types)))
+        self._celsius = array('d', bytes(8 * len(self.types)))
+        return len(self.types)
+
+    def __len__(self):
+        return len(self.types)
+
+    def get_temperatures(self):
+        """
+        Reads every zone into one array('d') of Celsius values, ordered like self.types.
+        Unreadable zones are NaN. The array is reused: copy it if you need to keep it.
+        """
+        raw, out = self._raw, self._celsius
+        missing = -(1 << 62)
+        self.reader.read_into(self._slots, raw, missing)
+        for i, value in enumerate(raw):
+            if value == missing:
+                out[i] = self.UNREADABLE
+            else:
+                # Most kernels report milli-Celsius
+                out[i] = value / 1000.0 if value > 1000 else value
+        return out
+
+    def get_temperature(self, zone_type, default=0.0):
+        """Reads a single zone by its type name."""
+        slot = self.index.get(zone_type)
+        if slot is None:
+            return default
+        value = self.reader.read_int(slot)
+        if value is None:
+            return default
+        return value / 1000.0 if value > 1000 else value
+
+    def as_dict(self, temps=None):
+        """Maps zone type to temperature for display or logging."""
+        if temps is None:
+            temps = self.get_temperatures()
+        return dict(zip(self.types, temps))
+
+    def over_limit(self, limit, zone_limits=None, temps=None):
+        """
+        Checks every zone against its threshold in one pass.
+        zone_limits overrides the default limit per zone type.
+        Returns a list of (zone_type, temp) that are over the limit.
+        """
+        if temps is None:
+            temps = self.get_temperatures()
+        zone_limits = zone_limits or {}
+        hot = []
+        for zone_type, temp in zip(self.types, temps):
+            # NaN compares False, so unreadable zones never alarm
+            if temp > zone_limits.get(zone_type, limit):
+                hot.append((zone_type, temp))
+        return hot
+
+    def hottest(self, temps=None, default=UNREADABLE):
+        """Returns (zone_type, temp) of the hottest readable zone, or (None, default) if none is."""
+        if temps is None:
+            temps = self.get_temperatures()
+        best, best_temp = None, default
+        for zone_type, temp in zip(self.types, temps):
+            if temp == temp and (best is None or temp > best_temp):
+                best, best_temp = zone_type, temp
+        return best, best_temp
+
+    def close(self):
+        self.reader.close()
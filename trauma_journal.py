@@ -0,0 +1,121 @@
+import os
+import mmap
+import struct
+import time
+
+class TraumaJournal:
+    """
+    TraumaJournal v1.0 - Append-Only Event Memory.
+    Physical events are appended as fixed-size binary records instead of
+    rewriting a JSON file on every event. fsync is batched, the file is
+    compacted once it grows past its budget, and the tail is read through mmap.
+    """
+    MAGIC = b"DSTJ"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHH")     # magic, version, record size
+    RECORD = struct.Struct("<ddBb6x")   # timestamp, value, type code, battery (-1 = unknown)
+    TYPES = ("UNKNOWN", "OVERHEAT", "MOTION", "LOW_BATTERY", "HEAT_WARNING")  # Append only
+
+    def __init__(self, path, max_records=10000, sync_every=32, sync_interval=5.0, clock=time.time):
+        self.path = path
+        self.max_records = max_records
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.clock = clock
+        self.codes = {name: i for i, name in enumerate(self.TYPES)}
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+        self.fd = None
+        self._open()
+
+    def _open(self):
+        self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        size = os.fstat(self.fd).st_size
+        if size < self.HEADER.size:
+            os.ftruncate(self.fd, 0)
+            os.write(self.fd, self.HEADER.pack(self.MAGIC, self.VERSION, self.RECORD.size))
+            os.fsync(self.fd)
+            size = self.HEADER.size
+        else:
+            magic, version, record_size = self.HEADER.unpack(os.pread(self.fd, self.HEADER.size, 0))
+            if magic != self.MAGIC or record_size != self.RECORD.size:
+                os.close(self.fd)
+                self.fd = None
+                raise ValueError(f"{self.path} is not a trauma journal (v{self.VERSION})")
+        # A crash mid-append can leave a partial record; drop it
+        body = size - self.HEADER.size
+        if body % self.RECORD.size:
+            os.ftruncate(self.fd, size - body % self.RECORD.size)
+        self.count = body // self.RECORD.size
+
+    def append(self, event_type, value, battery=None, timestamp=None):
+        """Appends one event: a single write(), fsync'd in batches."""
+        record = self.RECORD.pack(
+            self.clock() if timestamp is None else timestamp,
+            float(value),
+            self.codes.get(event_type, 0),
+            -1 if battery is None else max(-1, min(int(battery), 127)),
+        )
+        os.write(self.fd, record)
+        self.count += 1
+        self.unsynced += 1
+        if (self.unsynced >= self.sync_every
+                or time.monotonic() - self.last_sync >= self.sync_interval):
+            self.sync()
+        if self.count >= 2 * self.max_records:
+            self.compact()
+
+    def sync(self):
+        """Forces pending records to flash."""
+        if self.unsynced:
+            os.fsync(self.fd)
+            self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    def _decode(self, raw):
+        timestamp, value, code, battery = raw
+        return {
+            "timestamp": timestamp,
+            "type": self.TYPES[code] if code < len(self.TYPES) else "UNKNOWN",
+            "value": value,
+            "battery_at_time": None if battery < 0 else battery,
+        }
+
+    def tail(self, n):
+        """Returns the last n events (oldest first), mapping only the file, not reading it all."""
+        n = min(n, self.count)
+        if n <= 0:
+            return []
+        size = self.HEADER.size + self.count * self.RECORD.size
+        with mmap.mmap(self.fd, size, access=mmap.ACCESS_READ) as view:
+            start = size - n * self.RECORD.size
+            return [self._decode(raw) for raw in self.RECORD.iter_unpack(view[start:size])]
+
+    def compact(self):
+        """Rewrites the journal keeping only the newest max_records events."""
+        self.sync()
+        keep = min(self.count, self.max_records)
+        size = self.HEADER.size + self.count * self.RECORD.size
+        with mmap.mmap(self.fd, size, access=mmap.ACCESS_READ) as view:
+            body = view[size - keep * self.RECORD.size:size]
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.VERSION, self.RECORD.size))
+            f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+        os.close(self.fd)
+        os.replace(tmp_path, self.path)
+        self._open()
+
+    def close(self):
+        if self.fd is not None:
+            self.sync()
+            os.close(self.fd)
+            self.fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
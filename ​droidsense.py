@@ -1,5 +1,6 @@
 import os
 import time
+from sysfs_reader import SysfsReader
 
 class DroidSense:
     """
@@ -11,6 +12,8 @@ class DroidSense:
     BATTERY_PATH = "/sys/class/power_supply/battery/capacity"
 
     def __init__(self):
+        # Descriptors stay open for the lifetime of the object
+        self.sensors = SysfsReader({"temp": self.THERMAL_PATH, "battery": self.BATTERY_PATH})
         self.check_compatibility()
 
     def check_compatibility(self):
@@ -19,21 +22,18 @@ class DroidSense:
 
     def get_temperature(self):
         """Returns the CPU temperature in Celsius."""
-        try:
-            with open(self.THERMAL_PATH, "r") as f:
-                temp = int(f.read().strip())
-                # Some kernels return milli-Celsius
-                return temp / 1000.0 if temp > 1000 else temp
-        except Exception as e:
-            return f"Error reading temp: {e}"
+        temp = self.sensors.read_int("temp")
+        if temp is None:
+            return f"Error reading temp: {self.THERMAL_PATH} unavailable"
+        # Some kernels return milli-Celsius
+        return temp / 1000.0 if temp > 1000 else temp
 
     def get_battery(self):
         """Returns the battery percentage."""
-        try:
-            with open(self.BATTERY_PATH, "r") as f:
-                return int(f.read().strip())
-        except Exception as e:
-            return f"Error reading battery: {e}"
+        bat = self.sensors.read_int("battery")
+        if bat is None:
+            return f"Error reading battery: {self.BATTERY_PATH} unavailable"
+        return bat
 
     def monitor_survival(self, temp_threshold=45):
         """
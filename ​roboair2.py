@@ -1,23 +1,81 @@
+import errno
 import socket
+import sys
+import asyncio
 import threading
 import time
 import json
+import itertools
 from datetime import datetime
+from air_sender import DatagramSender
+from air_protocol import BinaryCodec
+from peer_table import PeerTable
+from air_inbox import RingInbox, BufferPool, BackgroundPrinter
+from air_reliable import ReliableChannel
 
 class RoboAir:
     """
     RoboAir v2.0 - Advanced Peer-to-Peer Robotic Networking.
     Features: Device Discovery, Heartbeat Monitoring, and Targeted Messaging.
+
+    Wire formats: every JSON packet advertises "fmt" (the binary codec
+    version this node speaks). Peers that advertise it get compact
+    BinaryCodec packets; everyone else keeps getting JSON. Broadcasts go
+    binary only once every known peer speaks it. wire="json" turns the
+    binary format off entirely (behaves like a legacy node).
+
+    send_reliable() is the acknowledged alternative to send_message() for
+    binary peers: payloads of any size, delivered in order, retransmitted
+    until acked (see ReliableChannel). They arrive in the inbox like chats,
+    with "msg" holding the bytes and "reliable" set.
+
+    Topics: subscribe(topic) joins the topic's IP multicast group (on
+    topic_port, default port + 1) and publish(topic, message) sends to it,
+    so only subscribers receive the traffic at all. Groups can be shared
+    by several topics, so the receive path still checks the topic hash in
+    the packet header and drops strangers before decoding anything.
+    Topic messages reach the inbox with "topic" set.
     """
-    def __init__(self, port=5005, node_name="Unnamed-Robot"):
+    WIRE_FORMATS = ("auto", "json")
+    BROADCAST = '255.255.255.255'
+    HEARTBEAT_INTERVAL = 5 # Seconds between announcements
+    PEER_TIMEOUT = 15 # Seconds of silence before a peer counts as offline
+    TOPIC_GROUPS = "239.255" # Administratively scoped multicast prefix for topic groups
+
+    def __init__(self, port=5005, node_name="Unnamed-Robot", host="", wire="auto",
+                 inbox_size=1024, inbox_policy="drop_oldest", topic_port=None):
+        if wire not in self.WIRE_FORMATS:
+            raise ValueError(f"Unknown wire format '{wire}' (use one of {self.WIRE_FORMATS})")
         self.port = port
+        self.host = host # Address to listen/send on; "" = all interfaces
         self.node_name = node_name
         self.node_id = f"{node_name}-{socket.gethostname()}"
+        self.node_hash = BinaryCodec.node_hash(self.node_id)
+        self.wire = wire
+        self.seq = itertools.count()
         self.running = False
-        self.peers = {}  # { 'ip': {'name': name, 'last_seen': time} }
-        self.inbox = []
+        # Keyed by node-id hash (all a binary packet carries), with an expiry heap
+        self.peers = PeerTable(timeout=self.PEER_TIMEOUT)
+        self.inbox = RingInbox(inbox_size, inbox_policy) # Bounded, indexed by sender address
+        self.buffers = BufferPool(count=2, size=2048) # Reused by recvfrom_into()
+        self.printer = BackgroundPrinter() # Per-message logging stays off the receive path
         self.subscriptions = set()
+        self.topics = {} # { topic hash: topic } for what we subscribed to
+        self.topic_port = topic_port or port + 1
+        self.topic_sock = None # Opened by the first subscribe()
         self.lock = threading.Lock()
+        self.bad_packets = 0 # Datagrams that could not be parsed
+        self.filtered = 0 # Topic messages dropped by the header check
+        self.sender = self._make_sender()
+        self.reliable = ReliableChannel(self._transmit, self._deliver_reliable)
+
+    def _make_sender(self):
+        # One long-lived socket; bursts per address share a datagram
+        sender = DatagramSender(bind=(self.host, 0) if self.host else None)
+        if self.host:
+            # Multicast leaves through the interface we live on, not the default route
+            sender.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(self.host))
+        return sender
 
     def log(self, message):
         print(f"[{datetime.now().strftime('%H:%M:%S')}] [RoboAir] {message}")
@@ -28,74 +86,154 @@ class RoboAir:
         try:
             self.server_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            self.server_sock.bind(("", self.port))
+            self.server_sock.bind((self.host, self.port))
             
             # Threads for listening and housekeeping
             threading.Thread(target=self._listen, daemon=True).start()
             threading.Thread(target=self._heartbeat_loop, daemon=True).start()
             threading.Thread(target=self._cleanup_peers, daemon=True).start()
+            threading.Thread(target=self._retransmit_loop, daemon=True).start()
+            for topic in list(self.subscriptions):
+                self._join(topic)
             
             self.log(f"Node '{self.node_id}' is ONLINE on port {self.port}")
         except Exception as e:
             self.log(f"Failed to start: {e}")
 
-    def _listen(self):
-        """Internal receiver with protocol parsing."""
+    def _listen(self, sock=None):
+        """Internal receiver with protocol parsing (unicast/broadcast socket, or the topic socket)."""
+        sock = sock or self.server_sock
+        buf = self.buffers.acquire() # Every datagram is decoded before the next recv, so one is enough
+        view = memoryview(buf)
         while self.running:
             try:
-                data, addr = self.server_sock.recvfrom(2048)
-                payload = json.loads(data.decode('utf-8'))
-                sender_ip = addr[0]
-
-                if payload.get("id") == self.node_id:
-                    continue # Ignore own broadcasts
-
-                with self.lock:
-                    # Update Peer List
-                    self.peers[sender_ip] = {
-                        "name": payload.get("name"),
-                        "last_seen": time.time()
-                    }
-                    
-                    # Process Message
-                    if payload["type"] == "chat":
-                        self.inbox.append({
-                            "from": payload["name"],
-                            "ip": sender_ip,
-                            "msg": payload["data"],
-                            "time": datetime.now().strftime("%H:%M")
-                        })
-                        self.log(f"Message from {payload['name']}: {payload['data']}")
+                size, addr = sock.recvfrom_into(buf)
             except Exception:
-                pass
+                continue
+            for raw in DatagramSender.unpack(view[:size]):
+                self._handle(raw, addr)
+        self.buffers.release(buf)
+
+    def _handle(self, raw, addr):
+        """Processes one message (a datagram may carry several)."""
+        try:
+            if ReliableChannel.is_reliable(raw):
+                self.reliable.datagram_received(self._sender_address(addr), raw)
+                return
+            if BinaryCodec.is_binary(raw):
+                topic_hash = BinaryCodec.topic_of(raw)
+                if topic_hash is not None and topic_hash not in self.topics:
+                    self.filtered += 1
+                    return # Someone else's topic sharing our group: skip before decoding
+                payload = BinaryCodec.decode(raw)
+                if payload is None or payload["hash"] == self.node_hash:
+                    return # Unknown version, or our own broadcast
+                peer_key, node_id = payload["hash"], None
+                peer_format = "binary"
+            else:
+                payload = json.loads(str(raw, 'utf-8'))
+                node_id = payload.get("id")
+                if node_id == self.node_id:
+                    return # Ignore own broadcasts
+                peer_key = BinaryCodec.node_hash(node_id or f"{payload.get('name')}@{addr[0]}")
+                peer_format = "binary" if payload.get("fmt", 0) >= BinaryCodec.VERSION else "json"
+            sender_ip = self._sender_address(addr)
+
+            # Update Peer List (in place for known peers)
+            _, is_new = self.peers.touch(peer_key, payload.get("name"), sender_ip, peer_format,
+                                         time.time(), node_id)
+            if is_new and self.running:
+                self.announce(sender_ip) # Introduce ourselves now rather than at the next heartbeat
+
+            # Process Message
+            if payload["type"] == "chat":
+                self._deliver({
+                    "from": payload["name"],
+                    "ip": sender_ip,
+                    "msg": payload["data"],
+                    "time": datetime.now().strftime("%H:%M")
+                })
+            elif payload["type"] == "publish":
+                self._deliver({
+                    "from": payload["name"],
+                    "ip": sender_ip,
+                    "msg": payload["data"],
+                    "time": datetime.now().strftime("%H:%M"),
+                    "topic": self.topics[payload["topic"]]
+                })
+        except Exception:
+            self.bad_packets += 1
+
+    def _sender_address(self, addr):
+        """How a sender's address is written (and accepted back as target_ip)."""
+        return addr[0]
+
+    def _address(self, target_ip):
+        return (target_ip, self.port)
+
+    def _deliver(self, message):
+        self.inbox.push(message["ip"], message)
+        if message.get("reliable"):
+            self.printer.print("[{}] [RoboAir] {} bytes from {} (reliable)",
+                               message["time"], len(message["msg"]), message["from"])
+        elif "topic" in message:
+            self.printer.print("[{}] [RoboAir] [{}] {}: {}",
+                               message["time"], message["topic"], message["from"], message["msg"])
+        else:
+            self.printer.print("[{}] [RoboAir] Message from {}: {}",
+                               message["time"], message["from"], message["msg"])
+
+    def _deliver_reliable(self, sender_ip, data):
+        peer = self.peers.by_address(sender_ip)
+        self._deliver({
+            "from": peer.name if peer is not None else sender_ip,
+            "ip": sender_ip,
+            "msg": data,
+            "time": datetime.now().strftime("%H:%M"),
+            "reliable": True
+        })
+
+    def get_inbox(self, sender_ip=None, match=None):
+        """Removes and returns waiting chats (optionally only from sender_ip, or those match() accepts)."""
+        return self.inbox.drain(match, sender_ip)
 
     def _heartbeat_loop(self):
         """Announce presence to the network periodically."""
         while self.running:
             self.announce()
-            time.sleep(5)
+            time.sleep(self.HEARTBEAT_INTERVAL)
+
+    def _expire_peers(self, now):
+        """Drops peers silent for PEER_TIMEOUT seconds; returns seconds until the next could expire."""
+        for peer in self.peers.expire(now):
+            self.reliable.forget(peer.address)
+            self.log(f"Robot at {peer.address} ({peer.name}) went OFFLINE.")
+        deadline = self.peers.next_deadline()
+        return self.PEER_TIMEOUT if deadline is None else max(deadline - now, 0.05)
 
     def _cleanup_peers(self):
-        """Remove robots that haven't responded for 15 seconds."""
+        """Remove robots the moment they have been silent for PEER_TIMEOUT seconds."""
+        while self.running:
+            # New peers always expire after the current heap head, so sleeping until it is safe
+            time.sleep(self._expire_peers(time.time()))
+
+    def _retransmit_loop(self):
+        """Resends unacknowledged reliable fragments once their RTO runs out."""
+        wakeup = self.reliable.wakeup
         while self.running:
-            now = time.time()
-            with self.lock:
-                expired = [ip for ip, info in self.peers.items() if now - info['last_seen'] > 15]
-                for ip in expired:
-                    self.log(f"Robot at {ip} ({self.peers[ip]['name']}) went OFFLINE.")
-                    del self.peers[ip]
-            time.sleep(5)
-
-    def announce(self):
-        """Broadcast presence to all peers."""
+            wakeup.clear()
+            wakeup.wait(self.reliable.tick()) # send_reliable() sets it to re-arm sooner
+
+    def announce(self, target_ip=BROADCAST):
+        """Broadcast presence to all peers (or tell one peer directly)."""
         packet = {
             "id": self.node_id,
             "name": self.node_name,
             "type": "heartbeat"
         }
-        self._send_raw(packet, '255.255.255.255')
+        self._send_raw(packet, target_ip)
 
-    def send_message(self, message, target_ip='255.255.255.255'):
+    def send_message(self, message, target_ip=BROADCAST):
         """Send a text message to a specific IP or broadcast to all."""
         packet = {
             "id": self.node_id,
@@ -105,23 +243,333 @@ class RoboAir:
         }
         return self._send_raw(packet, target_ip)
 
+    def send_reliable(self, data, target_ip):
+        """
+        Acknowledged, ordered delivery of data (bytes or str, any size) to one
+        binary peer. Returns a Transfer (transfer.wait(timeout) -> delivered?),
+        or None if target_ip is the broadcast address or not a binary peer.
+        """
+        if target_ip == self.BROADCAST or self.peer_format(target_ip) != "binary":
+            self.log(f"Reliable send needs a known binary peer, not {target_ip}")
+            return None
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        return self.reliable.send(target_ip, data)
+
+    # --- Topics ---
+    @classmethod
+    def topic_group(cls, topic):
+        """Multicast group carrying topic (several topics may share one)."""
+        h = BinaryCodec.node_hash(topic)
+        return f"{cls.TOPIC_GROUPS}.{(h >> 8) & 255}.{h & 255}"
+
+    def subscribe(self, topic):
+        """Starts receiving messages published on topic."""
+        with self.lock:
+            if topic in self.subscriptions:
+                return
+            self.subscriptions.add(topic)
+            self.topics[BinaryCodec.node_hash(topic)] = topic
+        if self.running:
+            self._join(topic)
+
+    def unsubscribe(self, topic):
+        with self.lock:
+            if topic not in self.subscriptions:
+                return
+            self.subscriptions.discard(topic)
+            self.topics.pop(BinaryCodec.node_hash(topic), None)
+            group = self.topic_group(topic)
+            shared = any(self.topic_group(other) == group for other in self.subscriptions)
+        if not shared and self.topic_sock is not None:
+            try:
+                self.topic_sock.setsockopt(socket.IPPROTO_IP, socket.IP_DROP_MEMBERSHIP, self._membership(group))
+            except OSError:
+                pass
+
+    def _membership(self, group):
+        return socket.inet_aton(group) + socket.inet_aton(self.host or "0.0.0.0")
+
+    def _topic_socket(self):
+        """Socket on topic_port that hears only the groups it joins."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1) # Other nodes on this host share the port
+        if hasattr(socket, "SO_REUSEPORT"):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        if sys.platform.startswith("linux"):
+            # Only groups this socket joined, not every group joined on the host
+            sock.setsockopt(socket.IPPROTO_IP, getattr(socket, "IP_MULTICAST_ALL", 49), 0)
+        sock.bind(("", self.topic_port))
+        return sock
+
+    def _listen_topics(self, sock):
+        threading.Thread(target=self._listen, args=(sock,), daemon=True).start()
+
+    def _join(self, topic):
+        try:
+            if self.topic_sock is None:
+                self.topic_sock = self._topic_socket()
+                self._listen_topics(self.topic_sock)
+            self.topic_sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP,
+                                       self._membership(self.topic_group(topic)))
+        except OSError as e:
+            if e.errno != errno.EADDRINUSE: # Group already joined for another topic
+                self.log(f"Cannot subscribe to '{topic}': {e}")
+
+    def publish(self, topic, message):
+        """Sends a text message to every subscriber of topic."""
+        try:
+            data = BinaryCodec.encode("publish", self.node_hash, next(self.seq), self.node_name,
+                                      message, BinaryCodec.node_hash(topic))
+            return self._send_topic(data, (self.topic_group(topic), self.topic_port))
+        except Exception as e:
+            self.log(f"Publish error: {e}")
+            return False
+
+    def _send_topic(self, data, group):
+        # Only topic-aware (binary) nodes join groups, so batching is safe
+        return self.sender.send(data, group, batch=True)
+
+    def peer_format(self, target_ip):
+        """Wire format to use towards target_ip ('binary' or 'json')."""
+        if self.wire == "json":
+            return "json"
+        if target_ip == self.BROADCAST:
+            # Everyone hears a broadcast: binary only if nobody would be left out
+            binary = self.peers.all_binary()
+        else:
+            peer = self.peers.by_address(target_ip)
+            binary = peer is not None and peer.format == "binary"
+        return "binary" if binary else "json"
+
+    def _encode(self, packet, target_ip):
+        """(bytes, binary?) for packet in the format negotiated with target_ip."""
+        if self.peer_format(target_ip) == "binary":
+            return BinaryCodec.encode(packet["type"], self.node_hash, next(self.seq),
+                                      packet["name"], packet.get("data", "")), True
+        if self.wire == "auto":
+            packet["fmt"] = BinaryCodec.VERSION # Advertise that we speak binary
+        return json.dumps(packet).encode('utf-8'), False
+
     def _send_raw(self, packet, target_ip):
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
-                s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-                s.sendto(json.dumps(packet).encode('utf-8'), (target_ip, self.port))
-            return True
+            data, binary = self._encode(packet, target_ip)
+            # Only peers that negotiated binary are known to unpack batched datagrams
+            return self.sender.send(data, self._address(target_ip), batch=binary)
         except Exception as e:
             self.log(f"Send error: {e}")
             return False
 
+    def _transmit(self, peer, data):
+        """Raw datagram for the reliable channel (peers using it always unpack batches)."""
+        self.sender.send(data, self._address(peer), batch=True)
+
     def get_peers(self):
         """Returns list of currently active robots in the network."""
-        with self.lock:
-            return list(self.peers.values())
+        return [peer.as_dict() for peer in self.peers.values()]
+
+    def stop(self):
+        self.running = False
+        self.reliable.wakeup.set()
+        if self.topic_sock is not None:
+            try:
+                self.topic_sock.shutdown(socket.SHUT_RD) # Wakes its listener, which then sees running is False
+            except OSError:
+                pass
+            self.topic_sock.close()
+            self.topic_sock = None
+        self.sender.close()
+        self.printer.close()
+        self.log("Node shutting down...")
+
+class _AirProtocol(asyncio.DatagramProtocol):
+    def __init__(self, node):
+        self.node = node
+
+    def datagram_received(self, data, addr):
+        for raw in DatagramSender.unpack(data):
+            self.node._handle(raw, addr)
+
+    def error_received(self, exc):
+        self.node.log(f"Socket error: {exc}")
+
+
+class AsyncRoboAir(RoboAir):
+    """
+    AsyncRoboAir v1.0 - Event-Loop RoboAir Node.
+    Same protocol as RoboAir, but receive, heartbeat and peer expiry share
+    one asyncio loop instead of three threads, so one process can host
+    hundreds of virtual nodes (one port each) for swarm simulations.
+    Incoming chats go to an awaitable inbox: when it is full the node
+    stops reading its socket until the consumer catches up.
+
+    Peer addresses are written "ip:port", and target_ip accepts that form too.
+    broadcast_to replaces the 255.255.255.255 broadcast with a list of
+    (ip, port) addresses, which is how virtual nodes on one box reach
+    each other. Call announce()/send_message()/send_reliable() from the
+    loop's thread; Transfer.add_done_callback() reports delivery there too.
+    The same goes for subscribe()/unsubscribe()/publish(): the topic socket
+    is a second endpoint on the loop.
+    """
+    def __init__(self, port=5005, node_name="Unnamed-Robot", host="", wire="auto",
+                 inbox_size=256, broadcast_to=None):
+        super().__init__(port, node_name, host, wire)
+        self.inbox_size = inbox_size
+        self.broadcast_to = broadcast_to
+        self.messages = None # asyncio.Queue, created on the node's loop by start()
+        self.transport = None
+        self.topic_transport = None # Endpoint for topic_sock once the first subscription opens it
+        self.loop = None
+        self.paused = False
+        self.inbox_dropped = 0 # Chats lost because a batch overflowed a full inbox
+        self.outgoing = {} # { (addr, batchable): [bytes, ...] } until the next flush
+        self.tasks = []
+
+    def _make_sender(self):
+        return None # Sends go through the loop's transport
+
+    async def start(self):
+        """Binds the socket and starts the heartbeat and expiry timers."""
+        self.loop = asyncio.get_running_loop()
+        self.messages = asyncio.Queue(self.inbox_size)
+        self.transport, _ = await self.loop.create_datagram_endpoint(
+            lambda: _AirProtocol(self), local_addr=(self.host or "0.0.0.0", self.port), allow_broadcast=True)
+        if self.host:
+            # Topic multicast leaves through the interface we live on, not the default route
+            self.transport.get_extra_info("socket").setsockopt(
+                socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(self.host))
+        self.running = True
+        self.reliable.wakeup = asyncio.Event() # Only ever set from the loop's thread
+        self.tasks = [asyncio.ensure_future(self._heartbeats()), asyncio.ensure_future(self._expiry()),
+                      asyncio.ensure_future(self._retransmits())]
+        for topic in list(self.subscriptions):
+            self._join(topic)
+        self.log(f"Node '{self.node_id}' is ONLINE on port {self.port}")
+
+    async def _heartbeats(self):
+        while self.running:
+            self.announce()
+            await asyncio.sleep(self.HEARTBEAT_INTERVAL)
+
+    async def _expiry(self):
+        """Sleeps until the stalest peer could time out, instead of polling."""
+        while self.running:
+            await asyncio.sleep(self._expire_peers(time.time()))
+
+    async def _retransmits(self):
+        wakeup = self.reliable.wakeup
+        while self.running:
+            wakeup.clear()
+            try:
+                await asyncio.wait_for(wakeup.wait(), self.reliable.tick())
+            except asyncio.TimeoutError:
+                pass
+
+    # --- Addressing ---
+    def _sender_address(self, addr):
+        return f"{addr[0]}:{addr[1]}"
+
+    def _address(self, target_ip):
+        if isinstance(target_ip, tuple):
+            return target_ip
+        host, _, port = target_ip.partition(":")
+        return (host, int(port) if port else self.port)
+
+    # --- Sending: queued, flushed once per loop iteration ---
+    def _send_raw(self, packet, target_ip):
+        if self.transport is None:
+            return False
+        try:
+            data, binary = self._encode(packet, target_ip)
+            if target_ip == self.BROADCAST and self.broadcast_to is not None:
+                own = (self.host or "0.0.0.0", self.port)
+                for addr in self.broadcast_to:
+                    if addr != own:
+                        self._queue(data, addr, binary)
+            else:
+                self._queue(data, self._address(target_ip), binary)
+            return True
+        except Exception as e:
+            self.log(f"Send error: {e}")
+            return False
+
+    def _transmit(self, peer, data):
+        if self.transport is not None:
+            self._queue(data, self._address(peer), True)
+
+    def _queue(self, data, addr, batch):
+        if not self.outgoing:
+            self.loop.call_soon(self._flush)
+        self.outgoing.setdefault((addr, batch), []).append(data)
+
+    def _flush(self):
+        outgoing, self.outgoing = self.outgoing, {}
+        if self.transport is None:
+            return
+        for (addr, batch), messages in outgoing.items():
+            for datagram in DatagramSender.pack(messages) if batch else messages:
+                self.transport.sendto(datagram, addr)
+
+    # --- Topics: the group socket is read by the loop too ---
+    def _listen_topics(self, sock):
+        self.tasks.append(asyncio.ensure_future(self._open_topics(sock)))
+
+    async def _open_topics(self, sock):
+        self.topic_transport, _ = await self.loop.create_datagram_endpoint(lambda: _AirProtocol(self), sock=sock)
+        if self.paused:
+            self.topic_transport.pause_reading()
+
+    def _send_topic(self, data, group):
+        if self.transport is None:
+            return False
+        self._queue(data, group, True)
+        return True
+
+    # --- Inbox with backpressure ---
+    def _reading(self, on):
+        for transport in (self.transport, self.topic_transport):
+            if transport is not None:
+                if on:
+                    transport.resume_reading()
+                else:
+                    transport.pause_reading()
+
+    def _deliver(self, message):
+        try:
+            self.messages.put_nowait(message)
+        except asyncio.QueueFull:
+            self.inbox_dropped += 1
+            return
+        if self.messages.full() and not self.paused:
+            self._reading(False) # Let the kernel buffer (and then the sender) absorb it
+            self.paused = True
+
+    async def receive(self, timeout=None):
+        """Next chat message ({"from", "ip", "msg", "time"}); None on timeout."""
+        try:
+            message = await asyncio.wait_for(self.messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if self.paused and self.messages.qsize() <= self.inbox_size // 2:
+            self.paused = False
+            self._reading(True)
+        return message
 
     def stop(self):
         self.running = False
+        for task in self.tasks:
+            task.cancel()
+        self.tasks = []
+        if self.topic_transport is not None:
+            self.topic_transport.close() # Closes topic_sock with it
+            self.topic_transport = None
+        elif self.topic_sock is not None:
+            self.topic_sock.close()
+        self.topic_sock = None
+        if self.transport is not None:
+            self._flush()
+            self.transport.close()
+            self.transport = None
         self.log("Node shutting down...")
 
 # --- Scenario: Swarm Coordination ---
@@ -146,8 +594,7 @@ if __name__ == "__main__":
                 msg = input("Enter message: ")
                 robot.send_message(msg)
             elif choice == "3":
-                print(f"Inbox: {robot.inbox}")
-                robot.inbox = []
+                print(f"Inbox: {robot.get_inbox()}")
             elif choice == "4":
                 break
     except KeyboardInterrupt:
@@ -2,22 +2,36 @@ import serial
 import serial.tools.list_ports
 import threading
 import time
+from collections import deque
 from datetime import datetime
+from link_framer import FrameDecoder
 
 class RoboLink:
     """
-    RoboLink v1.5 - Ultra Smart Serial Bridge.
+    RoboLink v1.6 - Ultra Smart Serial Bridge.
     Features: Auto-Discovery, Auto-Reconnect, and Non-blocking I/O.
     Designed for independent robotics development.
+
+    The reader drains whatever the device has sent into one reusable
+    buffer and splits it with FrameDecoder: newline-terminated text
+    (get_latest()) and CRC-checked binary frames (get_frames(),
+    send_frame()) can share the link. Reading and writing take separate
+    locks, so send() never waits for the device to talk.
     """
-    def __init__(self, port=None, baudrate=115200, timeout=1):
+    def __init__(self, port=None, baudrate=115200, timeout=1, max_frames=1024):
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
         self.connection = None
         self.running = False
+        self.thread = None
         self.last_message = ""
-        self.lock = threading.Lock()
+        self.frames = deque(maxlen=max_frames) # Binary payloads, oldest dropped first
+        self.on_line = None  # Optional callbacks, run on the reader thread
+        self.on_frame = None
+        self.decoder = FrameDecoder()
+        self.read_lock = threading.Lock()  # Guards what the reader publishes
+        self.write_lock = threading.Lock() # Keeps concurrent writes from interleaving
 
     def log(self, message):
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -41,10 +55,12 @@ class RoboLink:
 
         try:
             self.connection = serial.Serial(self.port, self.baudrate, timeout=self.timeout)
+            self.decoder = FrameDecoder() # A half-received frame from a previous link is garbage
             self.running = True
-            # Listening thread
-            self.thread = threading.Thread(target=self._listen, daemon=True)
-            self.thread.start()
+            # Listening thread (a reconnect from inside it keeps the same one)
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._listen, daemon=True)
+                self.thread.start()
             self.log(f"Connected to {self.port} at {self.baudrate} baud.")
             return True
         except Exception as e:
@@ -54,28 +70,56 @@ class RoboLink:
     def _listen(self):
         """Continuous background listener with auto-reconnect."""
         while self.running:
+            connection = self.connection
             try:
-                if self.connection and self.connection.is_open:
-                    if self.connection.in_waiting > 0:
-                        with self.lock:
-                            line = self.connection.readline().decode('utf-8', errors='ignore').rstrip()
-                            if line:
-                                self.last_message = line
+                if connection and connection.is_open:
+                    # Block (up to timeout) for one byte, or take everything already waiting
+                    space = self.decoder.writable()
+                    count = connection.readinto(space[:max(1, min(connection.in_waiting, len(space)))])
+                    if count:
+                        self._dispatch(self.decoder.commit(count))
                 else:
                     self.log("Connection lost. Retrying in 3s...")
                     time.sleep(3)
                     self.connect()
-            except Exception:
+            except Exception as e:
+                if not self.running:
+                    break
+                self.log(f"Read error: {e}")
+                try:
+                    connection.close() # Unplugged: let the next pass reconnect
+                except Exception:
+                    pass
                 time.sleep(1)
-            time.sleep(0.01)
+
+    def _dispatch(self, frames):
+        with self.read_lock:
+            for kind, data in frames:
+                if kind == "line":
+                    self.last_message = data
+                else:
+                    self.frames.append(data)
+        for kind, data in frames:
+            callback = self.on_line if kind == "line" else self.on_frame
+            if callback:
+                try:
+                    callback(data)
+                except Exception as e:
+                    self.log(f"Callback error: {e}")
 
     def send(self, command):
         """Send data safely."""
+        return self._write((str(command) + '\n').encode('utf-8'))
+
+    def send_frame(self, payload):
+        """Send bytes as one CRC-checked binary frame."""
+        return self._write(FrameDecoder.encode(bytes(payload)))
+
+    def _write(self, data):
         if self.connection and self.connection.is_open:
             try:
-                with self.lock:
-                    full_command = (str(command) + '\n').encode('utf-8')
-                    self.connection.write(full_command)
+                with self.write_lock:
+                    self.connection.write(data)
                 return True
             except Exception as e:
                 self.log(f"Send error: {e}")
@@ -83,9 +127,16 @@ class RoboLink:
 
     def get_latest(self):
         """Fetch latest sensor data from hardware."""
-        with self.lock:
+        with self.read_lock:
             return self.last_message
 
+    def get_frames(self):
+        """Removes and returns the binary frames received so far, oldest first."""
+        with self.read_lock:
+            frames = list(self.frames)
+            self.frames.clear()
+        return frames
+
     def disconnect(self):
         self.running = False
         if self.connection: